@@ -0,0 +1,272 @@
+"""
+渲染基准测试 - 在 SDL dummy 视频驱动下按脚本场景驱动渲染器，统计帧率和各绘制调用耗时，并与基线对比
+
+场景:
+    empty_board   空棋盘（初始 10 列）
+    full_board    扩展到 20 列并填满 20 行的棋盘
+    tetris_burst  持续 TETRIS 消行，粒子保持在上限附近
+    text_storm    连击、升级浮动文字同时出现（文字数量保持在上限）
+
+每个场景运行 --repeats 次，取各项的中位数；与基线对比时检查帧时间中位数，
+以及平均耗时不低于 MIN_SCOPE_MS 的单项调用（更小的调用受计时噪声影响太大）。
+
+基线保存的是绝对耗时，只对生成它的机器有效：CI 机器首次运行时须先用 --save-baseline
+在本机生成基线（例如缓存到该 CI 机器），之后的运行再与之对比；仓库中的基线仅供开发机参考。
+
+用法:
+    python benchmarks/render_bench.py
+    python benchmarks/render_bench.py --scenario tetris_burst --frames 600
+    python benchmarks/render_bench.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from tetris.config import GameConfig, NEON_COLORS
+from tetris.effects import create_star_field
+from tetris.player import Player
+from tetris.rendering import Renderer
+from tetris.utils import FrameProfiler
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'render_baseline.json')
+
+# 参与基线对比的单项耗时下限（毫秒），更小的项受计时噪声影响太大
+MIN_SCOPE_MS = 0.5
+
+BLOCK_TYPES = list(NEON_COLORS)
+
+
+class Bench:
+    """一个场景的运行环境：玩家（引擎 + 特效）、渲染器和星空，按 60 FPS 步长推进"""
+
+    def __init__(self, seed: int):
+        random.seed(seed)
+        # 帧预算设为极大值，避免特效预算在测试过程中降级
+        self.config = GameConfig(seed=seed, randomizer='bag7', frame_budget_ms=1e9)
+        self.screen = pygame.display.set_mode((self.config.screen_width, self.config.screen_height))
+        self.renderer = Renderer(self.screen, self.config)
+        self.player = Player("bench", self.config)
+        self.renderer.attach_engine(self.player.engine)
+        self.stars = create_star_field(self.config.screen_width, self.config.screen_height)
+
+    def resize(self) -> None:
+        """棋盘扩展后按新尺寸重建窗口"""
+        self.screen = pygame.display.set_mode((self.config.screen_width, self.config.screen_height))
+        self.renderer.screen = self.screen
+        self.renderer.update_config(self.config)
+        self.stars.resize(self.config.screen_width, self.config.screen_height)
+        self.player.effects.build_edge_glow()
+
+    def instrument(self, profiler: FrameProfiler) -> None:
+        """登记要计时的绘制调用"""
+        renderer = self.renderer
+        profiler.instrument(renderer, [name for name in dir(Renderer) if name.startswith('draw_')] + ['present'], 'renderer.')
+        profiler.instrument(renderer.block_renderer, ['draw_neon_blocks', 'draw_ghost_block'], 'block.')
+        profiler.instrument(
+            self.player.effects,
+            ['update', 'draw_effects', 'draw_particles', 'draw_floating_texts', 'draw_level_up_effects'],
+            'effects.'
+        )
+
+    def frame(self, dt: float = 1 / 60) -> None:
+        """推进特效并绘制一帧（与 GameRunner 的游戏画面相同的绘制顺序）"""
+        renderer, player = self.renderer, self.player
+        renderer.update(dt)
+        player.update_effects(dt)
+
+        renderer.draw_background(self.stars)
+        renderer.draw_divider()
+        renderer.draw_panel(0, player.get_score(), player.get_lines(), player.get_level(), player.effects.level_up_effect)
+        player.render(renderer)
+        renderer.present()
+
+
+# ==================== 场景 ====================
+
+def scenario_empty_board(bench: Bench) -> Callable[[int], None]:
+    """空棋盘：只有当前方块、幽灵方块和面板"""
+    return lambda frame: None
+
+
+def scenario_full_board(bench: Bench) -> Callable[[int], None]:
+    """扩展到 20 列，20 行可见区域全部填满（每行留一个空位，不会消行）"""
+    board = bench.player.engine.board
+    for width in range(board.width + 1, 21):
+        board.expand_width(width)
+    for y in range(2, board.height + 2):
+        for x in range(board.width):
+            if x != y % board.width:
+                board.set_cell(x, y, BLOCK_TYPES[(x + y) % len(BLOCK_TYPES)])
+    bench.resize()
+    return lambda frame: None
+
+
+def scenario_tetris_burst(bench: Bench) -> Callable[[int], None]:
+    """每 6 帧一次 TETRIS（底部 4 行消除特效），粒子数维持在上限附近"""
+    player = bench.player
+    rows = [player.engine.board.height - 2 + i for i in range(4)]
+
+    def script(frame: int) -> None:
+        if frame % 6 == 0:
+            player._on_lines_cleared(4, rows)
+    return script
+
+
+def scenario_text_storm(bench: Bench) -> Callable[[int], None]:
+    """每 8 帧同时出现连击和升级（浮动文字数量保持在上限）"""
+    player = bench.player
+    combo = [1]
+
+    def script(frame: int) -> None:
+        if frame % 8 == 0:
+            combo[0] = combo[0] % 9 + 2
+            player._on_combo(combo[0])
+            player._on_level_up(player.get_level() + 1)
+    return script
+
+
+SCENARIOS: Dict[str, Callable[[Bench], Callable[[int], None]]] = {
+    'empty_board': scenario_empty_board,
+    'full_board': scenario_full_board,
+    'tetris_burst': scenario_tetris_burst,
+    'text_storm': scenario_text_storm,
+}
+
+
+# ==================== 运行与对比 ====================
+
+def run_scenario(name: str, frames: int, warmup: int, seed: int) -> dict:
+    """运行一个场景，返回帧率、帧时间百分位数和各调用的平均耗时（毫秒）"""
+    bench = Bench(seed)
+    script = SCENARIOS[name](bench)
+    for frame in range(warmup):
+        script(frame)
+        bench.frame()
+
+    profiler = FrameProfiler(window=frames, enabled=True)
+    bench.instrument(profiler)
+    start = time.perf_counter()
+    for frame in range(warmup, warmup + frames):
+        profiler.begin_frame()
+        script(frame)
+        bench.frame()
+        profiler.end_frame()
+    elapsed = time.perf_counter() - start
+
+    summary = profiler.summary()
+    frame_stats = summary.pop('frame')
+    return {
+        'fps': frames / elapsed,
+        'frame_p50_ms': frame_stats['p50_ms'],
+        'frame_p95_ms': frame_stats['p95_ms'],
+        'frame_p99_ms': frame_stats['p99_ms'],
+        'particles': len(bench.player.effects.particles),
+        'floating_texts': len(bench.player.effects.floating_texts),
+        'calls': {scope: stats['mean_ms'] for scope, stats in summary.items()},
+    }
+
+
+def median_result(runs: List[dict]) -> dict:
+    """多次运行结果逐项取中位数（只在部分运行中出现的调用按出现的次数取中位数）"""
+    result = {key: statistics.median(run[key] for run in runs) for key in runs[0] if key != 'calls'}
+    scopes = {scope for run in runs for scope in run['calls']}
+    result['calls'] = {
+        scope: statistics.median(run['calls'][scope] for run in runs if scope in run['calls'])
+        for scope in sorted(scopes)
+    }
+    return result
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """与基线对比，返回超出容差的项（帧时间中位数和较大的单项平均耗时）"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        checks: List[Tuple[str, float, float]] = [('frame_p50_ms', result['frame_p50_ms'], base['frame_p50_ms'])]
+        checks += [
+            (scope, value, base['calls'][scope])
+            for scope, value in result['calls'].items()
+            if base['calls'].get(scope, 0) >= MIN_SCOPE_MS
+        ]
+        for label, value, reference in checks:
+            if value > reference * (1 + tolerance):
+                regressions.append(f"{name}: {label} {value:.3f} ms > 基线 {reference:.3f} ms (+{value / reference - 1:.0%})")
+    return regressions
+
+
+def print_result(name: str, result: dict, top: int) -> None:
+    print(f"\n[{name}]  {result['fps']:.1f} FPS  帧时间 p50 {result['frame_p50_ms']:.2f} / "
+          f"p95 {result['frame_p95_ms']:.2f} / p99 {result['frame_p99_ms']:.2f} ms  "
+          f"粒子 {result['particles']}  文字 {result['floating_texts']}")
+    calls = sorted(result['calls'].items(), key=lambda item: item[1], reverse=True)
+    for scope, ms in calls[:top]:
+        print(f"    {scope:<34}{ms:>9.3f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="渲染基准测试")
+    parser.add_argument('--scenario', choices=list(SCENARIOS), action='append', help="只运行指定场景（可重复）")
+    parser.add_argument('--frames', type=int, default=300, help="每个场景计时的帧数")
+    parser.add_argument('--warmup', type=int, default=60, help="计时前预热的帧数")
+    parser.add_argument('--repeats', type=int, default=3, help="每个场景重复运行的次数（结果取中位数）")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--top', type=int, default=12, help="每个场景显示的调用数")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="基线 JSON 文件")
+    parser.add_argument('--save-baseline', action='store_true', help="把本次结果写入基线文件")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="超出基线该比例视为退化")
+    parser.add_argument('--output', help="另存本次结果为 JSON")
+    args = parser.parse_args()
+
+    pygame.init()
+    results = {}
+    for name in args.scenario or list(SCENARIOS):
+        runs = [run_scenario(name, args.frames, args.warmup, args.seed) for _ in range(max(1, args.repeats))]
+        results[name] = median_result(runs)
+        print_result(name, results[name], args.top)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"\n基线已写入 {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("\n没有基线文件（用 --save-baseline 生成）")
+        return
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n性能退化（容差 {args.tolerance:.0%}）:")
+        for line in regressions:
+            print(f"    {line}")
+        sys.exit(1)
+    print(f"\n与基线相比无退化（容差 {args.tolerance:.0%}）")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+快照基准测试 - 对比字典快照与二进制快照的体积和编解码耗时
+
+用法:
+    python benchmarks/snapshot_bench.py
+    python benchmarks/snapshot_bench.py --board-engine bitboard --iterations 2000
+"""
+
+import argparse
+import json
+import os
+import pickle
+import random
+import sys
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tetris.config import GameConfig
+from tetris.core import Action, GameEngine
+
+
+def build_engine(board_engine: str, seed: int, frames: int) -> GameEngine:
+    """用固定种子和简单输入推进一段时间，得到有内容的棋盘"""
+    engine = GameEngine(GameConfig(board_engine=board_engine, seed=seed, randomizer='bag7'), headless=True)
+    rng = random.Random(seed)
+    moves = [Action.LEFT, Action.RIGHT, Action.ROTATE, Action.DOWN, Action.NONE]
+    for frame in range(frames):
+        action = Action.HARD_DROP if frame % 12 == 11 else rng.choice(moves)
+        if not engine.step(action):
+            break
+    return engine
+
+
+def measure(func, iterations: int) -> float:
+    """返回单次调用的平均耗时（微秒）"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="快照基准测试")
+    parser.add_argument('--board-engine', choices=['grid', 'bitboard'], default='grid', help="棋盘实现")
+    parser.add_argument('--seed', type=int, default=1, help="随机种子")
+    parser.add_argument('--frames', type=int, default=1200, help="生成快照前推进的帧数")
+    parser.add_argument('--iterations', type=int, default=1000, help="每项测试的重复次数")
+    args = parser.parse_args()
+
+    engine = build_engine(args.board_engine, args.seed, args.frames)
+    target = GameEngine(GameConfig(board_engine=args.board_engine), headless=True)
+
+    state = engine.get_state_data()
+    json_data = json.dumps(state)
+    pickle_data = pickle.dumps(state)
+    binary_data = engine.to_bytes()
+    board_data = engine.board.to_bytes()
+
+    rows = [
+        ('dict + json', len(json_data.encode('utf-8')),
+         measure(lambda: json.dumps(engine.get_state_data()), args.iterations),
+         measure(lambda: target.restore_state(json.loads(json_data)), args.iterations)),
+        ('dict + pickle', len(pickle_data),
+         measure(lambda: pickle.dumps(engine.get_state_data()), args.iterations),
+         measure(lambda: target.restore_state(pickle.loads(pickle_data)), args.iterations)),
+        ('binary', len(binary_data),
+         measure(engine.to_bytes, args.iterations),
+         measure(lambda: target.restore_bytes(binary_data), args.iterations)),
+        ('binary board', len(board_data),
+         measure(engine.board.to_bytes, args.iterations),
+         measure(lambda: type(engine.board).from_bytes(board_data, target.config), args.iterations)),
+    ]
+
+    print(f"棋盘: {args.board_engine}  宽度: {engine.board.width}  帧数: {engine.frame}  分数: {engine.scoring.score}")
+    print(f"{'格式':<16}{'字节':>10}{'编码 (us)':>14}{'解码 (us)':>14}")
+    for name, size, encode_us, decode_us in rows:
+        print(f"{name:<16}{size:>10}{encode_us:>14.1f}{decode_us:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
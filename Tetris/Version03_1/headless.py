@@ -0,0 +1,93 @@
+"""Tetris - 无头模拟
+
+不创建窗口、不初始化音频和特效，按整数帧推进 GameEngine，
+用于模糊测试、机器人和平衡性批量测试，并统计运行吞吐量。
+
+使用方法:
+    python headless.py --games 200 --seed 0 --board-engine bitboard
+    python headless.py --games 20 --ai
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Tuple
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from tetris.config import GameConfig
+from tetris.core import GameEngine, Action
+from tetris.ai import AIController
+
+ACTIONS = list(Action)
+
+
+def run_game(
+    seed: int,
+    board_engine: str,
+    randomizer: str,
+    max_frames: int,
+    action_rate: float,
+    ai: bool = False
+) -> Tuple[GameEngine, int]:
+    """
+    运行一局无头游戏（随机操作，或 ai=True 时每帧执行一个 AI 操作）
+    返回 (引擎, 锁定的方块数)
+    """
+    rng = random.Random(seed)
+    config = GameConfig(board_engine=board_engine, randomizer=randomizer, seed=seed)
+    engine = GameEngine(config, headless=True)
+    locked = [0]
+    engine.events.piece_locked.subscribe(lambda piece: locked.__setitem__(0, locked[0] + 1))
+    controller = AIController(engine, apm=None) if ai else None
+    while not engine.game_over and engine.frame < max_frames:
+        if controller:
+            engine.step(controller.next_action())
+        elif rng.random() < action_rate:
+            engine.step(rng.choice(ACTIONS))
+        else:
+            engine.step()
+    return engine, locked[0]
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="无头运行多局游戏并统计吞吐量")
+    parser.add_argument('--games', type=int, default=100, help="对局数")
+    parser.add_argument('--seed', type=int, default=0, help="起始随机种子（第i局使用 seed + i）")
+    parser.add_argument('--board-engine', choices=['grid', 'bitboard'], default='bitboard', help="棋盘实现")
+    parser.add_argument('--randomizer', choices=['random', 'bag7', 'bag14', 'history'], default='bag7', help="出块随机器")
+    parser.add_argument('--max-frames', type=int, default=100_000, help="单局最大帧数")
+    parser.add_argument('--action-rate', type=float, default=0.25, help="每帧执行随机操作的概率")
+    parser.add_argument('--ai', action='store_true', help="由 AI 落点搜索代替随机操作")
+    args = parser.parse_args()
+
+    total_frames = 0
+    total_score = 0
+    total_lines = 0
+    total_pieces = 0
+    start = time.perf_counter()
+    for i in range(args.games):
+        engine, pieces = run_game(
+            args.seed + i, args.board_engine, args.randomizer,
+            args.max_frames, args.action_rate, args.ai
+        )
+        total_pieces += pieces
+        total_frames += engine.frame
+        total_score += engine.scoring.score
+        total_lines += engine.scoring.lines
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    print(f"对局数:   {args.games}")
+    print(f"总帧数:   {total_frames}")
+    print(f"耗时:     {elapsed:.3f} s")
+    print(f"局/秒:    {args.games / elapsed:.1f}")
+    print(f"帧/秒:    {total_frames / elapsed:.0f}")
+    print(f"方块/秒:  {total_pieces / elapsed:.0f}")
+    print(f"平均得分: {total_score / args.games:.1f}")
+    print(f"平均消行: {total_lines / args.games:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Tetris - 回放
+
+重演 .trpl 回放文件：默认打开窗口按倍速播放，
+--verify 无头全速重演并校验最终成绩；
+--self-check 录制若干局窗口模式对局（键盘回调 + 定步长逻辑，直到游戏结束），
+经二进制编码往返后重演，校验成绩和棋盘与实时游戏一致。
+
+使用方法:
+    python replay.py replays/xxx.trpl --speed 2
+    python replay.py replays/*.trpl --verify
+    python replay.py --self-check 60
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from tetris.config import GameConfig
+from tetris.replay import Replay, ReplayPlayer
+
+# 自检对局的随机按键（每个逻辑步以该概率按下一个键）
+SELF_CHECK_KEY_RATE = 0.05
+SELF_CHECK_MAX_STEPS = 200000
+
+
+def self_check(games: int, seed: int) -> int:
+    """录制 games 局窗口模式对局并往返校验，返回失败局数"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    from tetris.player import Player
+
+    pygame.init()
+    failed = 0
+    for game in range(games):
+        rng = random.Random(seed + game)
+        config = GameConfig(randomizer='bag7', seed=seed + game)
+        player = Player("player1", config)
+        bindings = player.input_handler.key_bindings
+        keys = [bindings.left, bindings.right, bindings.down, bindings.rotate, bindings.hard_drop]
+        recorder = player.enable_recording()
+        for _ in range(SELF_CHECK_MAX_STEPS):
+            if rng.random() < SELF_CHECK_KEY_RATE:
+                player.handle_input(pygame.event.Event(pygame.KEYDOWN, key=rng.choice(keys)), 'playing')
+            player.update(1.0 / config.logic_rate)
+            if player.is_game_over():
+                break
+        replay = Replay.from_bytes(recorder.stop().to_bytes())
+
+        replay_player = ReplayPlayer(replay, config.board_engine)
+        engine = replay_player.run()
+        board = player.engine.board
+        ok = (
+            replay_player.verify()
+            and engine.game_over
+            and all(
+                engine.board.get_cell(x, y) == board.get_cell(x, y)
+                for y in range(board.height + 2) for x in range(board.width)
+            )
+        )
+        if not ok:
+            failed += 1
+            print(f"FAIL 种子 {seed + game}: 得分 {engine.scoring.score}/{replay.final_score}"
+                  f" 消行 {engine.scoring.lines}/{replay.final_lines}")
+    print(f"{games} 局往返自检，失败 {failed}")
+    pygame.quit()
+    return failed
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="播放或校验回放文件")
+    parser.add_argument('files', nargs='*', help="回放文件")
+    parser.add_argument('--speed', type=float, default=1.0, help="播放倍速（如 1、2、8）")
+    parser.add_argument('--verify', action='store_true', help="无头重演并校验成绩，不打开窗口")
+    parser.add_argument('--self-check', type=int, metavar='GAMES', help="录制若干局对局并做编码往返校验")
+    parser.add_argument('--seed', type=int, default=0, help="自检起始随机种子（第i局使用 seed + i）")
+    args = parser.parse_args()
+
+    if args.self_check:
+        sys.exit(1 if self_check(args.self_check, args.seed) else 0)
+    if not args.files:
+        parser.error("需要回放文件")
+
+    if not args.verify:
+        ReplayPlayer(Replay.load(args.files[0])).play(args.speed)
+        return
+
+    failed = 0
+    total_events = 0
+    start = time.perf_counter()
+    for path in args.files:
+        replay = Replay.load(path)
+        engine = ReplayPlayer(replay).run()
+        ok = engine.scoring.score == replay.final_score and engine.scoring.lines == replay.final_lines
+        total_events += len(replay)
+        if not ok:
+            failed += 1
+        print(f"{'OK  ' if ok else 'FAIL'} {path}: 得分 {engine.scoring.score}/{replay.final_score}"
+              f" 消行 {engine.scoring.lines}/{replay.final_lines}")
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"{len(args.files)} 个回放，{total_events} 个操作，{elapsed:.3f} s，失败 {failed}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Tetris - 多进程自对弈
+
+把大量固定种子的 AI 对局分发到多个进程，汇总分数、消行、等级和方块/秒；
+也可扫描或用交叉熵方法调优启发式权重（进程间只传递种子和权重）。
+
+使用方法:
+    python selfplay.py play --games 1000 --workers 8
+    python selfplay.py sweep --param holes --values=-0.2,-0.35,-0.5 --games 64
+    python selfplay.py tune --generations 10 --population 32 --games 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, replace
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from tetris.ai import HeuristicWeights, run_games, summarize, sweep, cross_entropy_tune
+from tetris.ai.selfplay import format_table
+
+SUMMARY_COLUMNS = ['games', 'mean_score', 'mean_lines', 'mean_level', 'max_level', 'mean_pieces', 'pieces_per_sec']
+
+
+def parse_weights(text: str) -> HeuristicWeights:
+    """解析逗号分隔的权重（按 HeuristicWeights 字段顺序）"""
+    return HeuristicWeights.from_sequence([float(value) for value in text.split(',')])
+
+
+def main() -> None:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="多进程自对弈与启发式权重调优")
+    parser.add_argument('mode', choices=['play', 'sweep', 'tune'], help="运行模式")
+    parser.add_argument('--games', type=int, default=100, help="对局数（tune 模式为每个候选的对局数）")
+    parser.add_argument('--seed', type=int, default=0, help="起始随机种子")
+    parser.add_argument('--workers', type=int, default=None, help="工作进程数（默认使用全部 CPU）")
+    parser.add_argument('--board-engine', choices=['grid', 'bitboard'], default='bitboard', help="棋盘实现")
+    parser.add_argument('--randomizer', choices=['random', 'bag7', 'bag14', 'history'], default='bag7', help="出块随机器")
+    parser.add_argument('--max-pieces', type=int, default=1000, help="单局最多方块数")
+    parser.add_argument('--weights', type=parse_weights, default=HeuristicWeights(),
+                        help="权重，逗号分隔：" + ','.join(f.name for f in fields(HeuristicWeights)))
+    parser.add_argument('--param', choices=[f.name for f in fields(HeuristicWeights)], help="sweep：扫描的权重")
+    parser.add_argument('--values', default='', help="sweep：逗号分隔的取值（负数请写成 --values=-0.2,-0.5）")
+    parser.add_argument('--generations', type=int, default=10, help="tune：迭代代数")
+    parser.add_argument('--population', type=int, default=24, help="tune：每代候选数")
+    parser.add_argument('--elite', type=float, default=0.25, help="tune：精英比例")
+    args = parser.parse_args()
+
+    options = dict(board_engine=args.board_engine, randomizer=args.randomizer, max_pieces=args.max_pieces)
+    start = time.perf_counter()
+
+    # 进程池在整个运行期间复用（tune 模式跨代复用）
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        if args.mode == 'play':
+            seeds = range(args.seed, args.seed + args.games)
+            results = run_games(seeds, args.weights.as_tuple(), executor=executor, **options)
+            print(format_table([summarize(results)], SUMMARY_COLUMNS))
+
+        elif args.mode == 'sweep':
+            if not args.param or not args.values:
+                parser.error("sweep 模式需要 --param 和 --values")
+            values = [float(value) for value in args.values.split(',')]
+            candidates = [replace(args.weights, **{args.param: value}).as_tuple() for value in values]
+            seeds = list(range(args.seed, args.seed + args.games))
+            rows = sweep(candidates, seeds, executor=executor, **options)
+            for row, value in zip(rows, values):
+                row[args.param] = value
+            print(format_table(rows, [args.param] + SUMMARY_COLUMNS))
+
+        else:
+            def report(info: dict) -> None:
+                weights = ', '.join(f"{w:.3f}" for w in info['mean_weights'])
+                print(f"第 {info['generation'] + 1} 代  最佳 {info['best']:.1f}  精英均值 {info['elite_mean']:.1f}  均值权重 [{weights}]")
+
+            tuned = cross_entropy_tune(
+                generations=args.generations,
+                population=args.population,
+                elite_fraction=args.elite,
+                games_per_candidate=args.games,
+                seed=args.seed,
+                executor=executor,
+                initial=args.weights,
+                on_generation=report,
+                **options
+            )
+            print("调优结果: " + ','.join(f"{w:.6f}" for w in tuned.as_tuple()))
+
+    print(f"耗时: {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,16 @@ from .config import (
 )
 from .utils import get_resource_path, get_data_path
 from .core import (
-    Board, Tetromino, ScoringSystem,
+    Board, BitBoard, Tetromino, ScoringSystem,
     GameState, StateMachine, GameEngine,
-    Event, GameEngineEvents
+    Event, GameEngineEvents, Action
 )
 from .audio import SoundManager
 from .effects import Particle, FloatingText, Star, EffectManager
 from .rendering import SurfaceCache, BlockRenderer, FontManager, Renderer
 from .input import InputHandler, KeyBindings
+from .replay import Replay, ReplayRecorder, ReplayPlayer
+from .ai import AIController, HeuristicWeights
 from .player import Player, PlayerManager
 from .main import GameRunner, main
 
@@ -30,9 +32,9 @@ __all__ = [
     # utils
     'get_resource_path', 'get_data_path',
     # core
-    'Board', 'Tetromino', 'ScoringSystem',
+    'Board', 'BitBoard', 'Tetromino', 'ScoringSystem',
     'GameState', 'StateMachine', 'GameEngine',
-    'Event', 'GameEngineEvents',
+    'Event', 'GameEngineEvents', 'Action',
     # audio
     'SoundManager',
     # effects
@@ -41,6 +43,10 @@ __all__ = [
     'SurfaceCache', 'BlockRenderer', 'FontManager', 'Renderer',
     # input
     'InputHandler', 'KeyBindings',
+    # replay
+    'Replay', 'ReplayRecorder', 'ReplayPlayer',
+    # ai
+    'AIController', 'HeuristicWeights',
     # player
     'Player', 'PlayerManager',
     # main
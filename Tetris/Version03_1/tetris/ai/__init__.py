@@ -0,0 +1,13 @@
+"""AI 模块 - 落点搜索与电脑玩家"""
+
+from .heuristics import HeuristicWeights, column_features, board_features, score_features, evaluate_board
+from .search import Placement, reachable_positions, find_placements, find_best_placement
+from .controller import AIController, DEFAULT_APM
+from .selfplay import GameResult, play_game, run_games, summarize, sweep, cross_entropy_tune
+
+__all__ = [
+    'HeuristicWeights', 'column_features', 'board_features', 'score_features', 'evaluate_board',
+    'Placement', 'reachable_positions', 'find_placements', 'find_best_placement',
+    'AIController', 'DEFAULT_APM',
+    'GameResult', 'play_game', 'run_games', 'summarize', 'sweep', 'cross_entropy_tune',
+]
@@ -0,0 +1,86 @@
+"""AI 控制器 - 为当前方块规划落点并按设定 APM 输入操作"""
+
+from typing import Callable, List, Optional
+
+from ..core import Action, GameEngine, Tetromino
+from .heuristics import HeuristicWeights
+from .search import Placement, find_best_placement
+
+# 默认每分钟操作数（约为熟练玩家水平）
+DEFAULT_APM = 180.0
+
+
+class AIController:
+    """
+    AI 控制器 - 新方块出现时搜索最佳落点，再逐个执行操作序列
+
+    apm 为 None 或不大于 0 时不限速（update 时立即完成整个操作序列）
+    apply 用于执行单个操作，默认直接调用 engine.apply_action；
+    玩家可传入经过输入回调的函数，使回放录制等功能照常工作
+    """
+
+    def __init__(
+        self,
+        engine: GameEngine,
+        weights: Optional[HeuristicWeights] = None,
+        apm: Optional[float] = DEFAULT_APM,
+        apply: Optional[Callable[[Action], bool]] = None
+    ):
+        self.engine = engine
+        self.weights = weights or HeuristicWeights()
+        self.apm = apm
+        self.apply = apply or engine.apply_action
+        self.plan: List[Action] = []
+        self.target: Optional[Placement] = None
+        self._planned_piece: Optional[Tetromino] = None
+        self._action_budget = 0.0
+
+    def _replan(self) -> None:
+        """为当前方块重新规划"""
+        piece = self.engine.current_piece
+        self._planned_piece = piece
+        self.target = find_best_placement(self.engine.board, piece, self.weights) if piece else None
+        self.plan = list(self.target.actions) if self.target else []
+
+    def next_action(self) -> Action:
+        """返回下一个操作（方块变化时自动重新规划），供 step 驱动的无头模式使用"""
+        if self.engine.current_piece is not self._planned_piece:
+            self._replan()
+        return self.plan.pop(0) if self.plan else Action.NONE
+
+    def _perform(self) -> None:
+        """执行一个操作；操作失败（如重力改变了高度）时重新规划"""
+        action = self.next_action()
+        if action != Action.NONE and not self.apply(action) and action != Action.HARD_DROP:
+            self._replan()
+
+    def update(self, dt: float) -> None:
+        """按经过的时间（秒）执行操作"""
+        if self.engine.game_over:
+            return
+        if not self.apm or self.apm <= 0:
+            self.play_piece()
+            return
+        self._action_budget = min(self._action_budget + dt * self.apm / 60.0, 2.0)
+        while self._action_budget >= 1.0 and not self.engine.game_over:
+            self._action_budget -= 1.0
+            self._perform()
+
+    def play_piece(self) -> bool:
+        """立即规划并执行完当前方块的全部操作，返回游戏是否仍在进行"""
+        piece = self.engine.current_piece
+        if piece is not self._planned_piece:
+            self._replan()
+        while piece is not None and not self.engine.game_over and self.engine.current_piece is piece:
+            if not self.plan:
+                self.apply(Action.HARD_DROP)
+                break
+            self._perform()
+        return not self.engine.game_over
+
+    def reset(self) -> None:
+        """清除规划（新一局开始时调用）"""
+        self.plan = []
+        self.target = None
+        self._planned_piece = None
+        self._action_budget = 0.0
@@ -0,0 +1,64 @@
+"""落点评估 - 可配置权重的局面启发式"""
+
+from dataclasses import dataclass, fields
+from operator import sub
+from typing import Optional, Sequence, Tuple
+
+from ..core import Board
+
+
+@dataclass
+class HeuristicWeights:
+    """启发式权重（正值鼓励、负值惩罚）"""
+    aggregate_height: float = -0.510066  # 各列高度之和
+    lines: float = 0.760666              # 本次消除的行数
+    holes: float = -0.35663              # 被覆盖的空格数
+    bumpiness: float = -0.184483         # 相邻列高度差之和
+
+    def as_tuple(self) -> Tuple[float, ...]:
+        """按字段顺序导出权重（用于调参和跨进程传递）"""
+        return tuple(getattr(self, f.name) for f in fields(self))
+
+    @classmethod
+    def from_sequence(cls, values: Sequence[float]) -> 'HeuristicWeights':
+        """按字段顺序构建权重"""
+        return cls(*values)
+
+
+def column_features(tops: Sequence[int], limit: int, cells: int) -> Tuple[int, int, int]:
+    """
+    由列表面计算局面特征：(总高度, 空洞数, 凹凸度)
+    tops 为每列最上方方块所在行（空列为 limit），limit 为棋盘总行数；
+    所有方块都位于所在列表面及以下，因此空洞数 = 总高度 - 已占用格子数
+    """
+    aggregate = limit * len(tops) - sum(tops)
+    bumpiness = sum(map(abs, map(sub, tops, tops[1:])))
+    return aggregate, aggregate - cells, bumpiness
+
+
+def board_features(board: Board, cells: Optional[int] = None) -> Tuple[int, int, int]:
+    """由列表面缓存计算局面特征；调用方已知格子数时可直接传入 cells，省去逐行统计"""
+    if cells is None:
+        cells = board.count_cells()
+    return column_features(board.heights, board.height + 2, cells)
+
+
+def score_features(features: Tuple[int, int, int], lines_cleared: int, weights: HeuristicWeights) -> float:
+    """按权重合成局面特征 (总高度, 空洞数, 凹凸度) 和消行数的评分"""
+    aggregate, holes, bumpiness = features
+    return (
+        weights.aggregate_height * aggregate
+        + weights.lines * lines_cleared
+        + weights.holes * holes
+        + weights.bumpiness * bumpiness
+    )
+
+
+def evaluate_board(
+    board: Board,
+    lines_cleared: int,
+    weights: HeuristicWeights,
+    cells: Optional[int] = None
+) -> float:
+    """评估放置并消行后的局面"""
+    return score_features(board_features(board, cells), lines_cleared, weights)
@@ -0,0 +1,185 @@
+"""落点搜索 - 枚举当前方块所有可达的最终位置"""
+
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..core import Action, Board, PieceShape, Tetromino
+from .heuristics import HeuristicWeights, column_features, score_features
+
+# 与 GameEngine.rotate_piece 一致的踢墙偏移
+KICK_OFFSETS = (-1, 1, -2, 2)
+
+# 放置后触顶（出生区有方块）的评分
+TOP_OUT_SCORE = -1e9
+
+
+class Placement(NamedTuple):
+    """一个最终落点"""
+    rotation: int
+    x: int
+    y: int
+    actions: Tuple[Action, ...]  # 从当前位置到达该落点的操作序列（以硬降结束）
+    lines: int
+    score: float
+
+
+def _rotate(board: Board, probe: Tetromino, rotation: int, x: int) -> Optional[Tuple[int, int]]:
+    """模拟引擎的旋转（含踢墙），返回旋转后的 (旋转状态, x)，无法旋转时返回 None"""
+    count = len(probe.shapes)
+    if count <= 1:
+        return None
+    probe.rotation = (rotation + 1) % count
+    probe.x = x
+    if board.is_valid_position(probe):
+        return probe.rotation, x
+    for dx in KICK_OFFSETS:
+        if board.is_valid_position(probe, dx, 0):
+            return probe.rotation, x + dx
+    return None
+
+
+def reachable_positions(board: Board, piece: Tetromino) -> Dict[Tuple[int, int], Tuple[Action, ...]]:
+    """
+    在方块当前高度上广度优先搜索旋转和左右移动，
+    返回每个可达 (旋转状态, x) 的最短操作序列
+    """
+    probe = piece.clone()
+    start = (piece.rotation, piece.x)
+    paths: Dict[Tuple[int, int], Tuple[Action, ...]] = {start: ()}
+    queue = deque([start])
+
+    while queue:
+        rotation, x = queue.popleft()
+        path = paths[(rotation, x)]
+
+        neighbours = [(Action.ROTATE, _rotate(board, probe, rotation, x))]
+        probe.rotation = rotation
+        probe.x = x
+        if board.is_valid_position(probe, -1, 0):
+            neighbours.append((Action.LEFT, (rotation, x - 1)))
+        if board.is_valid_position(probe, 1, 0):
+            neighbours.append((Action.RIGHT, (rotation, x + 1)))
+
+        for action, state in neighbours:
+            if state is not None and state not in paths:
+                paths[state] = path + (action,)
+                queue.append(state)
+
+    return paths
+
+
+def _merge_rows(rows: Sequence[int], shape: PieceShape, x: int, y: int) -> Tuple[Dict[int, int], int]:
+    """把方块的行掩码并入受影响的行（不修改棋盘），返回 ({行号: 合并后的掩码}, 放入的格子数)"""
+    limit = len(rows)
+    merged: Dict[int, int] = {}
+    placed = 0
+    for dy, mask in shape.row_masks:
+        ny = y + dy
+        if 0 <= ny < limit:
+            shifted = mask << x if x >= 0 else mask >> -x
+            merged[ny] = rows[ny] | shifted
+            placed += shifted.bit_count()
+    return merged, placed
+
+
+def _cleared_tops(rows: Sequence[int], merged: Dict[int, int], cleared: List[int], heights: Sequence[int]) -> List[int]:
+    """
+    消行后的列表面：从放置后的表面向下找第一个未被消除的方块，
+    再按其下方被消除的行数下移（空列保持为总行数）
+    """
+    limit = len(rows)
+    tops = []
+    for column, top in enumerate(heights):
+        bit = 1 << column
+        while top < limit and (top in cleared or not merged.get(top, rows[top]) & bit):
+            top += 1
+        if top < limit:
+            top += sum(1 for ny in cleared if ny > top)
+        tops.append(top)
+    return tops
+
+
+def find_placements(
+    board: Board,
+    piece: Tetromino,
+    weights: Optional[HeuristicWeights] = None
+) -> List[Placement]:
+    """
+    枚举并评估所有不同的最终落点（形状相同的旋转状态只保留操作最少的一个）
+    评估只使用行掩码和列表面，不修改棋盘：未消行时只更新方块所在的列，
+    总高度和凹凸度在放置前的基础上增量计算
+    """
+    weights = weights or HeuristicWeights()
+    probe = piece.clone()
+    placements: List[Placement] = []
+    seen = set()
+
+    # 按操作数从少到多处理，重复落点保留最短路径
+    candidates = sorted(reachable_positions(board, piece).items(), key=lambda item: len(item[1]))
+    rows = board.row_masks()
+    heights = board.heights
+    width = board.width
+    full = (1 << width) - 1
+    limit = len(rows)
+    # 放置后的格子数可由放置前推出：加上放入的格子数，减去消除的整行
+    base_cells = board.count_cells()
+    base_aggregate, _, base_bumpiness = column_features(heights, limit, base_cells)
+    base_top = min(heights, default=limit)
+
+    for (rotation, x), path in candidates:
+        probe.rotation = rotation
+        probe.x = x
+        probe.y = piece.y
+        probe.y += board.drop_distance(probe)
+        y = probe.y
+        shape = probe.get_shape()
+        key = (shape.cells, x, y)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        merged, placed = _merge_rows(rows, shape, x, y)
+        cleared = [ny for ny, mask in merged.items() if mask == full]
+        lines = len(cleared)
+        cells = base_cells + placed - lines * width
+
+        if cleared or y + shape.bounds[2] < 0:
+            # 消行（或方块有格子在棋盘外）时重新计算所有列表面
+            tops = heights[:]
+            for dx, dy in shape.top:
+                tops[x + dx] = min(tops[x + dx], max(y + dy, 0))
+            tops = _cleared_tops(rows, merged, cleared, tops)
+            top = min(tops, default=limit)
+            features = column_features(tops, limit, cells)
+        else:
+            # 只有方块所在的列表面升高：总高度和凹凸度按变化的列增量修正
+            changed = {x + dx: y + dy for dx, dy in shape.top if y + dy < heights[x + dx]}
+            aggregate = base_aggregate + sum(heights[column] - top for column, top in changed.items())
+            bumpiness = base_bumpiness
+            for left in {column + side for column in changed for side in (-1, 0)}:
+                if 0 <= left < width - 1:
+                    right = left + 1
+                    bumpiness += (
+                        abs(changed.get(left, heights[left]) - changed.get(right, heights[right]))
+                        - abs(heights[left] - heights[right])
+                    )
+            top = min(base_top, *changed.values()) if changed else base_top
+            features = (aggregate, aggregate - cells, bumpiness)
+
+        # 出生区（前 2 行）有方块即触顶
+        score = TOP_OUT_SCORE if top < 2 else score_features(features, lines, weights)
+        placements.append(Placement(rotation, x, y, path + (Action.HARD_DROP,), lines, score))
+
+    return placements
+
+
+def find_best_placement(
+    board: Board,
+    piece: Tetromino,
+    weights: Optional[HeuristicWeights] = None
+) -> Optional[Placement]:
+    """返回评分最高的落点（同分时取操作最少的）"""
+    placements = find_placements(board, piece, weights)
+    if not placements:
+        return None
+    return max(placements, key=lambda placement: (placement.score, -len(placement.actions)))
@@ -0,0 +1,195 @@
+"""自对弈 - 多进程批量对局与启发式权重调优"""
+
+from concurrent.futures import Executor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import math
+import os
+import random
+import time
+
+from ..config import GameConfig
+from ..core import GameEngine
+from .controller import AIController
+from .heuristics import HeuristicWeights
+
+
+class GameResult(NamedTuple):
+    """单局结果（跨进程只回传这些数值）"""
+    seed: int
+    score: int
+    lines: int
+    level: int
+    pieces: int
+    seconds: float
+
+
+def play_game(
+    seed: int,
+    weights: Sequence[float],
+    board_engine: str = 'bitboard',
+    randomizer: str = 'bag7',
+    max_pieces: int = 1000
+) -> GameResult:
+    """
+    用给定权重无头运行一局（工作进程入口，参数只有种子和权重）
+    AI 不限速，每个方块规划后立即执行，达到 max_pieces 时结束
+    """
+    config = GameConfig(board_engine=board_engine, randomizer=randomizer, seed=seed)
+    engine = GameEngine(config, headless=True)
+    controller = AIController(engine, HeuristicWeights.from_sequence(weights), apm=None)
+
+    start = time.perf_counter()
+    pieces = 0
+    while pieces < max_pieces and controller.play_piece():
+        pieces += 1
+    seconds = time.perf_counter() - start
+
+    return GameResult(
+        seed, engine.scoring.score, engine.scoring.lines, engine.scoring.level, pieces, seconds
+    )
+
+
+GameTask = Tuple[int, Tuple[float, ...], str, str, int]
+
+
+def _play_task(task: GameTask) -> GameResult:
+    """进程池任务（解包参数）"""
+    return play_game(*task)
+
+
+def _map_tasks(tasks: Sequence[GameTask], executor: Optional[Executor]) -> List[GameResult]:
+    """执行任务列表，结果顺序与输入一致（未提供 executor 时在当前进程内顺序运行）"""
+    if executor is None:
+        return [_play_task(task) for task in tasks]
+    # 任务分块提交，减少进程间往返
+    chunksize = max(1, len(tasks) // (4 * (os.cpu_count() or 1)))
+    return list(executor.map(_play_task, tasks, chunksize=chunksize))
+
+
+def run_games(
+    seeds: Iterable[int],
+    weights: Sequence[float],
+    board_engine: str = 'bitboard',
+    randomizer: str = 'bag7',
+    max_pieces: int = 1000,
+    executor: Optional[Executor] = None
+) -> List[GameResult]:
+    """用同一组权重运行多局"""
+    weights = tuple(weights)
+    return _map_tasks([(seed, weights, board_engine, randomizer, max_pieces) for seed in seeds], executor)
+
+
+def summarize(results: Sequence[GameResult]) -> Dict[str, float]:
+    """汇总多局结果"""
+    if not results:
+        return {'games': 0}
+    count = len(results)
+    seconds = sum(r.seconds for r in results)
+    pieces = sum(r.pieces for r in results)
+    return {
+        'games': count,
+        'mean_score': sum(r.score for r in results) / count,
+        'mean_lines': sum(r.lines for r in results) / count,
+        'mean_level': sum(r.level for r in results) / count,
+        'max_level': max(r.level for r in results),
+        'mean_pieces': pieces / count,
+        'pieces_per_sec': pieces / seconds if seconds > 0 else 0.0,
+    }
+
+
+def format_table(rows: Sequence[Dict[str, float]], columns: Sequence[str]) -> str:
+    """把汇总结果格式化为文本表格"""
+    widths = [max(len(col), 12) for col in columns]
+    lines = ['  '.join(col.rjust(width) for col, width in zip(columns, widths))]
+    for row in rows:
+        cells = []
+        for col, width in zip(columns, widths):
+            value = row.get(col, '')
+            text = f"{value:.2f}" if isinstance(value, float) else str(value)
+            cells.append(text.rjust(width))
+        lines.append('  '.join(cells))
+    return '\n'.join(lines)
+
+
+def sweep(
+    candidates: Sequence[Sequence[float]],
+    seeds: Sequence[int],
+    board_engine: str = 'bitboard',
+    randomizer: str = 'bag7',
+    max_pieces: int = 1000,
+    executor: Optional[Executor] = None
+) -> List[Dict[str, float]]:
+    """参数扫描：每组权重在相同种子上对局，返回各组汇总（所有对局一次提交）"""
+    tasks = [
+        (seed, tuple(weights), board_engine, randomizer, max_pieces)
+        for weights in candidates for seed in seeds
+    ]
+    results = _map_tasks(tasks, executor)
+    rows = []
+    for i, weights in enumerate(candidates):
+        row = summarize(results[i * len(seeds):(i + 1) * len(seeds)])
+        row['weights'] = tuple(weights)
+        rows.append(row)
+    return rows
+
+
+def cross_entropy_tune(
+    generations: int = 10,
+    population: int = 24,
+    elite_fraction: float = 0.25,
+    games_per_candidate: int = 4,
+    seed: int = 0,
+    executor: Optional[Executor] = None,
+    initial: Optional[HeuristicWeights] = None,
+    initial_std: float = 0.5,
+    fitness: str = 'mean_lines',
+    board_engine: str = 'bitboard',
+    randomizer: str = 'bag7',
+    max_pieces: int = 300,
+    on_generation: Optional[Callable[[Dict[str, object]], None]] = None
+) -> HeuristicWeights:
+    """
+    交叉熵方法调优启发式权重：
+    每代从高斯分布采样候选权重，在同一组种子上对局，取精英更新均值和标准差，
+    返回最后一代的分布均值
+    """
+    rng = random.Random(seed)
+    mean = list((initial or HeuristicWeights()).as_tuple())
+    std = [initial_std] * len(mean)
+    elite_count = max(1, int(population * elite_fraction))
+
+    for generation in range(generations):
+        seeds = [rng.randrange(2 ** 32) for _ in range(games_per_candidate)]
+        candidates = [
+            tuple(rng.gauss(m, s) for m, s in zip(mean, std))
+            for _ in range(population)
+        ]
+        # 所有候选 × 种子一次提交，工作进程跨代复用，只传种子和权重
+        tasks = [
+            (s, candidate, board_engine, randomizer, max_pieces)
+            for candidate in candidates for s in seeds
+        ]
+        results = _map_tasks(tasks, executor)
+
+        scored = []
+        for i, candidate in enumerate(candidates):
+            chunk = results[i * len(seeds):(i + 1) * len(seeds)]
+            scored.append((summarize(chunk)[fitness], candidate))
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        elites = [candidate for _, candidate in scored[:elite_count]]
+        mean = [sum(values) / elite_count for values in zip(*elites)]
+        std = [
+            math.sqrt(sum((v - m) ** 2 for v in values) / elite_count) + 1e-3
+            for values, m in zip(zip(*elites), mean)
+        ]
+
+        if on_generation:
+            on_generation({
+                'generation': generation,
+                'best': scored[0][0],
+                'elite_mean': sum(value for value, _ in scored[:elite_count]) / elite_count,
+                'mean_weights': tuple(mean),
+            })
+
+    return HeuristicWeights.from_sequence(mean)
@@ -1,7 +1,7 @@
 """配置模块"""
 
 from .settings import (
-    GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, BASE_WIDTH,
+    GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, BASE_WIDTH, FRAME_RATE, LOGIC_RATE,
     BOARD_WIDTH, BOARD_HEIGHT, BOARD_X, BOARD_Y,
     PANEL_WIDTH, PANEL_X, SCREEN_WIDTH, SCREEN_HEIGHT,
     NEON_COLORS, SPARK_COLORS, SHAPES,
@@ -9,7 +9,7 @@ from .settings import (
 )
 
 __all__ = [
-    'GRID_SIZE', 'GRID_WIDTH', 'GRID_HEIGHT', 'BASE_WIDTH',
+    'GRID_SIZE', 'GRID_WIDTH', 'GRID_HEIGHT', 'BASE_WIDTH', 'FRAME_RATE', 'LOGIC_RATE',
     'BOARD_WIDTH', 'BOARD_HEIGHT', 'BOARD_X', 'BOARD_Y',
     'PANEL_WIDTH', 'PANEL_X', 'SCREEN_WIDTH', 'SCREEN_HEIGHT',
     'NEON_COLORS', 'SPARK_COLORS', 'SHAPES',
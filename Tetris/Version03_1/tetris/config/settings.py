@@ -1,6 +1,6 @@
 """配置模块 - 全局常量和设置"""
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # 方块尺寸（可配置）
 GRID_SIZE = 32
@@ -8,6 +8,11 @@ BASE_WIDTH = 10  # 基准宽度（Level 1）
 GRID_WIDTH = 10
 GRID_HEIGHT = 20
 
+# 逻辑帧率（无头模式按整数帧推进；帧计数的特效计时器也按此帧率调校）
+FRAME_RATE = 60
+# 窗口模式的固定步长逻辑频率（与渲染帧率无关）
+LOGIC_RATE = 120
+
 
 def get_width_for_level(level: int) -> int:
     """根据关卡计算棋盘宽度"""
@@ -85,6 +90,20 @@ class GameConfig:
         board_x: int = BOARD_X,
         board_y: int = BOARD_Y,
         panel_width: int = PANEL_WIDTH,
+        board_engine: str = 'grid',
+        frame_rate: int = FRAME_RATE,
+        randomizer: str = 'random',
+        seed: Optional[int] = None,
+        preview_count: int = 1,
+        dirty_rects: bool = True,
+        max_particles: int = 4000,
+        max_floating_texts: int = 12,
+        max_overlay_surfaces: int = 8,
+        frame_budget_ms: Optional[float] = None,
+        logic_rate: int = LOGIC_RATE,
+        max_logic_steps: int = 12,
+        render_fps: int = 0,
+        vsync: bool = False,
     ):
         self.grid_size = grid_size
         self.grid_width = grid_width
@@ -93,6 +112,25 @@ class GameConfig:
         self.board_y = board_y
         self.panel_width = panel_width
         self.initial_width = BASE_WIDTH  # 初始宽度（用于重置）
+        self.board_engine = board_engine  # 棋盘实现：'grid'（列表网格）或 'bitboard'（位掩码）
+        self.frame_rate = frame_rate  # 每秒逻辑帧数
+        self.randomizer = randomizer  # 出块随机器：'random'、'bag7'、'bag14'、'history'
+        self.seed = seed  # 随机器种子（None 表示每局随机）
+        self.preview_count = max(1, preview_count)  # 预览队列长度
+        self.dirty_rects = dirty_rects  # 只提交变化区域（False 时每帧整屏 flip）
+
+        # 特效预算：同时存在的粒子、浮动文字、覆盖层上限，以及触发降级的目标帧时间（默认按帧率）
+        self.max_particles = max_particles
+        self.max_floating_texts = max_floating_texts
+        self.max_overlay_surfaces = max_overlay_surfaces
+        self.frame_budget_ms = frame_budget_ms or 1000.0 / frame_rate
+
+        # 主循环：逻辑按 logic_rate 固定步长推进，每个渲染帧最多追赶 max_logic_steps 步（超出的时间丢弃）；
+        # 渲染帧率上限 render_fps（0 表示不限），vsync 为 True 时请求垂直同步
+        self.logic_rate = logic_rate
+        self.max_logic_steps = max(1, max_logic_steps)
+        self.render_fps = render_fps
+        self.vsync = vsync
 
         # 计算派生尺寸
         self.board_width = grid_width * grid_size
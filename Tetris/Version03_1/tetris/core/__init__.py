@@ -1,17 +1,28 @@
 """核心游戏逻辑模块"""
 
+from .actions import Action
 from .board import Board
-from .tetromino import Tetromino
+from .bitboard import BitBoard
+from .tetromino import PieceShape, Tetromino
+from .randomizer import Randomizer, create_randomizer, normalize_seed
 from .scoring import ScoringSystem
 from .game_state import GameState, StateMachine
+from .trails import TrailBuffer
 from .game_engine import GameEngine, Event, GameEngineEvents
 
 __all__ = [
+    'Action',
     'Board',
+    'BitBoard',
+    'PieceShape',
     'Tetromino',
+    'Randomizer',
+    'create_randomizer',
+    'normalize_seed',
     'ScoringSystem',
     'GameState',
     'StateMachine',
+    'TrailBuffer',
     'GameEngine',
     'Event',
     'GameEngineEvents',
@@ -0,0 +1,14 @@
+"""玩家操作定义"""
+
+from enum import IntEnum
+
+
+class Action(IntEnum):
+    """引擎可执行的操作（编码用于无头模式与回放）"""
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    DOWN = 3
+    ROTATE = 4
+    HARD_DROP = 5
+    GRAVITY = 6  # 一次重力下落（回放中显式记录，使回放与帧率无关）
@@ -0,0 +1,302 @@
+"""位棋盘 - 以整数位掩码存储每行的占用状态"""
+
+from typing import Any, List, Optional, Tuple
+
+from ..config import GameConfig
+from .board import Board
+from .tetromino import Tetromino, TYPE_CODES, TYPE_NAMES
+from . import snapshot
+
+
+class BitBoard(Board):
+    """位棋盘 - 每行一个整数掩码（第x位表示第x列），接口与 Board 一致"""
+
+    def __init__(self, config: Optional[GameConfig] = None):
+        self.config = config or GameConfig()
+        self.width = self.config.grid_width
+        self.height = self.config.grid_height
+        self.left_offset = 0
+        self.expand_side = 'right'
+        self.version = 0
+        self._journal: Optional[List[Tuple[Any, ...]]] = None
+        self._init_rows()
+
+    def _init_rows(self) -> None:
+        """分配空行（多2行用于上方缓冲）"""
+        self.full_mask = (1 << self.width) - 1
+        # 每行的占用掩码
+        self.rows: List[int] = [0] * (self.height + 2)
+        # 每格的方块类型编码（用于渲染）
+        self.types: List[bytearray] = [bytearray(self.width) for _ in range(self.height + 2)]
+        # 列表面缓存：每列最上方方块所在行（空列为 height + 2）
+        self.heights: List[int] = [self.height + 2] * self.width
+
+    @property
+    def grid(self) -> List[List[Optional[str]]]:
+        """兼容 Board.grid：按需生成列表网格（修改它不会影响棋盘）"""
+        return [[TYPE_NAMES[code] for code in row] for row in self.types]
+
+    @grid.setter
+    def grid(self, grid: List[List[Optional[str]]]) -> None:
+        self.width = len(grid[0]) if grid else self.width
+        self.full_mask = (1 << self.width) - 1
+        self.rows = []
+        self.types = []
+        for row in grid:
+            mask = 0
+            codes = bytearray(self.width)
+            for x, cell in enumerate(row):
+                if cell is not None:
+                    mask |= 1 << x
+                    codes[x] = TYPE_CODES.get(cell, 0)
+            self.rows.append(mask)
+            self.types.append(codes)
+        self._rebuild_heights()
+        self.version += 1
+
+    def get_cell(self, x: int, y: int) -> Optional[str]:
+        """获取指定格子的内容"""
+        if 0 <= y < len(self.rows) and 0 <= x < self.width:
+            return TYPE_NAMES[self.types[y][x]]
+        return None
+
+    def set_cell(self, x: int, y: int, value: Optional[str]) -> None:
+        """设置指定格子的内容"""
+        if 0 <= y < len(self.rows) and 0 <= x < self.width:
+            if self._journal is not None:
+                self._journal.append(('cells', [(x, y, self.types[y][x])], [(x, self.heights[x])]))
+            if value is None:
+                self.rows[y] &= ~(1 << x)
+                self.types[y][x] = 0
+            else:
+                self.rows[y] |= 1 << x
+                self.types[y][x] = TYPE_CODES.get(value, 0)
+            self._update_column_height(x)
+            self.version += 1
+
+    def is_valid_position(self, piece: Tetromino, dx: int = 0, dy: int = 0) -> bool:
+        """检查方块位置是否有效（方块行掩码与棋盘行按位与）"""
+        shape = piece.get_shape()
+        if not shape.cells:
+            return True
+        min_dx, max_dx = shape.bounds[0], shape.bounds[1]
+        shift = piece.x + dx
+        # 检查左右边界
+        if shift + min_dx < 0 or shift + max_dx >= self.width:
+            return False
+        base_y = piece.y + dy
+        limit = self.height + 2
+        rows = self.rows
+        for row_dy, mask in shape.row_masks:
+            ny = base_y + row_dy
+            if ny >= limit:
+                return False
+            if ny >= 0:
+                shifted = mask << shift if shift >= 0 else mask >> -shift
+                if rows[ny] & shifted:
+                    return False
+        return True
+
+    def place_piece(self, piece: Tetromino) -> None:
+        """放置方块到网格"""
+        code = TYPE_CODES.get(piece.type, 0)
+        heights = self.heights
+        journal = self._journal
+        if journal is not None:
+            cells, columns = [], []
+            journal.append(('cells', cells, columns))
+        for x, y in piece.get_blocks():
+            if 0 <= y < self.height + 2 and 0 <= x < self.width:
+                if journal is not None:
+                    cells.append((x, y, self.types[y][x]))
+                    columns.append((x, heights[x]))
+                self.rows[y] |= 1 << x
+                self.types[y][x] = code
+                if y < heights[x]:
+                    heights[x] = y
+        self.version += 1
+
+    def _update_column_height(self, x: int) -> None:
+        """重新计算单列表面"""
+        bit = 1 << x
+        for y, mask in enumerate(self.rows):
+            if mask & bit:
+                self.heights[x] = y
+                return
+        self.heights[x] = len(self.rows)
+
+    def _rebuild_heights(self) -> None:
+        """自上而下逐行取出新出现的列，重新计算所有列表面"""
+        heights = [len(self.rows)] * self.width
+        remaining = self.full_mask
+        for y, mask in enumerate(self.rows):
+            hit = mask & remaining
+            while hit:
+                low = hit & -hit
+                heights[low.bit_length() - 1] = y
+                hit ^= low
+            remaining &= ~mask
+            if not remaining:
+                break
+        self.heights = heights
+
+    def clear_lines(self) -> Tuple[int, List[int]]:
+        """清除完整行（整行掩码比较），返回清除的行数和行号列表"""
+        full = self.full_mask
+        lines_to_clear = [y for y, mask in enumerate(self.rows) if mask == full]
+        if lines_to_clear and self._journal is not None:
+            self._journal.append((
+                'clear', [(self.rows[y], self.types[y]) for y in lines_to_clear], lines_to_clear, self.heights
+            ))
+
+        for y in lines_to_clear:
+            del self.rows[y]
+            del self.types[y]
+            self.rows.insert(0, 0)
+            self.types.insert(0, bytearray(self.width))
+        if lines_to_clear:
+            self._rebuild_heights()
+            self.version += 1
+
+        return len(lines_to_clear), lines_to_clear
+
+    def is_game_over(self) -> bool:
+        """检查是否游戏结束（检查缓冲区是否有方块）"""
+        return bool(self.rows[0] or self.rows[1])
+
+    def reset(self) -> None:
+        """重置游戏板（恢复初始宽度）"""
+        self._journal_full_state()
+        self.width = self.config.initial_width
+        self.left_offset = 0
+        self.expand_side = 'right'
+        self.config.update_width(self.config.initial_width, left_offset=0)
+        self._init_rows()
+        self.version += 1
+
+    def expand_width(self, new_width: int) -> None:
+        """扩展棋盘宽度（左右交替：先右侧，再左侧）"""
+        if new_width <= self.width:
+            return
+        self._journal_full_state()
+        additional = new_width - self.width
+
+        if self.expand_side == 'right':
+            # 扩展右侧：高位补零，掩码不变
+            for codes in self.types:
+                codes.extend(bytes(additional))
+            self.heights.extend([len(self.rows)] * additional)
+            self.expand_side = 'left'
+        else:
+            # 扩展左侧：现有方块整体左移一位（即向右偏移一列）
+            self.rows = [mask << 1 for mask in self.rows]
+            for codes in self.types:
+                codes.insert(0, 0)
+            self.heights.insert(0, len(self.rows))
+            self.left_offset += 1
+            self.expand_side = 'right'
+
+        self.width = new_width
+        self.full_mask = (1 << self.width) - 1
+        self.version += 1
+        self.config.update_width(new_width, left_offset=self.left_offset)
+
+    def count_cells(self) -> int:
+        """统计已占用的格子数（逐行位计数）"""
+        return sum(mask.bit_count() for mask in self.rows)
+
+    def row_masks(self) -> List[int]:
+        """每行的占用掩码（直接返回内部行掩码，调用方不得修改）"""
+        return self.rows
+
+    def get_row(self, y: int) -> List[Optional[str]]:
+        """获取指定行"""
+        if 0 <= y < len(self.types):
+            return [TYPE_NAMES[code] for code in self.types[y]]
+        return []
+
+    def copy(self) -> 'BitBoard':
+        """复制游戏板"""
+        new_board = BitBoard.__new__(BitBoard)
+        new_board.config = self.config
+        new_board.width = self.width
+        new_board.height = self.height
+        new_board.left_offset = self.left_offset
+        new_board.expand_side = self.expand_side
+        new_board.full_mask = self.full_mask
+        new_board.rows = self.rows[:]
+        new_board.types = [bytearray(codes) for codes in self.types]
+        new_board.heights = self.heights[:]
+        new_board.version = 0
+        new_board._journal = None
+        return new_board
+
+    def _undo(self, entry: Tuple[Any, ...]) -> None:
+        """撤销一条日志记录"""
+        kind = entry[0]
+        if kind == 'cells':
+            _, cells, columns = entry
+            for x, y, code in reversed(cells):
+                self.types[y][x] = code
+                if code:
+                    self.rows[y] |= 1 << x
+                else:
+                    self.rows[y] &= ~(1 << x)
+            for x, height in reversed(columns):
+                self.heights[x] = height
+        elif kind == 'clear':
+            _, rows, indices, heights = entry
+            del self.rows[:len(rows)]
+            del self.types[:len(rows)]
+            for y, (mask, codes) in zip(indices, rows):
+                self.rows.insert(y, mask)
+                self.types.insert(y, codes)
+            self.heights = heights
+        else:
+            self._restore_full_state(entry[1])
+
+    def _journal_full_state(self) -> None:
+        """整体记录当前状态（用于扩展、重置等不常见的修改）"""
+        if self._journal is not None:
+            self._journal.append(('full', (
+                self.width, self.left_offset, self.expand_side,
+                self.rows[:], [bytearray(codes) for codes in self.types], self.heights[:]
+            )))
+
+    def _restore_full_state(self, state: Tuple[Any, ...]) -> None:
+        """恢复整体记录的状态"""
+        self.width, self.left_offset, self.expand_side, self.rows, self.types, self.heights = state
+        self.full_mask = (1 << self.width) - 1
+        self.config.update_width(self.width, left_offset=self.left_offset)
+
+    @classmethod
+    def from_dict(cls, data: dict, config: Optional[GameConfig] = None) -> 'BitBoard':
+        """从字典反序列化"""
+        board = cls(config)
+        board.height = data['height']
+        board.width = data['width']
+        board.grid = data['grid']
+        return board
+
+    def to_bytes(self) -> bytes:
+        """序列化为二进制快照（行掩码和类型编码直接写出）"""
+        return snapshot.pack_board(self.width, self.left_offset, self.expand_side, self.rows, b''.join(self.types))
+
+    def _load_snapshot(
+        self,
+        width: int,
+        left_offset: int,
+        expand_side: str,
+        masks: List[int],
+        types: List[bytearray]
+    ) -> None:
+        """载入解包后的快照数据（掩码和类型编码直接作为行存储）"""
+        self.width = width
+        self.left_offset = left_offset
+        self.expand_side = expand_side
+        self.config.update_width(width, left_offset=left_offset)
+        self.full_mask = (1 << width) - 1
+        self.rows = masks
+        self.types = types
+        self._rebuild_heights()
+        self.version += 1
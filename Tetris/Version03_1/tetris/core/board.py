@@ -1,10 +1,17 @@
 """游戏板状态管理"""
 
-from typing import List, Optional, Tuple
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any, Iterator, List, Optional, Tuple
 import random
 
 from ..config import GRID_WIDTH, GRID_HEIGHT, NEON_COLORS, GameConfig, BASE_WIDTH
-from .tetromino import Tetromino
+from .tetromino import Tetromino, TYPE_CODES, TYPE_NAMES
+from . import snapshot
+
+# 格子内容 -> 类型编码（空格为 0）
+_CELL_CODES = {None: 0, **TYPE_CODES}
 
 
 class Board:
@@ -21,6 +28,12 @@ class Board:
             [None for _ in range(self.width)]
             for _ in range(self.height + 2)
         ]
+        # 列表面缓存：每列最上方方块所在行（空列为 height + 2）
+        self.heights: List[int] = [self.height + 2] * self.width
+        # 修改计数（用于外部缓存失效判断）
+        self.version = 0
+        # 撤销日志（仅在 checkpoint 之后记录，None 表示未启用）
+        self._journal: Optional[List[Tuple[Any, ...]]] = None
 
     def get_grid(self) -> List[List[Optional[str]]]:
         """获取网格数据"""
@@ -35,16 +48,23 @@ class Board:
     def set_cell(self, x: int, y: int, value: Optional[str]) -> None:
         """设置指定格子的内容"""
         if 0 <= y < len(self.grid) and 0 <= x < self.width:
+            if self._journal is not None:
+                self._journal.append(('cells', [(x, y, self.grid[y][x])], [(x, self.heights[x])]))
             self.grid[y][x] = value
+            self._update_column_height(x)
+            self.version += 1
 
     def is_valid_position(self, piece: Tetromino, dx: int = 0, dy: int = 0) -> bool:
         """检查方块位置是否有效"""
-        for x, y in piece.get_blocks():
-            nx, ny = x + dx, y + dy
+        base_x = piece.x + dx
+        base_y = piece.y + dy
+        limit = self.height + 2
+        for cx, cy in piece.get_shape().cells:
+            nx, ny = base_x + cx, base_y + cy
             # 检查边界
             if nx < 0 or nx >= self.width:
                 return False
-            if ny >= self.height + 2:
+            if ny >= limit:
                 return False
             # 检查碰撞
             if ny >= 0 and self.grid[ny][nx] is not None:
@@ -53,21 +73,89 @@ class Board:
 
     def place_piece(self, piece: Tetromino) -> None:
         """放置方块到网格"""
+        heights = self.heights
+        journal = self._journal
+        if journal is not None:
+            cells, columns = [], []
+            journal.append(('cells', cells, columns))
         for x, y in piece.get_blocks():
             if 0 <= y < self.height + 2 and 0 <= x < self.width:
+                if journal is not None:
+                    cells.append((x, y, self.grid[y][x]))
+                    columns.append((x, heights[x]))
                 self.grid[y][x] = piece.type
+                if y < heights[x]:
+                    heights[x] = y
+        self.version += 1
+
+    def drop_distance(self, piece: Tetromino) -> int:
+        """计算方块还能下落的格数（利用列表面缓存和方块底部轮廓一次求出）"""
+        heights = self.heights
+        distance = None
+        for dx, dy in piece.get_shape().bottom:
+            x = piece.x + dx
+            bottom_y = piece.y + dy
+            if not 0 <= x < self.width or bottom_y >= heights[x]:
+                # 方块位于该列表面以下（如悬空方块下方），退回逐行检测
+                return self._probe_drop_distance(piece)
+            column_distance = heights[x] - 1 - bottom_y
+            if distance is None or column_distance < distance:
+                distance = column_distance
+        return max(0, distance or 0)
+
+    def _probe_drop_distance(self, piece: Tetromino) -> int:
+        """逐行检测下落距离"""
+        distance = 0
+        while self.is_valid_position(piece, 0, distance + 1):
+            distance += 1
+        return distance
+
+    def _update_column_height(self, x: int) -> None:
+        """重新计算单列表面"""
+        for y, row in enumerate(self.grid):
+            if row[x] is not None:
+                self.heights[x] = y
+                return
+        self.heights[x] = len(self.grid)
+
+    def _rebuild_heights(self) -> None:
+        """重新计算所有列表面"""
+        self.heights = [len(self.grid)] * self.width
+        for x in range(self.width):
+            self._update_column_height(x)
+
+    def _shift_heights(self, cleared: List[int]) -> None:
+        """
+        消行后增量更新列表面：表面行未被消除的列只需下移（其下方被消除的行数），
+        表面恰好在被消除行上的列才重新扫描
+        """
+        limit = len(self.grid)
+        cleared_set = set(cleared)
+        heights = self.heights[:]
+        rescan = []
+        for x, top in enumerate(heights):
+            if top >= limit:
+                continue
+            if top in cleared_set:
+                rescan.append(x)
+            else:
+                heights[x] = top + len(cleared) - bisect_right(cleared, top)
+        self.heights = heights
+        for x in rescan:
+            self._update_column_height(x)
 
     def clear_lines(self) -> Tuple[int, List[int]]:
         """清除完整行，返回清除的行数和行号列表"""
-        lines_to_clear = []
-        for y in range(self.height + 2):
-            if all(self.grid[y][x] is not None for x in range(self.width)):
-                lines_to_clear.append(y)
+        lines_to_clear = [y for y, row in enumerate(self.grid) if None not in row]
 
         if lines_to_clear:
+            if self._journal is not None:
+                self._journal.append(('clear', [self.grid[y] for y in lines_to_clear], lines_to_clear, self.heights))
             for y in lines_to_clear:
                 del self.grid[y]
                 self.grid.insert(0, [None for _ in range(self.width)])
+            self._shift_heights(lines_to_clear)
+            self.version += 1
 
         return len(lines_to_clear), lines_to_clear
 
@@ -82,6 +170,7 @@ class Board:
 
     def reset(self) -> None:
         """重置游戏板（恢复初始宽度）"""
+        self._journal_full_state()
         self.width = self.config.initial_width
         self.left_offset = 0
         self.expand_side = 'right'
@@ -90,28 +179,45 @@ class Board:
             [None for _ in range(self.width)]
             for _ in range(self.height + 2)
         ]
+        self.heights = [self.height + 2] * self.width
+        self.version += 1
 
     def expand_width(self, new_width: int) -> None:
         """扩展棋盘宽度（左右交替：先右侧，再左侧）"""
         if new_width <= self.width:
             return
+        self._journal_full_state()
         additional = new_width - self.width
 
         if self.expand_side == 'right':
             # 扩展右侧
             for row in self.grid:
                 row.extend([None for _ in range(additional)])
+            self.heights.extend([len(self.grid)] * additional)
             self.expand_side = 'left'
         else:
             # 扩展左侧：在每行开头插入空格，现有方块位置向右偏移
             for row in self.grid:
                 row.insert(0, None)
+            self.heights.insert(0, len(self.grid))
             self.left_offset += 1
             self.expand_side = 'right'
 
         self.width = new_width
+        self.version += 1
         self.config.update_width(new_width, left_offset=self.left_offset)
 
+    def count_cells(self) -> int:
+        """统计已占用的格子数"""
+        return sum(len(row) - row.count(None) for row in self.grid)
+
+    def row_masks(self) -> List[int]:
+        """每行的占用掩码（第x位表示第x列），供搜索在不修改棋盘的情况下评估落点"""
+        return [
+            sum(1 << x for x, cell in enumerate(row) if cell is not None)
+            for row in self.grid
+        ]
+
     def get_expand_side(self) -> str:
         """获取下一次扩展的方向"""
         return self.expand_side
@@ -122,10 +228,88 @@ class Board:
             return self.grid[y]
         return []
 
+    def checkpoint(self) -> int:
+        """开始（或继续）记录撤销日志，返回可传给 rollback 的标记"""
+        if self._journal is None:
+            self._journal = []
+        return len(self._journal)
+
+    def rollback(self, mark: int = 0) -> None:
+        """撤销 mark 之后的所有修改（代价与期间改动的格子和行数成正比）"""
+        journal = self._journal
+        if journal is None:
+            return
+        while len(journal) > mark:
+            self._undo(journal.pop())
+        # 版本号只增不减，避免外部缓存把撤销前后的不同状态当成同一版本
+        self.version += 1
+
+    def release(self) -> None:
+        """停止记录并丢弃撤销日志（保留当前修改）"""
+        self._journal = None
+
+    @contextmanager
+    def speculate(self) -> Iterator['Board']:
+        """
+        试探性修改棋盘，退出时自动撤销（用于搜索落点、提示等）
+
+            with board.speculate():
+                board.place_piece(piece)
+                lines, _ = board.clear_lines()
+                score = evaluate(board)
+        """
+        outermost = self._journal is None
+        mark = self.checkpoint()
+        try:
+            yield self
+        finally:
+            self.rollback(mark)
+            if outermost:
+                self._journal = None
+
+    def _undo(self, entry: Tuple[Any, ...]) -> None:
+        """撤销一条日志记录"""
+        kind = entry[0]
+        if kind == 'cells':
+            _, cells, columns = entry
+            for x, y, value in reversed(cells):
+                self.grid[y][x] = value
+            for x, height in reversed(columns):
+                self.heights[x] = height
+        elif kind == 'clear':
+            _, rows, indices, heights = entry
+            del self.grid[:len(rows)]
+            for y, row in zip(indices, rows):
+                self.grid.insert(y, row)
+            self.heights = heights
+        else:
+            self._restore_full_state(entry[1])
+
+    def _journal_full_state(self) -> None:
+        """整体记录当前状态（用于扩展、重置等不常见的修改）"""
+        if self._journal is not None:
+            self._journal.append(('full', (
+                self.width, self.left_offset, self.expand_side,
+                [row[:] for row in self.grid], self.heights[:]
+            )))
+
+    def _restore_full_state(self, state: Tuple[Any, ...]) -> None:
+        """恢复整体记录的状态"""
+        self.width, self.left_offset, self.expand_side, self.grid, self.heights = state
+        self.config.update_width(self.width, left_offset=self.left_offset)
+
     def copy(self) -> 'Board':
-        """复制游戏板"""
-        new_board = Board(self.config)
+        """复制游戏板（不经过 __init__，避免先分配一遍空网格）"""
+        new_board = Board.__new__(Board)
+        new_board.config = self.config
+        new_board.width = self.width
+        new_board.height = self.height
+        new_board.left_offset = self.left_offset
+        new_board.expand_side = self.expand_side
         new_board.grid = [row[:] for row in self.grid]
+        new_board.heights = self.heights[:]
+        new_board.version = 0
+        new_board._journal = None
         return new_board
 
     def to_dict(self) -> dict:
@@ -142,5 +326,38 @@ class Board:
         board = cls(config)
         board.width = data['width']
         board.height = data['height']
-        board.grid = data['grid']
-        return board
\ No newline at end of file
+        # 复制行数据，避免与调用方共享网格
+        board.grid = [list(row) for row in data['grid']]
+        board._rebuild_heights()
+        return board
+
+    def to_bytes(self) -> bytes:
+        """序列化为二进制快照（行掩码 + 类型半字节）"""
+        width = self.width
+        codes = bytes(map(_CELL_CODES.get, chain.from_iterable(self.grid)))
+        masks = [snapshot.codes_to_mask(codes[y:y + width]) for y in range(0, len(codes), width)]
+        return snapshot.pack_board(width, self.left_offset, self.expand_side, masks, codes)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, config: Optional[GameConfig] = None) -> 'Board':
+        """从二进制快照反序列化（同步配置中的棋盘宽度）"""
+        board = cls(config)
+        board._load_snapshot(*snapshot.unpack_board(data))
+        return board
+
+    def _load_snapshot(
+        self,
+        width: int,
+        left_offset: int,
+        expand_side: str,
+        masks: List[int],
+        types: List[bytearray]
+    ) -> None:
+        """载入解包后的快照数据"""
+        self.width = width
+        self.left_offset = left_offset
+        self.expand_side = expand_side
+        self.config.update_width(width, left_offset=left_offset)
+        self.grid = [list(map(TYPE_NAMES.__getitem__, row)) for row in types]
+        self._rebuild_heights()
+        self.version += 1
\ No newline at end of file
@@ -1,15 +1,35 @@
 """游戏引擎 - 核心逻辑"""
 
-from typing import Optional, List, Tuple, Callable, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Tuple, Callable, Dict, Any
 import random
 import math
+import struct
 
 from ..config import GRID_WIDTH, GRID_HEIGHT, BOARD_X, BOARD_Y, GRID_SIZE, NEON_COLORS, GameConfig, get_width_for_level
-from ..audio import SoundManager
+from .actions import Action
 from .board import Board
+from .bitboard import BitBoard
 from .tetromino import Tetromino
+from .randomizer import Randomizer, create_randomizer, normalize_seed, randomizer_from_state, randomizer_from_bytes
 from .scoring import ScoringSystem
 from .game_state import GameState, StateMachine
+from .trails import TrailBuffer
+from . import snapshot
+
+if TYPE_CHECKING:
+    from ..audio import SoundManager
+
+# 可选的棋盘实现（通过 GameConfig.board_engine 选择）
+BOARD_ENGINES = {
+    'grid': Board,
+    'bitboard': BitBoard,
+}
+
+
+# 二进制快照头部：魔数 | 版本 | 帧数 | 重力帧计数 | 下落计时 | 游戏时间 |
+# 升级暂停 | 升级特效帧 | 消行闪烁帧 | 游戏结束 | 种子
+SNAPSHOT_MAGIC = b'TSNP'
+_SNAPSHOT_HEADER = struct.Struct('<4sBIIddBHHBQ')
 
 
 class Event:
@@ -46,6 +66,8 @@ class GameEngineEvents:
         self.level_up = Event()       # 升级
         self.combo_changed = Event()  # 连击变化
         self.game_over = Event()      # 游戏结束
+        self.gravity_applied = Event()  # 重力下落一次
+        self.game_reset = Event()     # 新一局开始
 
 
 class GameEngine:
@@ -54,21 +76,30 @@ class GameEngine:
     def __init__(
         self,
         config: Optional[GameConfig] = None,
-        sound_manager: Optional[SoundManager] = None
+        sound_manager: Optional['SoundManager'] = None,
+        headless: bool = False
     ):
         self.config = config or GameConfig()
-        self.board = Board(self.config)
+        self.board = self._create_board()
         self.scoring = ScoringSystem()
-        self.sound_manager = sound_manager
+        # 无头模式：不播放音效、不生成拖影和震动等特效数据
+        self.headless = headless
+        self.sound_manager = None if headless else sound_manager
         self.events = GameEngineEvents()
 
         # 方块相关
         self.current_piece: Optional[Tetromino] = None
-        self.next_piece: Optional[Tetromino] = None
+        self.next_queue: List[Tetromino] = []  # 预览队列（队首为下一个方块）
+        self.seed: Optional[int] = None
+        self.randomizer: Optional[Randomizer] = None
 
         # 时间相关
         self.fall_timer = 0
         self.level_up_pause = False
+        self.frame = 0        # 已推进的逻辑帧数
+        self.play_time = 0.0  # 本局累计游戏时间（秒，update 模式）
+        self.fall_frames = 0  # 距上次重力下落的帧数（tick）
+        self.game_over = False
 
         # 特效状态（供外部特效系统使用）
         self.clear_flash_lines: List[int] = []
@@ -76,13 +107,22 @@ class GameEngine:
         self.shake_offset = [0, 0]
         self.level_up_effect = 0
 
-        # 拖影
-        self.trail_positions: List[Tuple[float, float, Tuple[int, int, int], float]] = []
+        # 拖影（环形缓冲区，只由 update_effects 老化）
+        self.trail_positions = TrailBuffer()
+
+        # 幽灵方块缓存（棋盘或方块变化时失效）
+        self._ghost_key: Optional[Tuple] = None
+        self._ghost_positions: List[Tuple[int, int]] = []
 
         # 初始化
         self.scoring.set_level_up_callback(self._on_level_up)
         self.reset()
 
+    def _create_board(self) -> Board:
+        """根据配置创建棋盘"""
+        board_class = BOARD_ENGINES.get(self.config.board_engine, Board)
+        return board_class(self.config)
+
     def _on_level_up(self, new_level: int) -> None:
         """升级时扩展棋盘"""
         new_width = get_width_for_level(new_level)
@@ -94,35 +134,54 @@ class GameEngine:
                     self.current_piece.x += 1
             self.board.expand_width(new_width)
 
+    @property
+    def next_piece(self) -> Optional[Tetromino]:
+        """下一个方块（预览队列队首）"""
+        return self.next_queue[0] if self.next_queue else None
+
     def reset(self) -> None:
         """重置游戏"""
         self.board.reset()
         self.scoring.reset()
+        # 固定种子时每局序列相同，否则每局重新取种子
+        self.seed = normalize_seed(self.config.seed)
+        self.randomizer = create_randomizer(self.config.randomizer, self.seed)
         self.current_piece = None
-        self.next_piece = self._new_piece()
+        self.next_queue = []
+        self._fill_queue()
         self._spawn_piece()
         self.fall_timer = 0
         self.level_up_pause = False
+        self.frame = 0
+        self.play_time = 0.0
+        self.fall_frames = 0
+        self.game_over = False
         self.clear_flash_lines = []
         self.clear_flash_timer = 0
         self.shake_offset = [0, 0]
         self.level_up_effect = 0
-        self.trail_positions = []
+        self.trail_positions.clear()
+        self.events.game_reset.emit(self.seed)
 
     def _new_piece(self) -> Tetromino:
         """生成新方块"""
-        return Tetromino.random_piece(self.config)
+        return Tetromino(self.randomizer.next_type(), self.config)
+
+    def _fill_queue(self) -> None:
+        """补满预览队列"""
+        while len(self.next_queue) < self.config.preview_count:
+            self.next_queue.append(self._new_piece())
 
     def _spawn_piece(self) -> bool:
         """放置方块"""
-        self.current_piece = self.next_piece
+        self.current_piece = self.next_queue.pop(0)
         # 计算方块居中位置
         min_x, max_x, min_y, max_y = self.current_piece.get_bounds()
         piece_width = max_x - min_x + 1
         center_x = (self.board.width - piece_width) // 2 - min_x
         self.current_piece.x = center_x
         self.current_piece.y = 0
-        self.next_piece = self._new_piece()
+        self._fill_queue()
 
         # 检查是否可以放置
         for x, y in self.current_piece.get_blocks():
@@ -141,7 +200,7 @@ class GameEngine:
         is_player_move: bool = False
     ) -> bool:
         """移动方块"""
-        if not self.current_piece:
+        if not self.current_piece or self.game_over:
             return False
 
         if self.board.is_valid_position(self.current_piece, dx, dy):
@@ -149,20 +208,8 @@ class GameEngine:
             self.current_piece.y += dy
 
             # 添加拖影
-            if dy > 0 and add_trail:
-                columns = {}
-                for x, y in self.current_piece.get_blocks():
-                    if x not in columns or y > columns[x]:
-                        columns[x] = y
-                for x, y in columns.items():
-                    self.trail_positions.append(
-                        (
-                            self.config.board_x + x * self.config.grid_size + self.config.grid_size // 2,
-                            self.config.board_y + (y - 2) * self.config.grid_size + self.config.grid_size // 2,
-                            self.current_piece.color,
-                            1.0
-                        )
-                    )
+            if dy > 0 and add_trail and not self.headless:
+                self._add_trail()
 
             # 播放音效
             if self.sound_manager:
@@ -175,9 +222,22 @@ class GameEngine:
             return True
         return False
 
+    def _add_trail(self) -> None:
+        """在当前方块每列最低格处添加拖影"""
+        piece = self.current_piece
+        grid_size = self.config.grid_size
+        for dx, dy in piece.get_shape().bottom:
+            x = piece.x + dx
+            y = piece.y + dy
+            self.trail_positions.add(
+                self.config.board_x + x * grid_size + grid_size // 2,
+                self.config.board_y + (y - 2) * grid_size + grid_size // 2,
+                piece.color
+            )
+
     def rotate_piece(self) -> bool:
         """旋转方块"""
-        if not self.current_piece:
+        if not self.current_piece or self.game_over:
             return False
 
         self.current_piece.rotate()
@@ -201,12 +261,16 @@ class GameEngine:
 
     def hard_drop(self) -> int:
         """硬降，返回下落距离"""
-        if not self.current_piece:
+        if not self.current_piece or self.game_over:
             return 0
 
-        drop_distance = 0
-        while self.move_piece(0, 1, add_trail=True):
-            drop_distance += 1
+        # 通过列表面缓存一次求出下落距离，逐行只生成拖影
+        drop_distance = self.board.drop_distance(self.current_piece)
+        for _ in range(drop_distance):
+            self.current_piece.y += 1
+            if not self.headless:
+                self._add_trail()
+            self.events.piece_moved.emit(0, 1)
 
         if self.sound_manager:
             self.sound_manager.play_sound('plummet')
@@ -219,12 +283,13 @@ class GameEngine:
         if not self.current_piece:
             return []
 
-        ghost_y = self.current_piece.y
-        while self.board.is_valid_position(self.current_piece, 0, ghost_y - self.current_piece.y + 1):
-            ghost_y += 1
-
-        shape = self.current_piece.shapes[self.current_piece.rotation % len(self.current_piece.shapes)]
-        return [(self.current_piece.x + dx, ghost_y + dy) for dx, dy in shape]
+        piece = self.current_piece
+        key = (self.board, self.board.version, piece.type, piece.rotation, piece.x, piece.y)
+        if key != self._ghost_key:
+            ghost_y = piece.y + self.board.drop_distance(piece)
+            self._ghost_positions = [(piece.x + dx, ghost_y + dy) for dx, dy in piece.get_shape().cells]
+            self._ghost_key = key
+        return self._ghost_positions
 
     def _lock_piece(self) -> None:
         """锁定方块"""
@@ -247,8 +312,9 @@ class GameEngine:
         else:
             self.scoring.reset_combo()
 
-        # 生成新方块
-        if not self._spawn_piece():
+        # 生成新方块（无法放置或与顶部隐藏行重叠即结束）
+        if not self._spawn_piece() or self._is_topped_out():
+            self.game_over = True
             self.events.game_over.emit()
 
     def _process_clear(self, lines_cleared: int, line_indices: List[int]) -> None:
@@ -275,14 +341,16 @@ class GameEngine:
         if self.scoring.level > old_level:
             self.level_up_effect = 45
             self.level_up_pause = True
-            self.shake_offset = [random.randint(-10, 10), random.randint(-10, 10)]
+            if not self.headless:
+                self.shake_offset = [random.randint(-10, 10), random.randint(-10, 10)]
             self.events.level_up.emit(self.scoring.level)
             if self.sound_manager:
                 self.sound_manager.play_sound('level_up')
 
         # TETRIS特效触发
         if lines_cleared == 4:
-            self.shake_offset = [random.randint(-12, 12), random.randint(-12, 12)]
+            if not self.headless:
+                self.shake_offset = [random.randint(-12, 12), random.randint(-12, 12)]
             if self.sound_manager:
                 self.sound_manager.play_sound('tetris')
 
@@ -291,45 +359,113 @@ class GameEngine:
         更新游戏状态
         返回是否成功下落（用于特效判断）
         """
+        if self.game_over:
+            return False
+        self.play_time += dt
+        self.frame = int(self.play_time * self.config.frame_rate)
+
         # 升级暂停期间使用最慢速度
         if self.level_up_pause:
             self.fall_timer += dt
             if self.fall_timer >= 1.0:
                 self.fall_timer = 0
-                if not self.move_piece(0, 1, is_natural_fall=True):
-                    self._lock_piece()
-                    return False
+                return self.gravity_step()
         else:
             self.fall_timer += dt
             if self.fall_timer >= self.scoring.fall_speed:
                 self.fall_timer = 0
-                if not self.move_piece(0, 1, is_natural_fall=True):
-                    self._lock_piece()
-                    return False
+                return self.gravity_step()
+
+        return True
 
+    def get_fall_progress(self, extra_time: float = 0.0) -> float:
+        """
+        当前方块在本次重力间隔内的下落进度（0 ~ 1，用于渲染插值）
+        extra_time 为上一次逻辑更新之后经过的时间；方块已着地时为 0
+        """
+        piece = self.current_piece
+        if not piece or self.game_over or self.board.drop_distance(piece) == 0:
+            return 0.0
+        interval = 1.0 if self.level_up_pause else self.scoring.fall_speed
+        return min(1.0, max(0.0, (self.fall_timer + extra_time) / interval))
+
+    # ==================== 定步长（无头模式）====================
+
+    def gravity_step(self) -> bool:
+        """执行一次重力下落，无法下落时锁定方块；返回是否成功下落"""
+        self.events.gravity_applied.emit()
+        if not self.move_piece(0, 1, is_natural_fall=True):
+            self._lock_piece()
+            return False
         return True
 
-    def update_effects(self) -> None:
-        """更新特效状态"""
+    def get_gravity_frames(self) -> int:
+        """当前重力间隔（帧）"""
+        seconds = 1.0 if self.level_up_pause else self.scoring.fall_speed
+        return max(1, round(seconds * self.config.frame_rate))
+
+    def tick(self, frames: int = 1) -> bool:
+        """
+        按整数帧推进游戏（与墙钟无关，结果可复现）
+        返回游戏是否仍在进行
+        """
+        for _ in range(frames):
+            if self.game_over:
+                break
+            self.frame += 1
+            self.fall_frames += 1
+            if self.fall_frames >= self.get_gravity_frames():
+                self.fall_frames = 0
+                self.gravity_step()
+            self.update_effects()
+        return not self.game_over
+
+    def apply_action(self, action: Action) -> bool:
+        """执行一个操作，返回操作是否生效"""
+        if self.game_over:
+            return False
+        if action == Action.LEFT:
+            return self.move_piece(-1, 0, is_player_move=True)
+        if action == Action.RIGHT:
+            return self.move_piece(1, 0, is_player_move=True)
+        if action == Action.DOWN:
+            return self.move_piece(0, 1, add_trail=True, is_player_move=True)
+        if action == Action.ROTATE:
+            return self.rotate_piece()
+        if action == Action.HARD_DROP:
+            self.hard_drop()
+            return True
+        if action == Action.GRAVITY:
+            self.gravity_step()
+            return True
+        return False
+
+    def step(self, action: Action = Action.NONE) -> bool:
+        """执行一个操作并推进一帧，返回游戏是否仍在进行"""
+        self.apply_action(action)
+        return self.tick(1)
+
+    def update_effects(self, frames: int = 1) -> None:
+        """更新特效状态（计时器按逻辑帧计数，frames 为本次经过的帧数）"""
+        if frames <= 0:
+            return
+        self.trail_positions.age(frames)
+
         if self.clear_flash_timer > 0:
-            self.clear_flash_timer -= 1
+            self.clear_flash_timer = max(0, self.clear_flash_timer - frames)
 
         if self.level_up_effect > 0:
-            self.level_up_effect -= 1
+            self.level_up_effect = max(0, self.level_up_effect - frames)
 
         if self.level_up_effect <= 0 and self.level_up_pause:
             self.level_up_pause = False
 
-        # 更新拖影
-        new_trails = []
-        for x, y, color, life in self.trail_positions:
-            if life > 0:
-                new_trails.append((x, y, color, life - 0.05))
-        self.trail_positions = new_trails
-
     def is_game_over(self) -> bool:
-        """是否游戏结束"""
-        # 检查当前方块是否能放置
+        """是否游戏结束（实时游戏、AI 和回放统一以 game_over 标志为准）"""
+        return self.game_over
+
+    def _is_topped_out(self) -> bool:
+        """当前方块是否与顶部已有方块重叠"""
         if self.current_piece:
             for x, y in self.current_piece.get_blocks():
                 if y >= 0 and self.board.get_cell(x, y) is not None:
@@ -342,20 +478,102 @@ class GameEngine:
             'board': self.board.to_dict(),
             'current_piece': self.current_piece.to_dict() if self.current_piece else None,
             'next_piece_type': self.next_piece.type if self.next_piece else None,
+            'next_queue': [piece.type for piece in self.next_queue],
+            'randomizer': self.randomizer.get_state(),
             'scoring': self.scoring.to_dict(),
             'fall_timer': self.fall_timer,
+            'game_over': self.game_over,
         }
 
     def restore_state(self, data: Dict[str, Any]) -> None:
         """恢复状态数据"""
-        self.board = Board.from_dict(data['board'], self.config)
+        self.board = type(self.board).from_dict(data['board'], self.config)
         if data['current_piece']:
             self.current_piece = Tetromino.from_dict(data['current_piece'], self.config)
         else:
             self.current_piece = None
-        if data['next_piece_type']:
-            self.next_piece = Tetromino(data['next_piece_type'], self.config)
+        if data.get('randomizer'):
+            self.randomizer = randomizer_from_state(data['randomizer'])
+            self.seed = self.randomizer.seed
+        if data.get('next_queue'):
+            self.next_queue = [Tetromino(piece_type, self.config) for piece_type in data['next_queue']]
+        elif data['next_piece_type']:
+            self.next_queue = [Tetromino(data['next_piece_type'], self.config)]
         else:
-            self.next_piece = self._new_piece()
+            self.next_queue = []
+        self._fill_queue()
         self.scoring = ScoringSystem.from_dict(data['scoring'])
-        self.fall_timer = data['fall_timer']
\ No newline at end of file
+        self.scoring.set_level_up_callback(self._on_level_up)
+        self.fall_timer = data['fall_timer']
+        self.game_over = data.get('game_over', False)
+
+    def to_bytes(self) -> bytes:
+        """获取二进制快照（比 get_state_data 更紧凑，包含计时器和完整随机器状态）"""
+        header = _SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, snapshot.SNAPSHOT_VERSION,
+            self.frame, self.fall_frames, self.fall_timer, self.play_time,
+            self.level_up_pause, self.level_up_effect, self.clear_flash_timer,
+            self.game_over, self.seed or 0
+        )
+        return b''.join((
+            header,
+            snapshot.pack_section(self.board.to_bytes()),
+            snapshot.pack_section(self.scoring.to_bytes()),
+            snapshot.pack_section(self.current_piece.to_bytes() if self.current_piece else b''),
+            snapshot.pack_section(snapshot.pack_type_list([piece.type for piece in self.next_queue])),
+            snapshot.pack_section(self.randomizer.to_bytes() if self.randomizer else b''),
+            snapshot.pack_section(bytes(self.clear_flash_lines)),
+        ))
+
+    def restore_bytes(self, data: bytes) -> None:
+        """从二进制快照恢复状态"""
+        (magic, version, frame, fall_frames, fall_timer, play_time,
+         level_up_pause, level_up_effect, clear_flash_timer,
+         game_over, seed) = _SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("不是有效的快照数据")
+        if version > snapshot.SNAPSHOT_VERSION:
+            raise ValueError(f"不支持的快照版本: {version}")
+
+        pos = _SNAPSHOT_HEADER.size
+        board_data, pos = snapshot.unpack_section(data, pos)
+        scoring_data, pos = snapshot.unpack_section(data, pos)
+        piece_data, pos = snapshot.unpack_section(data, pos)
+        queue_data, pos = snapshot.unpack_section(data, pos)
+        randomizer_data, pos = snapshot.unpack_section(data, pos)
+        flash_data, pos = snapshot.unpack_section(data, pos)
+
+        self.board = type(self.board).from_bytes(board_data, self.config)
+        self.scoring = ScoringSystem.from_bytes(scoring_data, version)
+        self.scoring.set_level_up_callback(self._on_level_up)
+        self.current_piece = Tetromino.from_bytes(piece_data, self.config) if piece_data else None
+        queue_types, _ = snapshot.unpack_type_list(queue_data, 0)
+        self.next_queue = [Tetromino(piece_type, self.config) for piece_type in queue_types]
+        if randomizer_data:
+            self.randomizer = randomizer_from_bytes(randomizer_data)
+        self.seed = seed
+        self._fill_queue()
+
+        self.frame = frame
+        self.fall_frames = fall_frames
+        self.fall_timer = fall_timer
+        self.play_time = play_time
+        self.level_up_pause = bool(level_up_pause)
+        self.level_up_effect = level_up_effect
+        self.clear_flash_timer = clear_flash_timer
+        self.clear_flash_lines = list(flash_data)
+        self.game_over = bool(game_over)
+        self.trail_positions.clear()
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        config: Optional[GameConfig] = None,
+        sound_manager: Optional['SoundManager'] = None,
+        headless: bool = False
+    ) -> 'GameEngine':
+        """从二进制快照创建引擎"""
+        engine = cls(config, sound_manager, headless)
+        engine.restore_bytes(data)
+        return engine
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""方块随机器 - 可插拔的出块序列生成"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+from array import array
+import random
+import struct
+import sys
+
+from ..config import SHAPES
+from .snapshot import pack_type_list, unpack_type_list
+
+# 二进制状态头部：随机器编码 | 种子 | 是否有缓存的高斯值 | 高斯值
+_STATE_HEADER = struct.Struct('<BQBd')
+# Mersenne Twister 内部状态长度（624 个字 + 位置索引）
+_MT_STATE_WORDS = 625
+# 种子位数（随机器状态、引擎快照和回放均按无符号 64 位保存种子）
+SEED_BITS = 64
+
+
+def normalize_seed(seed: Optional[int] = None) -> int:
+    """把种子规整到无符号 64 位范围（负数和超出范围的种子取模），None 时随机取一个"""
+    if seed is None:
+        return random.randrange(2 ** 32)
+    return seed % (1 << SEED_BITS)
+
+
+class Randomizer(ABC):
+    """随机器基类 - 持有独立的种子随机数生成器，不影响全局 random；子类必须实现 next_type"""
+
+    name = 'base'
+
+    def __init__(self, seed: Optional[int] = None, piece_types: Optional[Sequence[str]] = None):
+        self.seed = normalize_seed(seed)
+        self.piece_types: List[str] = list(piece_types or SHAPES.keys())
+        self.rng = random.Random(self.seed)
+
+    @abstractmethod
+    def next_type(self) -> str:
+        """生成下一个方块类型"""
+
+    def get_state(self) -> Dict[str, Any]:
+        """获取状态（可JSON序列化）"""
+        version, internal, gauss_next = self.rng.getstate()
+        return {
+            'name': self.name,
+            'seed': self.seed,
+            'rng': [version, list(internal), gauss_next],
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """恢复状态"""
+        self.seed = state['seed']
+        version, internal, gauss_next = state['rng']
+        self.rng.setstate((version, tuple(internal), gauss_next))
+
+    def _get_pending(self) -> List[str]:
+        """待发出或影响后续出块的方块类型（袋/历史记录），子类覆盖"""
+        return []
+
+    def _set_pending(self, piece_types: List[str]) -> None:
+        """恢复待发出的方块类型，子类覆盖"""
+
+    def to_bytes(self) -> bytes:
+        """序列化为二进制状态"""
+        _, internal, gauss_next = self.rng.getstate()
+        words = array('I', internal)
+        if sys.byteorder == 'big':
+            words.byteswap()
+        return b''.join((
+            _STATE_HEADER.pack(
+                list(RANDOMIZERS).index(self.name) if self.name in RANDOMIZERS else 0,
+                self.seed, gauss_next is not None, gauss_next or 0.0
+            ),
+            words.tobytes(),
+            pack_type_list(self._get_pending()),
+        ))
+
+
+class PureRandomizer(Randomizer):
+    """纯随机：每次独立等概率抽取"""
+
+    name = 'random'
+
+    def next_type(self) -> str:
+        return self.rng.choice(self.piece_types)
+
+
+class BagRandomizer(Randomizer):
+    """袋式随机：每袋包含每种方块各 copies 个，打乱后依次发出"""
+
+    name = 'bag7'
+    copies = 1
+
+    def __init__(self, seed: Optional[int] = None, piece_types: Optional[Sequence[str]] = None):
+        super().__init__(seed, piece_types)
+        self.bag: List[str] = []
+
+    def next_type(self) -> str:
+        if not self.bag:
+            self.bag = self.piece_types * self.copies
+            self.rng.shuffle(self.bag)
+        return self.bag.pop()
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+        state['bag'] = list(self.bag)
+        return state
+
+    def _get_pending(self) -> List[str]:
+        return self.bag
+
+    def _set_pending(self, piece_types: List[str]) -> None:
+        self.bag = list(piece_types)
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        super().set_state(state)
+        self.bag = list(state.get('bag', []))
+
+
+class DoubleBagRandomizer(BagRandomizer):
+    """14袋随机：每袋包含每种方块各两个"""
+
+    name = 'bag14'
+    copies = 2
+
+
+class HistoryRandomizer(Randomizer):
+    """历史随机：最多重抽 rolls 次，尽量避开最近 history_size 个方块"""
+
+    name = 'history'
+    history_size = 4
+    rolls = 4
+
+    def __init__(self, seed: Optional[int] = None, piece_types: Optional[Sequence[str]] = None):
+        super().__init__(seed, piece_types)
+        self.history: List[str] = self._initial_history()
+
+    def _initial_history(self) -> List[str]:
+        """初始历史（使开局不易出现 S/Z）"""
+        initial = [t for t in ('Z', 'S') if t in self.piece_types] or self.piece_types[:1]
+        return [initial[i % len(initial)] for i in range(self.history_size)]
+
+    def next_type(self) -> str:
+        piece_type = self.rng.choice(self.piece_types)
+        for _ in range(self.rolls - 1):
+            if piece_type not in self.history:
+                break
+            piece_type = self.rng.choice(self.piece_types)
+        self.history.pop(0)
+        self.history.append(piece_type)
+        return piece_type
+
+    def get_state(self) -> Dict[str, Any]:
+        state = super().get_state()
+        state['history'] = list(self.history)
+        return state
+
+    def _get_pending(self) -> List[str]:
+        return self.history
+
+    def _set_pending(self, piece_types: List[str]) -> None:
+        self.history = list(piece_types)
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        super().set_state(state)
+        self.history = list(state.get('history', self._initial_history()))
+
+
+# 可选的随机器（通过 GameConfig.randomizer 选择）
+RANDOMIZERS = {
+    PureRandomizer.name: PureRandomizer,
+    BagRandomizer.name: BagRandomizer,
+    DoubleBagRandomizer.name: DoubleBagRandomizer,
+    HistoryRandomizer.name: HistoryRandomizer,
+}
+
+
+def create_randomizer(name: str = 'random', seed: Optional[int] = None) -> Randomizer:
+    """按名称创建随机器（未知名称退回纯随机）"""
+    randomizer_class = RANDOMIZERS.get(name, PureRandomizer)
+    return randomizer_class(seed)
+
+
+def randomizer_from_state(state: Dict[str, Any]) -> Randomizer:
+    """从状态数据重建随机器"""
+    randomizer = create_randomizer(state.get('name', 'random'), state['seed'])
+    randomizer.set_state(state)
+    return randomizer
+
+
+def randomizer_from_bytes(data: bytes) -> Randomizer:
+    """从二进制状态重建随机器"""
+    name_code, seed, has_gauss, gauss_next = _STATE_HEADER.unpack_from(data, 0)
+    pos = _STATE_HEADER.size
+    words = array('I')
+    words.frombytes(data[pos:pos + _MT_STATE_WORDS * words.itemsize])
+    if sys.byteorder == 'big':
+        words.byteswap()
+    pending, _ = unpack_type_list(data, pos + _MT_STATE_WORDS * words.itemsize)
+
+    names = list(RANDOMIZERS)
+    randomizer = create_randomizer(names[name_code] if name_code < len(names) else 'random', seed)
+    randomizer.rng.setstate((3, tuple(words), gauss_next if has_gauss else None))
+    randomizer._set_pending(pending)
+    return randomizer
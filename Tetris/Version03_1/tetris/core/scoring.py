@@ -1,7 +1,15 @@
 """计分系统"""
 
 from typing import Optional, Callable
+import struct
+
 from .tetromino import Tetromino
+from .snapshot import SNAPSHOT_VERSION, pack_uint, unpack_uint
+
+# 二进制格式：行数 | 等级 | 连击 | 下落速度 | 每级行数 | 分数（不定长整数，分数按等级指数增长）
+_SCORING_STRUCT = struct.Struct('<IHHdH')
+# 快照版本 1 的格式：分数为 64 位
+_SCORING_STRUCT_V1 = struct.Struct('<QIHHdH')
 
 
 class ScoringSystem:
@@ -91,4 +99,23 @@ class ScoringSystem:
         scoring.level = data['level']
         scoring.combo = data['combo']
         scoring.fall_speed = data['fall_speed']
+        return scoring
+
+    def to_bytes(self) -> bytes:
+        """序列化为二进制"""
+        return _SCORING_STRUCT.pack(
+            self.lines, self.level, self.combo, self.fall_speed, self.lines_per_level
+        ) + pack_uint(self.score)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, version: int = SNAPSHOT_VERSION) -> 'ScoringSystem':
+        """从二进制反序列化（version 为快照版本）"""
+        scoring = cls()
+        if version < 2:
+            (scoring.score, scoring.lines, scoring.level, scoring.combo,
+             scoring.fall_speed, scoring.lines_per_level) = _SCORING_STRUCT_V1.unpack_from(data, 0)
+            return scoring
+        (scoring.lines, scoring.level, scoring.combo,
+         scoring.fall_speed, scoring.lines_per_level) = _SCORING_STRUCT.unpack_from(data, 0)
+        scoring.score, _ = unpack_uint(data, _SCORING_STRUCT.size)
         return scoring
\ No newline at end of file
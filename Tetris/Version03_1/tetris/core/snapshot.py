@@ -0,0 +1,119 @@
+"""二进制快照工具 - 行掩码与类型半字节的打包/解包"""
+
+from typing import List, Sequence, Tuple
+import struct
+
+from .tetromino import TYPE_CODES, TYPE_NAMES
+
+# 版本 2：计分中的分数改为不定长整数（分数按等级指数增长，可超出 64 位）
+SNAPSHOT_VERSION = 2
+
+# 棋盘头部：版本 | 宽度 | 行数 | 左侧扩展列数 | 下次扩展方向（0右1左）
+BOARD_HEADER = struct.Struct('<BHHHB')
+
+
+# 半字节查找表（bytes.translate 按字节映射，避免逐字节 Python 循环）
+_HIGH_NIBBLE = bytes(byte >> 4 for byte in range(256))
+_LOW_NIBBLE = bytes(byte & 0x0F for byte in range(256))
+_SHIFT_NIBBLE = bytes((byte << 4) & 0xFF for byte in range(256))
+# 类型编码 -> 占用位字符（0 为 '0'，其余为 '1'）
+_OCCUPIED_CHARS = b'0' + b'1' * 255
+
+
+def codes_to_mask(codes: bytes) -> int:
+    """由一行类型编码求占用掩码（第x位表示第x列）"""
+    if not codes:
+        return 0
+    return int(codes.translate(_OCCUPIED_CHARS)[::-1], 2)
+
+
+def pack_nibbles(codes: bytes) -> bytes:
+    """每两个类型编码打包为一个字节（高4位在前）"""
+    if len(codes) % 2:
+        codes += b'\x00'
+    high = codes[0::2].translate(_SHIFT_NIBBLE)
+    low = codes[1::2]
+    size = len(low)
+    return (int.from_bytes(high, 'big') | int.from_bytes(low, 'big')).to_bytes(size, 'big')
+
+
+def unpack_nibbles(data: bytes, count: int) -> bytearray:
+    """解包半字节，返回 count 个类型编码"""
+    codes = bytearray(len(data) * 2)
+    codes[0::2] = data.translate(_HIGH_NIBBLE)
+    codes[1::2] = data.translate(_LOW_NIBBLE)
+    del codes[count:]
+    return codes
+
+
+def pack_board(
+    width: int,
+    left_offset: int,
+    expand_side: str,
+    masks: Sequence[int],
+    codes: bytes
+) -> bytes:
+    """
+    打包棋盘：头部 + 每行占用掩码（定长小端）+ 每格类型半字节
+    codes 按行优先排列，每格一个类型编码（0 为空）
+    """
+    row_bytes = (width + 7) // 8
+    parts = [BOARD_HEADER.pack(SNAPSHOT_VERSION, width, len(masks), left_offset, 1 if expand_side == 'left' else 0)]
+    parts.extend(mask.to_bytes(row_bytes, 'little') for mask in masks)
+    parts.append(pack_nibbles(codes))
+    return b''.join(parts)
+
+
+def unpack_board(data: bytes) -> Tuple[int, int, str, List[int], List[bytearray]]:
+    """解包棋盘，返回 (宽度, 左侧扩展列数, 扩展方向, 行掩码, 每行类型编码)"""
+    version, width, row_count, left_offset, side = BOARD_HEADER.unpack_from(data, 0)
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(f"不支持的快照版本: {version}")
+    row_bytes = (width + 7) // 8
+    pos = BOARD_HEADER.size
+    masks = [
+        int.from_bytes(data[pos + i * row_bytes:pos + (i + 1) * row_bytes], 'little')
+        for i in range(row_count)
+    ]
+    pos += row_bytes * row_count
+
+    codes = unpack_nibbles(data[pos:], width * row_count)
+    types = [codes[y * width:(y + 1) * width] for y in range(row_count)]
+    return width, left_offset, 'left' if side else 'right', masks, types
+
+
+def pack_type_list(piece_types: Sequence[str]) -> bytes:
+    """打包方块类型列表：数量 + 每个类型一字节"""
+    return bytes([len(piece_types)]) + bytes(TYPE_CODES.get(t, 0) for t in piece_types)
+
+
+def unpack_type_list(data: bytes, pos: int) -> Tuple[List[str], int]:
+    """解包方块类型列表，返回 (类型列表, 新位置)"""
+    count = data[pos]
+    names = [TYPE_NAMES[code] for code in data[pos + 1:pos + 1 + count]]
+    return names, pos + 1 + count
+
+
+def pack_uint(value: int) -> bytes:
+    """打包任意大小的非负整数（带长度前缀的小端字节）"""
+    if value < 0:
+        raise ValueError(f"不能打包负数: {value}")
+    return pack_section(value.to_bytes((value.bit_length() + 7) // 8, 'little'))
+
+
+def unpack_uint(data: bytes, pos: int) -> Tuple[int, int]:
+    """解包 pack_uint 打包的整数，返回 (值, 新位置)"""
+    payload, pos = unpack_section(data, pos)
+    return int.from_bytes(payload, 'little'), pos
+
+
+def pack_section(payload: bytes) -> bytes:
+    """带长度前缀的数据段"""
+    return struct.pack('<I', len(payload)) + payload
+
+
+def unpack_section(data: bytes, pos: int) -> Tuple[bytes, int]:
+    """读取带长度前缀的数据段，返回 (数据, 新位置)"""
+    (length,) = struct.unpack_from('<I', data, pos)
+    pos += 4
+    return data[pos:pos + length], pos + length
@@ -1,14 +1,72 @@
 """方块类模块"""
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
 import random
-import copy
+import struct
 
-from ..config import NEON_COLORS, SHAPES, GRID_WIDTH, GameConfig
+from ..config import NEON_COLORS, SHAPES, GameConfig
+
+
+class PieceShape(NamedTuple):
+    """单个旋转状态的预计算数据"""
+    cells: Tuple[Tuple[int, int], ...]      # 方块偏移 (dx, dy)
+    bounds: Tuple[int, int, int, int]       # (最小x, 最大x, 最小y, 最大y)
+    bottom: Tuple[Tuple[int, int], ...]     # 每列最低格 (dx, dy)，按列排序
+    top: Tuple[Tuple[int, int], ...]        # 每列最高格 (dx, dy)，按列排序
+    row_masks: Tuple[Tuple[int, int], ...]  # 每行占用掩码 (dy, 掩码)，第dx位表示第dx列
+
+
+def _build_shape(shape: List[Tuple[int, int]]) -> PieceShape:
+    """根据偏移列表构建旋转状态数据"""
+    cells = tuple(shape)
+    xs = [dx for dx, _ in cells]
+    ys = [dy for _, dy in cells]
+
+    lowest: Dict[int, int] = {}
+    highest: Dict[int, int] = {}
+    row_masks: Dict[int, int] = {}
+    for dx, dy in cells:
+        if dx not in lowest or dy > lowest[dx]:
+            lowest[dx] = dy
+        if dx not in highest or dy < highest[dx]:
+            highest[dx] = dy
+        row_masks[dy] = row_masks.get(dy, 0) | (1 << dx)
+
+    return PieceShape(
+        cells=cells,
+        bounds=(min(xs), max(xs), min(ys), max(ys)),
+        bottom=tuple(sorted(lowest.items())),
+        top=tuple(sorted(highest.items())),
+        row_masks=tuple(sorted(row_masks.items())),
+    )
+
+
+def _build_piece_table() -> Dict[str, Tuple[PieceShape, ...]]:
+    """预计算所有方块类型 × 旋转状态"""
+    return {
+        piece_type: tuple(_build_shape(shape) for shape in rotations)
+        for piece_type, rotations in SHAPES.items()
+    }
+
+
+# 方块表（导入时构建一次）
+PIECE_TABLE: Dict[str, Tuple[PieceShape, ...]] = _build_piece_table()
+
+# 未知类型使用的空形状
+EMPTY_SHAPE = PieceShape(cells=(), bounds=(0, 0, 0, 0), bottom=(), top=(), row_masks=())
+
+# 方块类型编码（0 表示空格，用于紧凑存储和序列化）
+TYPE_CODES: Dict[str, int] = {piece_type: i + 1 for i, piece_type in enumerate(SHAPES)}
+TYPE_NAMES: List[Optional[str]] = [None] + list(SHAPES)
+
+# 二进制格式：类型编码 | 旋转 | x | y
+_PIECE_STRUCT = struct.Struct('<BBhh')
 
 
 class Tetromino:
-    """方块类"""
+    """方块类 - 轻量值对象，形状数据引用预计算的 PIECE_TABLE"""
+
+    __slots__ = ('type', 'rotation', 'config', 'x', 'y', 'color', 'shapes', 'table')
 
     def __init__(self, shape_type: str, config: Optional[GameConfig] = None):
         self.type = shape_type
@@ -18,24 +76,33 @@ class Tetromino:
         self.y = 0
         self.color = NEON_COLORS.get(shape_type, (255, 255, 255))
         self.shapes = SHAPES.get(shape_type, [])
+        self.table = PIECE_TABLE.get(shape_type, (EMPTY_SHAPE,))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Tetromino):
+            return NotImplemented
+        return (
+            self.type == other.type and self.rotation == other.rotation
+            and self.x == other.x and self.y == other.y
+        )
+
+    __hash__ = None  # 位置可变，不可哈希
+
+    def __repr__(self) -> str:
+        return f"Tetromino({self.type!r}, rotation={self.rotation}, x={self.x}, y={self.y})"
+
+    def get_shape(self) -> PieceShape:
+        """获取当前旋转状态的预计算数据"""
+        return self.table[self.rotation % len(self.table)]
 
     def get_blocks(self) -> List[Tuple[int, int]]:
         """获取当前旋转状态下的所有方块坐标"""
-        if not self.shapes:
-            return []
-        shape = self.shapes[self.rotation % len(self.shapes)]
-        return [(self.x + dx, self.y + dy) for dx, dy in shape]
+        x, y = self.x, self.y
+        return [(x + dx, y + dy) for dx, dy in self.table[self.rotation % len(self.table)].cells]
 
     def get_bounds(self) -> Tuple[int, int, int, int]:
         """获取方块边界（最小x, 最大x, 最小y, 最大y）"""
-        if not self.shapes:
-            return (0, 0, 0, 0)
-        shape = self.shapes[0]
-        min_x = min(dx for dx, dy in shape)
-        max_x = max(dx for dx, dy in shape)
-        min_y = min(dy for dx, dy in shape)
-        max_y = max(dy for dx, dy in shape)
-        return min_x, max_x, min_y, max_y
+        return self.table[0].bounds
 
     def rotate(self) -> None:
         """顺时针旋转"""
@@ -49,10 +116,15 @@ class Tetromino:
 
     def clone(self) -> 'Tetromino':
         """克隆方块（用于状态同步）"""
-        new_piece = Tetromino(self.type, self.config)
+        new_piece = Tetromino.__new__(Tetromino)
+        new_piece.type = self.type
         new_piece.rotation = self.rotation
+        new_piece.config = self.config
         new_piece.x = self.x
         new_piece.y = self.y
+        new_piece.color = self.color
+        new_piece.shapes = self.shapes
+        new_piece.table = self.table
         return new_piece
 
     def to_dict(self) -> dict:
@@ -73,8 +145,22 @@ class Tetromino:
         piece.y = data['y']
         return piece
 
+    def to_bytes(self) -> bytes:
+        """序列化为二进制（6字节）"""
+        return _PIECE_STRUCT.pack(TYPE_CODES.get(self.type, 0), self.rotation, self.x, self.y)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, config: Optional[GameConfig] = None) -> 'Tetromino':
+        """从二进制反序列化"""
+        code, rotation, x, y = _PIECE_STRUCT.unpack_from(data, 0)
+        piece = cls(TYPE_NAMES[code], config)
+        piece.rotation = rotation
+        piece.x = x
+        piece.y = y
+        return piece
+
     @classmethod
     def random_piece(cls, config: Optional[GameConfig] = None) -> 'Tetromino':
         """生成随机方块"""
         shape_type = random.choice(list(SHAPES.keys()))
-        return cls(shape_type, config)
\ No newline at end of file
+        return cls(shape_type, config)
@@ -0,0 +1,71 @@
+"""拖影缓冲区 - 固定容量的环形缓冲区，由引擎统一老化"""
+
+from typing import Iterator, List, Optional, Tuple
+
+TrailEntry = Tuple[float, float, Tuple[int, int, int], float]  # (x, y, 颜色, 生命)
+
+# 每次老化减少的生命值（生命从 1.0 开始，20 次老化后消失）
+TRAIL_DECAY = 0.05
+# 默认容量：硬降一次最多添加 高度 x 4 列 个拖影
+TRAIL_CAPACITY = 256
+
+
+class TrailBuffer:
+    """
+    拖影环形缓冲区
+    拖影按添加顺序存放，生命由添加时的老化计数推算，老化一次只需推进计数并丢弃最旧的过期项；
+    缓冲区满时覆盖最旧的拖影。迭代得到 (x, y, 颜色, 生命)，从旧到新
+    """
+
+    def __init__(self, capacity: int = TRAIL_CAPACITY):
+        self.capacity = capacity
+        self._x: List[float] = [0.0] * capacity
+        self._y: List[float] = [0.0] * capacity
+        self._color: List[Optional[Tuple[int, int, int]]] = [None] * capacity
+        self._birth: List[int] = [0] * capacity
+        self._start = 0
+        self._count = 0
+        self._tick = 0  # 老化次数
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def _life(self, index: int) -> float:
+        return 1.0 - TRAIL_DECAY * (self._tick - self._birth[index])
+
+    def add(self, x: float, y: float, color: Tuple[int, int, int]) -> None:
+        """添加拖影（满时覆盖最旧的一项）"""
+        if self._count == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+            self._count -= 1
+        index = (self._start + self._count) % self.capacity
+        self._x[index] = x
+        self._y[index] = y
+        self._color[index] = color
+        self._birth[index] = self._tick
+        self._count += 1
+
+    def age(self, frames: int = 1) -> None:
+        """老化 frames 帧：所有拖影生命每帧减少 TRAIL_DECAY，丢弃已消失的最旧拖影"""
+        if not self._count or frames <= 0:
+            return
+        self._tick += frames
+        while self._count and self._life(self._start) <= 0:
+            self._color[self._start] = None
+            self._start = (self._start + 1) % self.capacity
+            self._count -= 1
+
+    def clear(self) -> None:
+        """清空"""
+        self._color = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+    def __iter__(self) -> Iterator[TrailEntry]:
+        capacity = self.capacity
+        for i in range(self._count):
+            index = (self._start + i) % capacity
+            yield self._x[index], self._y[index], self._color[index], self._life(index)
@@ -1,8 +1,12 @@
 """特效模块"""
 
 from .particle import Particle
+from .particle_system import ParticleSystem, ParticleList, create_particle_system
 from .floating_text import FloatingText
+from .text_sprite import TextSprite
 from .star import Star
+from .starfield import StarField, StarList, create_star_field
+from .budget import EffectBudget, OverlayPool
 from .effect_manager import EffectManager
 
-__all__ = ['Particle', 'FloatingText', 'Star', 'EffectManager']
\ No newline at end of file
+__all__ = ['Particle', 'ParticleSystem', 'ParticleList', 'create_particle_system', 'FloatingText', 'TextSprite', 'Star', 'StarField', 'StarList', 'create_star_field', 'EffectBudget', 'OverlayPool', 'EffectManager']
\ No newline at end of file
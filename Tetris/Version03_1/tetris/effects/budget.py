@@ -0,0 +1,144 @@
+"""特效预算 - 粒子/文字/覆盖层数量上限，帧时间超标时逐级降低特效质量"""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+
+# 质量级别：(粒子数量比例, 拖尾长度)，0 为最高质量；数量比例同时缩减新生成的粒子和存活粒子的上限
+QUALITY_LEVELS: Tuple[Tuple[float, int], ...] = (
+    (1.0, 6),
+    (0.6, 4),
+    (0.35, 2),
+    (0.15, 0),
+)
+
+
+class EffectBudget:
+    """
+    特效预算
+    用帧时间的指数滑动平均判断是否超出目标帧时间：连续超标时降一级质量（更少粒子、更短拖尾，
+    超出新上限的存活粒子立即移除），持续富余时再逐级恢复
+    """
+
+    SMOOTHING = 0.1         # 滑动平均系数
+    DEGRADE_RATIO = 1.15    # 平均帧时间超过目标的该倍数视为超标
+    RECOVER_RATIO = 0.85    # 低于该倍数视为富余
+    DEGRADE_FRAMES = 10     # 连续超标帧数
+    RECOVER_FRAMES = 120    # 连续富余帧数
+
+    def __init__(
+        self,
+        frame_budget_ms: float,
+        max_particles: int = 4000,
+        max_floating_texts: int = 12,
+        max_overlay_surfaces: int = 8
+    ):
+        self.frame_budget_ms = frame_budget_ms
+        self.max_particles = max_particles
+        self.max_floating_texts = max_floating_texts
+        self.max_overlay_surfaces = max_overlay_surfaces
+
+        self.level = 0
+        self.average_ms = frame_budget_ms
+        self._over = 0
+        self._under = 0
+
+    @property
+    def particle_scale(self) -> float:
+        """当前质量下的粒子数量比例"""
+        return QUALITY_LEVELS[self.level][0]
+
+    @property
+    def particle_limit(self) -> int:
+        """当前质量下同时存在的粒子上限（降级时超出的存活粒子会被移除）"""
+        return int(self.max_particles * self.particle_scale)
+
+    @property
+    def trail_length(self) -> int:
+        """当前质量下的拖尾长度"""
+        return QUALITY_LEVELS[self.level][1]
+
+    def report_frame(self, dt: float) -> None:
+        """报告一帧的实际耗时（秒），按需调整质量级别"""
+        frame_ms = dt * 1000
+        self.average_ms += (frame_ms - self.average_ms) * self.SMOOTHING
+
+        if self.average_ms > self.frame_budget_ms * self.DEGRADE_RATIO:
+            self._over += 1
+            self._under = 0
+            if self._over >= self.DEGRADE_FRAMES and self.level < len(QUALITY_LEVELS) - 1:
+                self.level += 1
+                self._over = 0
+        elif self.average_ms < self.frame_budget_ms * self.RECOVER_RATIO:
+            self._under += 1
+            self._over = 0
+            if self._under >= self.RECOVER_FRAMES and self.level > 0:
+                self.level -= 1
+                self._under = 0
+        else:
+            self._over = self._under = 0
+
+    def particle_count(self, requested: int, live: int) -> int:
+        """按质量比例缩减请求的粒子数，并限制在当前质量的粒子上限以内"""
+        count = int(requested * self.particle_scale + 0.5)
+        if requested > 0:
+            count = max(1, count)
+        return max(0, min(count, self.particle_limit - live))
+
+    def reset(self) -> None:
+        """恢复最高质量"""
+        self.level = 0
+        self.average_ms = self.frame_budget_ms
+        self._over = self._under = 0
+
+
+class OverlayPool:
+    """
+    覆盖层 Surface 池
+    闪光、扫描线等纯色半透明矩形复用按尺寸缓存的不透明 Surface（填色后用整体 alpha 绘制），
+    超出上限时淘汰最久未用的尺寸
+    """
+
+    def __init__(self, max_surfaces: int = 8):
+        self.max_surfaces = max_surfaces
+        self._surfaces: 'OrderedDict[Tuple[int, int], pygame.Surface]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get(self, width: int, height: int) -> pygame.Surface:
+        """获取指定尺寸的覆盖层"""
+        key = (width, height)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(key)
+            self._surfaces[key] = surface
+            while len(self._surfaces) > self.max_surfaces:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def fill_rect(
+        self,
+        target: pygame.Surface,
+        rect: Tuple[int, int, int, int],
+        color: Tuple[int, int, int],
+        alpha: int
+    ) -> None:
+        """在 target 上叠加半透明纯色矩形"""
+        x, y, width, height = rect
+        if alpha <= 0 or width <= 0 or height <= 0:
+            return
+        if alpha >= 255:
+            target.fill(color, rect)
+            return
+        surface = self.get(width, height)
+        surface.fill(color)
+        surface.set_alpha(alpha)
+        target.blit(surface, (x, y))
+
+    def clear(self) -> None:
+        """释放所有覆盖层"""
+        self._surfaces.clear()
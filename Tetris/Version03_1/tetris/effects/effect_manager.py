@@ -6,9 +6,13 @@ from typing import List, Tuple, Optional
 
 import pygame
 
-from ..config import BOARD_X, BOARD_Y, BOARD_WIDTH, BOARD_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, NEON_COLORS, GameConfig
-from .particle import Particle
+from ..config import BOARD_X, BOARD_Y, BOARD_WIDTH, BOARD_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, NEON_COLORS, FRAME_RATE, GameConfig
+from .particle_system import create_particle_system
 from .floating_text import FloatingText
+from .budget import EffectBudget, OverlayPool
+
+# 单次更新最多补推进的特效帧数（长时间卡顿后不一次性快进）
+MAX_EFFECT_FRAMES = 8
 
 
 class EffectManager:
@@ -16,8 +20,22 @@ class EffectManager:
 
     def __init__(self, config: Optional[GameConfig] = None):
         self.config = config or GameConfig()
-        self.particles: List[Particle] = []
+
+        # 特效预算（数量上限 + 帧时间超标时降级）
+        self.budget = EffectBudget(
+            self.config.frame_budget_ms,
+            self.config.max_particles,
+            self.config.max_floating_texts,
+            self.config.max_overlay_surfaces
+        )
+        self.particles = create_particle_system(self.config.max_particles)
         self.floating_texts: List[FloatingText] = []
+        self._text_pool: List[FloatingText] = []  # 已结束的浮动文字，供复用
+        self.overlays = OverlayPool(self.config.max_overlay_surfaces)
+
+        # 升级边缘光晕的预绘制渐变（按屏幕尺寸缓存）
+        self._edge_glow: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._edge_glow_size: Optional[Tuple[int, int]] = None
 
         # 特效状态
         self.clear_flash_lines: List[int] = []
@@ -39,6 +57,9 @@ class EffectManager:
         self.slow_motion_timer = 0
         self.slow_motion_factor = 1.0
 
+        # 按帧计数的特效（闪光、震动、粒子等）以 FRAME_RATE 为步长推进，未满一帧的时间留到下次
+        self._frame_time = 0.0
+
     def trigger_line_clear(
         self,
         lines: List[int],
@@ -71,9 +92,7 @@ class EffectManager:
                 px = board_x + x * self.config.grid_size + self.config.grid_size // 2
                 py = board_y + (y - 2) * self.config.grid_size + self.config.grid_size // 2
                 num_particles = 4 + lines_count * 3
-
-                for _ in range(num_particles):
-                    self.particles.append(Particle(px, py, color, lines_count))
+                self.emit_particles(px, py, color, lines_count, num_particles)
 
             # 添加闪光效果
             flash_color = random.choice(neon_colors_list)
@@ -98,9 +117,7 @@ class EffectManager:
         self.spawn_level_up_particles(int(center_x), int(center_y))
 
         # 浮动文字
-        self.floating_texts.append(
-            FloatingText(center_x, center_y - 50, "LEVEL UP!", (255, 215, 0), 32, True, 0)
-        )
+        self.add_floating_text(center_x, center_y - 50, "LEVEL UP!", (255, 215, 0), 32, True, 0)
 
         # 震动
         self.shake_offset = [random.randint(-10, 10), random.randint(-10, 10)]
@@ -118,8 +135,7 @@ class EffectManager:
         self.slow_motion_factor = 0.3
 
         # 金色粒子
-        for _ in range(40):
-            self.particles.append(Particle(center_x, center_y, (255, 215, 0), 4))
+        self.emit_particles(center_x, center_y, (255, 215, 0), 4, 40)
 
     def trigger_combo(self, combo_count: int, center_y: float = None) -> None:
         """触发连击特效"""
@@ -139,14 +155,38 @@ class EffectManager:
         is_tetris: bool = False,
         combo_count: int = 0
     ) -> None:
-        """添加浮动文字"""
-        self.floating_texts.append(FloatingText(x, y, text, color, size, is_tetris, combo_count))
+        """添加浮动文字（从对象池取出；超过上限时回收最早的文字）"""
+        while len(self.floating_texts) >= self.budget.max_floating_texts:
+            self._release_text(self.floating_texts.pop(0))
+        if self._text_pool:
+            text_effect = self._text_pool.pop()
+            text_effect.reset(x, y, text, color, size, is_tetris, combo_count)
+        else:
+            text_effect = FloatingText(x, y, text, color, size, is_tetris, combo_count)
+        self.floating_texts.append(text_effect)
+
+    def _release_text(self, text: FloatingText) -> None:
+        """浮动文字放回对象池"""
+        if len(self._text_pool) < self.budget.max_floating_texts:
+            self._text_pool.append(text)
+
+    def emit_particles(
+        self,
+        x: float,
+        y: float,
+        color: Tuple[int, int, int],
+        lines_cleared: int = 1,
+        count: int = 1
+    ) -> None:
+        """按当前特效预算生成粒子（降级时减少数量，不超过粒子上限）"""
+        count = self.budget.particle_count(count, len(self.particles))
+        if count > 0:
+            self.particles.emit(x, y, color, lines_cleared, count)
 
     def spawn_level_up_particles(self, cx: int, cy: int) -> None:
         """生成升级粒子"""
         # 中心爆发
-        for _ in range(30):
-            self.particles.append(Particle(cx, cy, (255, 215, 0), 4))
+        self.emit_particles(cx, cy, (255, 215, 0), 4, 30)
 
         # 四角爆发
         corners = [
@@ -156,17 +196,34 @@ class EffectManager:
             (self.config.screen_width, self.config.screen_height)
         ]
         for corner_x, corner_y in corners:
-            for _ in range(10):
-                self.particles.append(Particle(corner_x, corner_y, (255, 200, 50), 4))
+            self.emit_particles(corner_x, corner_y, (255, 200, 50), 4, 10)
+
+    def update(self, dt: float) -> int:
+        """
+        更新特效状态，返回推进的特效帧数
+        计时器按 FRAME_RATE 帧计数，按实际经过的时间换算成帧推进，与渲染帧率无关
+        """
+        # 帧时间反馈给特效预算，按质量级别调整拖尾长度，并移除超出当前上限的存活粒子
+        self.budget.report_frame(dt)
+        self.particles.trail_length = self.budget.trail_length
+        self.particles.cull(self.budget.particle_limit)
 
-    def update(self, dt: float) -> None:
-        """更新特效状态"""
         # 慢动作计时
         if self.slow_motion_timer > 0:
             self.slow_motion_timer -= dt
         else:
             self.slow_motion_factor = 1.0
 
+        self._frame_time += dt
+        frames = int(self._frame_time * FRAME_RATE)
+        self._frame_time -= frames / FRAME_RATE
+        frames = min(frames, MAX_EFFECT_FRAMES)
+        for _ in range(frames):
+            self._step()
+        return frames
+
+    def _step(self) -> None:
+        """推进一帧按帧计数的特效"""
         # 更新闪光计时器
         if self.clear_flash_timer > 0:
             self.clear_flash_timer -= 1
@@ -221,24 +278,25 @@ class EffectManager:
         else:
             self.shake_offset = [0, 0]
 
-    def update_particles(self) -> None:
-        """更新粒子"""
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.life <= 0:
-                self.particles.remove(particle)
+    def update_particles(self, frames: int = 1) -> None:
+        """更新粒子（按帧推进 frames 次）"""
+        for _ in range(frames):
+            self.particles.update()
 
     def update_floating_texts(self, dt: float = 0.016) -> None:
         """更新浮动文字"""
-        for text in self.floating_texts[:]:
+        alive = []
+        for text in self.floating_texts:
             text.update(dt)
-            if text.alpha <= 0:
-                self.floating_texts.remove(text)
+            if text.alpha > 0:
+                alive.append(text)
+            else:
+                self._release_text(text)
+        self.floating_texts = alive
 
     def draw_particles(self, surface: pygame.Surface) -> None:
         """绘制粒子"""
-        for particle in self.particles:
-            particle.draw(surface)
+        self.particles.draw(surface)
 
     def draw_floating_texts(self, surface: pygame.Surface, font: pygame.font.Font, font_name: str = None) -> None:
         """绘制浮动文字"""
@@ -251,39 +309,56 @@ class EffectManager:
         board_x = self.config.board_x + shake[0]
         board_y = self.config.board_y + shake[1]
 
+        board_width, grid_size = self.config.board_width, self.config.grid_size
+
         # 清行闪光
         if self.clear_flash_timer > 0:
             for y in self.clear_flash_lines:
                 flash_alpha = int(255 * (self.clear_flash_timer / 20))
-                flash_surf = pygame.Surface((self.config.board_width, self.config.grid_size), pygame.SRCALPHA)
-                pygame.draw.rect(
-                    flash_surf, (255, 255, 255, flash_alpha),
-                    (0, 0, self.config.board_width, self.config.grid_size)
+                self.overlays.fill_rect(
+                    surface, (board_x, board_y + (y - 2) * grid_size, board_width, grid_size),
+                    (255, 255, 255), flash_alpha
                 )
-                surface.blit(flash_surf, (board_x, board_y + (y - 2) * self.config.grid_size))
 
         # 闪光效果
         for fe in self.flash_effects:
             row, color, alpha, n = fe
-            fs = pygame.Surface((self.config.board_width, self.config.grid_size), pygame.SRCALPHA)
-            fs.fill((*color, min(200, alpha)))
-            surface.blit(fs, (board_x, board_y + row * self.config.grid_size))
+            self.overlays.fill_rect(
+                surface, (board_x, board_y + row * grid_size, board_width, grid_size), color, min(200, alpha)
+            )
 
         # 扫描线
         for sl in self.scan_lines:
             y_pos, color, alpha = sl
-            ss = pygame.Surface((self.config.board_width, 3), pygame.SRCALPHA)
-            ss.fill((*color, min(255, alpha * 2)))
-            surface.blit(ss, (board_x, board_y + y_pos))
+            self.overlays.fill_rect(surface, (board_x, board_y + y_pos, board_width, 3), color, min(255, alpha * 2))
+
+    def is_fullscreen(self) -> bool:
+        """是否有影响整屏的特效（震动、升级光晕），此时应整屏提交"""
+        return self.shake_offset != [0, 0] or self.level_up_effect > 0 or self.edge_pulse > 0
+
+    def get_dirty_rects(self, shake_offset: Tuple[int, int] = (0, 0)) -> List[pygame.Rect]:
+        """本帧特效绘制的区域（供脏矩形提交）"""
+        rects = self.particles.get_rects()
+        rects.extend(text.rect for text in self.floating_texts if text.rect)
+        if self.clear_flash_timer > 0 or self.flash_effects or self.scan_lines:
+            rects.append(pygame.Rect(
+                self.config.board_x + shake_offset[0], self.config.board_y + shake_offset[1],
+                self.config.board_width, self.config.board_height
+            ))
+        return rects
 
     def draw_level_up_effects(self, surface: pygame.Surface) -> None:
         """绘制升级特效"""
         if self.edge_pulse > 0:
             self.draw_edge_glow(surface)
 
-    def draw_edge_glow(self, surface: pygame.Surface) -> None:
-        """绘制边缘光晕"""
-        edge_alpha = int(200 * self.edge_pulse)
+    def build_edge_glow(self) -> None:
+        """
+        按当前屏幕尺寸预绘制四条边缘渐变（满强度），窗口大小变化时重建；
+        绘制时只通过整体 alpha 调整强度
+        """
+        width, height = self.config.screen_width, self.config.screen_height
+        edge_size = 40
 
         def gold_color(progress):
             if progress < 0.5:
@@ -291,45 +366,46 @@ class EffectManager:
             else:
                 return (255, 230, 150)
 
-        edge_height = 40
-
-        # 上边缘
-        edge_surf = pygame.Surface((self.config.screen_width, edge_height), pygame.SRCALPHA)
-        for y in range(edge_height):
-            alpha = int(edge_alpha * (1 - y / edge_height) ** 1.5)
-            color = gold_color(y / edge_height)
-            pygame.draw.line(edge_surf, (*color, alpha), (0, y), (self.config.screen_width, y))
-        surface.blit(edge_surf, (0, 0))
-
-        # 下边缘
-        edge_surf = pygame.Surface((self.config.screen_width, edge_height), pygame.SRCALPHA)
-        for y in range(edge_height):
-            alpha = int(edge_alpha * (y / edge_height) ** 1.5)
-            color = gold_color(y / edge_height)
-            pygame.draw.line(edge_surf, (*color, alpha), (0, y), (self.config.screen_width, y))
-        surface.blit(edge_surf, (0, self.config.screen_height - edge_height))
-
-        edge_width = 40
-
-        # 左边缘
-        edge_surf = pygame.Surface((edge_width, self.config.screen_height), pygame.SRCALPHA)
-        for x in range(edge_width):
-            alpha = int(edge_alpha * (1 - x / edge_width) ** 1.5)
-            color = gold_color(x / edge_width)
-            pygame.draw.line(edge_surf, (*color, alpha), (x, 0), (x, self.config.screen_height))
-        surface.blit(edge_surf, (0, 0))
-
-        # 右边缘
-        edge_surf = pygame.Surface((edge_width, self.config.screen_height), pygame.SRCALPHA)
-        for x in range(edge_width):
-            alpha = int(edge_alpha * (x / edge_width) ** 1.5)
-            color = gold_color(x / edge_width)
-            pygame.draw.line(edge_surf, (*color, alpha), (x, 0), (x, self.config.screen_height))
-        surface.blit(edge_surf, (self.config.screen_width - edge_width, 0))
+        top = pygame.Surface((width, edge_size), pygame.SRCALPHA)
+        for y in range(edge_size):
+            alpha = int(255 * (1 - y / edge_size) ** 1.5)
+            pygame.draw.line(top, (*gold_color(y / edge_size), alpha), (0, y), (width, y))
+
+        bottom = pygame.Surface((width, edge_size), pygame.SRCALPHA)
+        for y in range(edge_size):
+            alpha = int(255 * (y / edge_size) ** 1.5)
+            pygame.draw.line(bottom, (*gold_color(y / edge_size), alpha), (0, y), (width, y))
+
+        # 左右边缘与上下边缘的渐变一致，逆时针旋转 90 度得到（再拉伸到屏幕高度）
+        left = pygame.transform.scale(pygame.transform.rotate(top, 90), (edge_size, height))
+        right = pygame.transform.scale(pygame.transform.rotate(bottom, 90), (edge_size, height))
+
+        # 有显示模式时转换为显示格式，加快逐帧混合
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            top, bottom, left, right = (strip.convert_alpha() for strip in (top, bottom, left, right))
+
+        self._edge_glow = [
+            (top, (0, 0)),
+            (bottom, (0, height - edge_size)),
+            (left, (0, 0)),
+            (right, (width - edge_size, 0)),
+        ]
+        self._edge_glow_size = (width, height)
+
+    def draw_edge_glow(self, surface: pygame.Surface) -> None:
+        """绘制边缘光晕（四次 blit，强度由整体 alpha 控制）"""
+        if self._edge_glow_size != (self.config.screen_width, self.config.screen_height):
+            self.build_edge_glow()
+        edge_alpha = int(200 * self.edge_pulse)
+        for strip, _ in self._edge_glow:
+            strip.set_alpha(edge_alpha)
+        surface.blits(self._edge_glow, doreturn=False)
 
     def clear(self) -> None:
         """清除所有特效"""
         self.particles.clear()
+        for text in self.floating_texts:
+            self._release_text(text)
         self.floating_texts.clear()
         self.clear_flash_lines.clear()
         self.clear_flash_timer = 0
@@ -343,6 +419,7 @@ class EffectManager:
         self.level_up_pause = False
         self.slow_motion_timer = 0
         self.slow_motion_factor = 1.0
+        self._frame_time = 0.0
 
     def get_state(self) -> dict:
         """获取状态（用于网络同步）"""
@@ -3,9 +3,11 @@
 import math
 import random
 import pygame
-from typing import Tuple
+from typing import Optional, Tuple
 
-from ..config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, FRAME_RATE
+from .particle import Particle
+from .text_sprite import HUE_FRAMES, TextSprite, hue_frame, rainbow
 
 
 class FloatingText:
@@ -21,6 +23,25 @@ class FloatingText:
         is_tetris: bool = False,
         combo_count: int = 0
     ):
+        self._sprite: Optional[TextSprite] = None  # 预渲染图层（首次绘制时创建）
+        self.reset(x, y, text, color, size, is_tetris, combo_count)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        text: str,
+        color: Tuple[int, int, int],
+        size: int = 24,
+        is_tetris: bool = False,
+        combo_count: int = 0
+    ) -> None:
+        """重新初始化（对象池复用）；文字、颜色、尺寸都相同时保留预渲染图层"""
+        if self._sprite is not None and (text, color, int(size * 1.3), is_tetris) != (
+            self.text, self.color, self.base_size, self.is_tetris
+        ):
+            self._sprite = None
+
         self.x = x
         self.y = y
         self.text = text
@@ -37,6 +58,7 @@ class FloatingText:
         self.shake_phase = 0
         self.shake_speed = 8
         self.rainbow_phase = 0
+        self.rect: Optional[pygame.Rect] = None  # 最近一次绘制的区域（含光晕）
 
         # 动画阶段
         self.phase = 'fade_in'
@@ -52,7 +74,8 @@ class FloatingText:
         self.rainbow_phase += 6 * dt
 
         if self.shake_offset > 0:
-            self.shake_offset *= 0.95
+            # 每帧衰减 5%（按 FRAME_RATE 帧换算，与更新频率无关）
+            self.shake_offset *= 0.95 ** (dt * FRAME_RATE)
 
         self.y += self.vy * dt * 60
         self.phase_timer += dt
@@ -95,155 +118,53 @@ class FloatingText:
             int(127 + 127 * math.sin(phase + 4.189)),
         )
 
-    def get_gold_color(self, pulse: float) -> Tuple[int, int, int]:
-        """获取金色脉冲颜色"""
-        pulse_intensity = 0.5 + 0.5 * math.sin(pulse)
-        return (
-            255,
-            int(215 + 40 * pulse_intensity),
-            int(50 + 50 * pulse_intensity),
-        )
-
-    def draw_tetris_text(
-        self,
-        surface: pygame.Surface,
-        font: pygame.font.Font,
-        text: str,
-        x: int,
-        y: int,
-        alpha: int
-    ) -> None:
-        """绘制TETRIS专用炫酷文字"""
-        pulse = 0.7 + 0.3 * math.sin(self.neon_pulse)
+    def _font(self) -> pygame.font.Font:
+        """文字满尺寸的字体（由 FontManager 创建并缓存）"""
+        from ..rendering.fonts import FontManager
+        size = max(8, self.base_size)
+        if self.is_tetris:
+            size = int(size * 1.5)
+        return FontManager.get_instance().get_font('floating', size, bold=True)
 
-        text_surf = font.render(text, True, (255, 255, 255))
-        text_width = text_surf.get_width()
-        text_height = text_surf.get_height()
-
-        glow_size = 8
-        total_width = text_width + glow_size * 4
-        total_height = text_height + glow_size * 4
-        glow_surf = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
-
-        # 多层彩虹光晕
-        for layer in range(glow_size, 0, -1):
-            layer_progress = layer / glow_size
-            rainbow_offset = layer * 0.3
-            rainbow_color = self.get_rainbow_color(rainbow_offset)
-            g_alpha = int(60 * pulse * layer_progress)
-
-            for dx in range(-layer, layer + 1, 1):
-                for dy in range(-layer, layer + 1, 1):
-                    if dx * dx + dy * dy <= layer * layer:
-                        temp_surf = font.render(text, True, rainbow_color)
-                        temp_surf.set_alpha(g_alpha)
-                        glow_surf.blit(temp_surf, (glow_size * 2 + dx, glow_size * 2 + dy))
-
-        # 金色中层光晕
-        gold_color = self.get_gold_color(self.neon_pulse * 2)
-        for dx in range(-2, 3, 1):
-            for dy in range(-2, 3, 1):
-                if dx != 0 or dy != 0:
-                    temp_surf = font.render(text, True, gold_color)
-                    temp_surf.set_alpha(int(150 * pulse))
-                    glow_surf.blit(temp_surf, (glow_size * 2 + dx, glow_size * 2 + dy))
-
-        glow_surf.set_alpha(alpha)
-        surface.blit(glow_surf, (x - glow_size * 2, y - glow_size * 2))
-
-        # 白色核心文字
-        core_surf = font.render(text, True, (255, 255, 255))
-        core_surf.set_alpha(alpha)
-        surface.blit(core_surf, (x, y))
-
-        # 金色高光
-        highlight_surf = font.render(text, True, gold_color)
-        highlight_surf.set_alpha(int(alpha * 0.6 * pulse))
-        surface.blit(highlight_surf, (x + 1, y + 1))
-
-        # 闪烁星星效果
+    def draw_sparkles(self, surface: pygame.Surface, x: int, y: int, width: int, height: int, alpha: int) -> None:
+        """TETRIS 文字上的闪烁星星（圆点复用粒子拖尾的缓存 Surface）"""
+        blits = []
         for i in range(5):
             star_phase = self.rainbow_phase * 3 + i * 1.2
-            star_alpha = int(alpha * 0.8 * (0.5 + 0.5 * math.sin(star_phase)))
+            star_alpha = int(alpha * 0.8 * (0.5 + 0.5 * math.sin(star_phase))) & ~15
             if star_alpha > 30:
-                star_x = x + random.randint(0, text_width)
-                star_y = y + random.randint(0, text_height // 2)
+                star_x = x + random.randint(0, width)
+                star_y = y + random.randint(0, height // 2)
                 star_size = random.randint(2, 4)
-                star_surf = pygame.Surface((star_size * 4, star_size * 4), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    star_surf,
-                    (*self.get_rainbow_color(i), star_alpha),
-                    (star_size * 2, star_size * 2),
-                    star_size
-                )
-                surface.blit(star_surf, (star_x - star_size * 2, star_y - star_size * 2))
-
-    def draw_neon_text(
-        self,
-        surface: pygame.Surface,
-        font: pygame.font.Font,
-        text: str,
-        x: int,
-        y: int,
-        color: Tuple[int, int, int],
-        alpha: int
-    ) -> None:
-        """绘制霓虹文字"""
-        pulse = 0.7 + 0.3 * math.sin(self.neon_pulse)
-
-        text_surf = font.render(text, True, color)
-
-        glow_size = 2
-        glow_surf = pygame.Surface(
-            (text_surf.get_width() + glow_size * 4, text_surf.get_height() + glow_size * 4),
-            pygame.SRCALPHA
-        )
-
-        for i in range(glow_size * 2, 0, -1):
-            g_alpha = int(40 * pulse * (1 - i / (glow_size * 2)))
-            for dx in range(-i, i + 1):
-                for dy in range(-i, i + 1):
-                    if dx * dx + dy * dy <= i * i:
-                        temp_surf = font.render(text, True, color)
-                        temp_surf.set_alpha(g_alpha)
-                        glow_surf.blit(temp_surf, (glow_size * 2 + dx, glow_size * 2 + dy))
-
-        glow_surf.set_alpha(alpha)
-        surface.blit(glow_surf, (x - glow_size * 2, y - glow_size * 2))
-
-        inner_surf = font.render(text, True, color)
-        inner_surf.set_alpha(alpha)
-        surface.blit(inner_surf, (x, y))
-
-        highlight_surf = font.render(text, True, (255, 255, 255))
-        highlight_surf.set_alpha(int(alpha * 0.3 * pulse))
-        surface.blit(highlight_surf, (x + 1, y + 1))
-
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font, font_name: str = None) -> None:
-        """绘制浮动文字"""
+                frame = hue_frame(self.rainbow_phase + i)
+                color = rainbow(frame * math.pi * 2 / HUE_FRAMES)
+                star_surf = Particle.trail_surface(star_size, color, star_alpha)
+                blits.append((star_surf, (star_x - star_size - 2, star_y - star_size - 2)))
+        if blits:
+            surface.blits(blits, doreturn=False)
+
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font = None, font_name: str = None) -> None:
+        """
+        绘制浮动文字
+        图层在首次绘制时按满尺寸预渲染（字体来自 FontManager，font/font_name 参数仅为兼容保留），
+        之后每帧只调整透明度和缩放
+        """
         if self.alpha <= 0:
             return
 
+        if self._sprite is None:
+            self._sprite = TextSprite(self.text, self._font(), self.color, self.is_tetris)
+
         shake_x = int(math.sin(self.shake_phase) * self.shake_offset) if self.shake_offset > 0.5 else 0
         shake_y = int(math.cos(self.shake_phase * 1.3) * self.shake_offset) if self.shake_offset > 0.5 else 0
 
-        new_size = max(8, int(self.base_size * self.scale))
-        if self.is_tetris:
-            new_size = int(new_size * 1.5)
-
-        if font_name:
-            scaled_font = pygame.font.SysFont(font_name, new_size, bold=True)
-        else:
-            scaled_font = pygame.font.Font(None, new_size, bold=True)
-
-        text_surf = scaled_font.render(self.text, True, self.color)
-        scaled_width = text_surf.get_width()
-        scaled_height = text_surf.get_height()
-
+        text_width, text_height = self._sprite.text_size
+        scaled_width = int(text_width * self.scale)
+        scaled_height = int(text_height * self.scale)
         draw_x = int(self.x - scaled_width // 2 + shake_x)
         draw_y = int(self.y - scaled_height // 2 + shake_y)
 
+        pulse = 0.7 + 0.3 * math.sin(self.neon_pulse)
+        self.rect = self._sprite.draw(surface, draw_x, draw_y, self.alpha, pulse, self.rainbow_phase, self.scale)
         if self.is_tetris:
-            self.draw_tetris_text(surface, scaled_font, self.text, draw_x, draw_y, self.alpha)
-        else:
-            self.draw_neon_text(surface, scaled_font, self.text, draw_x, draw_y, self.color, self.alpha)
\ No newline at end of file
+            self.draw_sparkles(surface, draw_x, draw_y, scaled_width, scaled_height, self.alpha)
@@ -3,16 +3,19 @@
 import math
 import random
 import pygame
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
-from ..config import SPARK_COLORS
+from ..config import NEON_COLORS, SPARK_COLORS
+
+if TYPE_CHECKING:
+    from ..rendering import SurfaceCache
 
 
 class Particle:
     """粒子效果类"""
 
-    # 类级别的 Surface 缓存
-    _glow_cache: dict = {}
+    # 光晕 Surface 存放在共享的 SurfaceCache 中（particle_glow / particle_trail 命名空间）
+    _cache: 'SurfaceCache' = None
 
     def __init__(self, x: float, y: float, color: Tuple[int, int, int], lines_cleared: int = 1):
         self.x = x
@@ -63,40 +66,85 @@ class Particle:
                 progress = (i + 1) / trail_len
                 trail_alpha = min(255, int(100 * alpha_multiplier * tl * progress * 0.6))
                 trail_size = max(1, int(self.size * progress * 0.7))
-                cache_key = (trail_size, tc, trail_alpha)
-                if cache_key not in Particle._glow_cache:
-                    trail_surf = pygame.Surface((trail_size * 2 + 4, trail_size * 2 + 4), pygame.SRCALPHA)
-                    pygame.draw.circle(trail_surf, (*tc, trail_alpha), (trail_size + 2, trail_size + 2), trail_size)
-                    Particle._glow_cache[cache_key] = trail_surf
-                    if len(Particle._glow_cache) > 200:
-                        keys = list(Particle._glow_cache.keys())[:100]
-                        for k in keys:
-                            del Particle._glow_cache[k]
-                trail_surf = Particle._glow_cache[cache_key]
+                trail_surf = Particle.trail_surface(trail_size, tc, trail_alpha)
                 surface.blit(trail_surf, (int(tx - trail_size - 2), int(ty - trail_size - 2)))
 
         alpha = min(255, int(240 * alpha_multiplier * self.life))
         size = max(1, int(self.size * self.life))
 
         # 缓存主粒子光晕
-        cache_key = (size, self.color, alpha)
-        if cache_key not in Particle._glow_cache:
-            glow_surf = pygame.Surface((size * 4 + 4, size * 4 + 4), pygame.SRCALPHA)
-            center = size * 2 + 2
-            for i in range(size + 2, size, -1):
-                g_alpha = min(255, int(alpha * 0.15 * (1 - (i - size) / 2)))
-                pygame.draw.circle(glow_surf, (*self.color, g_alpha), (center, center), i)
-            pygame.draw.circle(glow_surf, (*self.color, min(255, int(alpha * 0.7))), (center, center), size)
-            Particle._glow_cache[cache_key] = glow_surf
-            if len(Particle._glow_cache) > 200:
-                keys = list(Particle._glow_cache.keys())[:100]
-                for k in keys:
-                    del Particle._glow_cache[k]
-        glow_surf = Particle._glow_cache[cache_key]
+        glow_surf = Particle.glow_surface(size, self.color, alpha)
         center = size * 2 + 2
         surface.blit(glow_surf, (int(self.x - center), int(self.y - center)))
 
+    def get_rect(self) -> pygame.Rect:
+        """粒子及其拖尾的包围矩形"""
+        margin = self.size * 2 + 2
+        xs = [tx for tx, _, _, _ in self.trail]
+        ys = [ty for _, ty, _, _ in self.trail]
+        xs.append(self.x)
+        ys.append(self.y)
+        left, top = int(min(xs)) - margin, int(min(ys)) - margin
+        return pygame.Rect(left, top, int(max(xs)) + margin + 1 - left, int(max(ys)) + margin + 1 - top)
+
+    @classmethod
+    def surface_cache(cls) -> 'SurfaceCache':
+        """共享的 Surface 缓存（延迟导入，避免 effects 与 rendering 循环导入）"""
+        if cls._cache is None:
+            from ..rendering.surface_cache import SurfaceCache
+            cls._cache = SurfaceCache.get_instance()
+        return cls._cache
+
+    @classmethod
+    def glow_surface(cls, size: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """主粒子光晕 Surface（尺寸 size * 4 + 4，中心在 size * 2 + 2）"""
+        return cls.surface_cache().get_or_create(
+            ('particle_glow', size, color, alpha),
+            lambda: cls._create_glow(size, color, alpha)
+        )
+
+    @classmethod
+    def trail_surface(cls, size: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """拖尾圆点 Surface（尺寸 size * 2 + 4，中心在 size + 2）"""
+        return cls.surface_cache().get_or_create(
+            ('particle_trail', size, color, alpha),
+            lambda: cls._create_trail(size, color, alpha)
+        )
+
+    @staticmethod
+    def _create_glow(size: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """创建主粒子光晕"""
+        glow_surf = pygame.Surface((size * 4 + 4, size * 4 + 4), pygame.SRCALPHA)
+        center = size * 2 + 2
+        for i in range(size + 2, size, -1):
+            g_alpha = min(255, int(alpha * 0.15 * (1 - (i - size) / 2)))
+            pygame.draw.circle(glow_surf, (*color, g_alpha), (center, center), i)
+        pygame.draw.circle(glow_surf, (*color, min(255, int(alpha * 0.7))), (center, center), size)
+        return glow_surf
+
+    @staticmethod
+    def _create_trail(size: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """创建拖尾圆点"""
+        trail_surf = pygame.Surface((size * 2 + 4, size * 2 + 4), pygame.SRCALPHA)
+        pygame.draw.circle(trail_surf, (*color, alpha), (size + 2, size + 2), size)
+        return trail_surf
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """
+        预热常驻的粒子光晕：粒子生命前段 alpha 饱和为 255，
+        各尺寸、各颜色的满 alpha 光晕是最常用的条目
+        """
+        colors = set(SPARK_COLORS) | set(NEON_COLORS.values())
+        cls.surface_cache().warm_up(
+            (('particle_glow', size, color, 255), lambda s=size, c=color: cls._create_glow(s, c, 255))
+            for size in range(1, 7)
+            for color in colors
+        )
+
     @classmethod
     def clear_cache(cls) -> None:
         """清除缓存"""
-        cls._glow_cache.clear()
\ No newline at end of file
+        cache = cls.surface_cache()
+        cache.clear('particle_glow')
+        cache.clear('particle_trail')
\ No newline at end of file
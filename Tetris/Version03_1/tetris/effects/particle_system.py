@@ -0,0 +1,315 @@
+"""粒子系统 - 以数组结构（structure-of-arrays）批量更新和绘制大量粒子"""
+
+import math
+from typing import Dict, List, Tuple, Union
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为声明的依赖；未安装时（如精简打包）退回逐个对象的 Particle 实现
+    np = None
+
+from ..config import SPARK_COLORS
+from .particle import Particle
+
+Color = Tuple[int, int, int]
+
+TRAIL_LENGTH = 6       # 拖尾长度（与 Particle 一致）
+ALPHA_STEP = 8         # 光晕透明度量化步长（提高精灵缓存命中率）
+TRAIL_ALPHA_STEP = 32  # 拖尾透明度量化步长（拖尾圆点小而淡，量化更粗不影响观感）
+DIRTY_TILE = 64        # 脏矩形按该尺寸的网格汇总
+
+
+class ParticleSystem:
+    """
+    向量化粒子系统
+    位置、速度、生命、尺寸、颜色索引等按列存放在 NumPy 数组中，所有粒子一次向量运算完成更新；
+    拖尾使用固定长度的环形缓冲区，死亡粒子一次压缩移除；
+    绘制时复用 Particle 的缓存光晕精灵（系统内按打包键保存精灵表，只在未命中时查询 SurfaceCache），
+    并用 Surface.blits 批量提交
+    """
+
+    # 每个粒子一列的浮点属性
+    FIELDS = ('x', 'y', 'vx', 'vy', 'life', 'decay', 'size', 'wind', 'turbulence', 'phase', 'alpha_bonus')
+
+    def __init__(self, capacity: int = 1024, seed: int = None):
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+        self._capacity = 0
+        self._data: Dict[str, 'np.ndarray'] = {}
+        self._color = np.zeros(0, dtype=np.int32)
+        self._age = np.zeros(0, dtype=np.int32)
+        self._trail_x = np.zeros((0, TRAIL_LENGTH), dtype=np.float32)
+        self._trail_y = np.zeros((0, TRAIL_LENGTH), dtype=np.float32)
+        self._trail_life = np.zeros((0, TRAIL_LENGTH), dtype=np.float32)
+        self._head = 0  # 环形缓冲区下一次写入的位置（所有粒子同步推进）
+        self.trail_length = TRAIL_LENGTH  # 绘制的拖尾长度（降级时缩短）
+
+        # 调色板：颜色索引 -> RGB
+        self._palette: List[Color] = list(SPARK_COLORS)
+        self._palette_index: Dict[Color, int] = {color: i for i, color in enumerate(self._palette)}
+
+        # 精灵表：精灵类型 -> {打包键: Surface}
+        self._sprites: Dict[str, Dict[int, pygame.Surface]] = {'glow': {}, 'trail': {}}
+        self._reserve(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, capacity: int) -> None:
+        """扩容（按 2 倍增长）"""
+        if capacity <= self._capacity:
+            return
+        capacity = max(capacity, self._capacity * 2)
+        n = self.count
+
+        def grow(array: 'np.ndarray') -> 'np.ndarray':
+            result = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            result[:n] = array[:n]
+            return result
+
+        self._data = {
+            name: grow(self._data.get(name, np.zeros(0, dtype=np.float32)))
+            for name in self.FIELDS
+        }
+        self._color = grow(self._color)
+        self._age = grow(self._age)
+        self._trail_x = grow(self._trail_x)
+        self._trail_y = grow(self._trail_y)
+        self._trail_life = grow(self._trail_life)
+        self._capacity = capacity
+
+    def _color_index(self, color: Color) -> int:
+        """颜色在调色板中的索引（新颜色追加到调色板）"""
+        index = self._palette_index.get(color)
+        if index is None:
+            index = len(self._palette)
+            self._palette.append(color)
+            self._palette_index[color] = index
+        return index
+
+    def emit(self, x: float, y: float, color: Color, lines_cleared: int = 1, count: int = 1) -> None:
+        """在 (x, y) 生成 count 个粒子（参数分布与 Particle 一致）"""
+        if count <= 0:
+            return
+        rng = self._rng
+        start, end = self.count, self.count + count
+        self._reserve(end)
+        d = self._data
+
+        angle = rng.uniform(0, math.pi * 2, count)
+        speed_multiplier = 1 + (lines_cleared - 1) * 0.2
+        speed = rng.uniform(3, 7, count) * speed_multiplier
+        d['x'][start:end] = x
+        d['y'][start:end] = y
+        d['vx'][start:end] = np.cos(angle) * speed
+        d['vy'][start:end] = np.sin(angle) * speed - rng.uniform(3, 5, count) * speed_multiplier
+        d['life'][start:end] = 1.0
+        d['decay'][start:end] = rng.uniform(0.015, 0.03, count)
+        d['size'][start:end] = rng.integers(3, 7, count)
+        d['wind'][start:end] = rng.uniform(-0.2, 0.2, count)
+        d['turbulence'][start:end] = rng.uniform(0, 0.3, count)
+        d['phase'][start:end] = rng.uniform(0, math.pi * 2, count)
+        d['alpha_bonus'][start:end] = (lines_cleared - 1) * 0.05
+
+        # 70% 使用随机火花色，其余使用方块颜色
+        sparks = rng.random(count) > 0.3
+        colors = np.full(count, self._color_index(color), dtype=np.int32)
+        colors[sparks] = rng.integers(0, len(SPARK_COLORS), int(sparks.sum()))
+        self._color[start:end] = colors
+        self._age[start:end] = 0
+        self.count = end
+
+    def update(self) -> None:
+        """更新全部粒子，并一次性移除死亡粒子"""
+        n = self.count
+        if n == 0:
+            return
+        d = {name: array[:n] for name, array in self._data.items()}
+
+        # 记录拖尾
+        slot = self._head
+        self._trail_x[:n, slot] = d['x']
+        self._trail_y[:n, slot] = d['y']
+        self._trail_life[:n, slot] = d['life']
+        self._head = (slot + 1) % TRAIL_LENGTH
+        self._age[:n] += 1
+
+        d['phase'] += 0.1
+        d['x'] += d['vx'] + d['wind'] + np.sin(d['phase']) * d['turbulence']
+        d['y'] += d['vy'] + np.cos(d['phase']) * d['turbulence']
+        d['vy'] += 0.12
+        d['vx'] *= 0.985
+        d['vy'] *= 0.985
+        d['life'] -= d['decay']
+
+        alive = d['life'] > 0
+        if not alive.all():
+            self._compact(alive)
+
+    def cull(self, limit: int) -> None:
+        """粒子超过 limit 时只保留生命值最高的 limit 个（降级时移除最暗的粒子）"""
+        n = self.count
+        if n <= limit:
+            return
+        keep = np.zeros(n, dtype=bool)
+        if limit > 0:
+            keep[np.argpartition(self._data['life'][:n], n - limit)[n - limit:]] = True
+        self._compact(keep)
+
+    def _compact(self, alive: 'np.ndarray') -> None:
+        """保留存活粒子（一次布尔索引压缩）"""
+        n = self.count
+        k = int(alive.sum())
+        for array in list(self._data.values()) + [self._color, self._age, self._trail_x, self._trail_y, self._trail_life]:
+            array[:k] = array[:n][alive]
+        self.count = k
+
+    def _trails(self) -> Tuple['np.ndarray', ...]:
+        """有效拖尾点：(粒子索引, x, y, 拖尾序号, 拖尾长度, 生命)"""
+        n = self.count
+        length = np.minimum(self._age[:n], min(self.trail_length, TRAIL_LENGTH))
+        # 环形缓冲区中从旧到新的槽位
+        order = (self._head + np.arange(TRAIL_LENGTH)) % TRAIL_LENGTH
+        # 第 j 个槽位（从旧到新）对粒子有效当且仅当 j >= TRAIL_LENGTH - length
+        j = np.arange(TRAIL_LENGTH)
+        valid = j[None, :] >= (TRAIL_LENGTH - length)[:, None]
+        index, column = np.nonzero(valid)
+        slots = order[column]
+        position = column - (TRAIL_LENGTH - length[index])  # 0 为最旧
+        return (
+            index,
+            self._trail_x[index, slots],
+            self._trail_y[index, slots],
+            position,
+            length[index],
+            self._trail_life[index, slots],
+        )
+
+    def _sprite_blits(
+        self,
+        sprite: str,
+        sizes: 'np.ndarray',
+        colors: 'np.ndarray',
+        alphas: 'np.ndarray',
+        xs: 'np.ndarray',
+        ys: 'np.ndarray'
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """按 (尺寸, 颜色, 透明度) 取精灵，生成 blits 序列"""
+        if len(sizes) == 0:
+            return []
+        step = ALPHA_STEP if sprite == 'glow' else TRAIL_ALPHA_STEP
+        alphas = np.minimum(255, (alphas + step // 2) // step * step)
+        # 打包键：尺寸 | 颜色索引（16 位）| 透明度（8 位），与调色板长度无关
+        keys = (sizes.astype(np.int64) << 24) | (colors.astype(np.int64) << 8) | alphas
+        unique, inverse = np.unique(keys, return_inverse=True)
+        table = self._sprites[sprite]
+        found = [table.get(key) for key in unique.tolist()]
+        if None in found:
+            # 未命中的精灵从 SurfaceCache 取一次，之后直接命中精灵表
+            getter = Particle.glow_surface if sprite == 'glow' else Particle.trail_surface
+            for i, key in enumerate(unique.tolist()):
+                if found[i] is None:
+                    found[i] = table[key] = getter(key >> 24, self._palette[(key >> 8) & 0xFFFF], key & 0xFF)
+        sprites = np.empty(len(found), dtype=object)
+        sprites[:] = found
+
+        centers = sizes * 2 + 2 if sprite == 'glow' else sizes + 2
+        left = (xs - centers).astype(np.int32).tolist()
+        top = (ys - centers).astype(np.int32).tolist()
+        return list(zip(sprites[inverse].tolist(), zip(left, top)))
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """批量绘制拖尾和粒子"""
+        n = self.count
+        if n == 0:
+            return
+        d = {name: array[:n] for name, array in self._data.items()}
+        multiplier = 1.5 + d['alpha_bonus']
+
+        index, tx, ty, position, length, tlife = self._trails()
+        progress = (position + 1) / length
+        trail_alpha = np.minimum(255, (100 * multiplier[index] * tlife * progress * 0.6).astype(np.int64))
+        trail_size = np.maximum(1, (d['size'][index] * progress * 0.7).astype(np.int64))
+        blits = self._sprite_blits('trail', trail_size, self._color[index], trail_alpha, tx, ty)
+
+        alpha = np.minimum(255, (240 * multiplier * d['life']).astype(np.int64))
+        size = np.maximum(1, (d['size'] * d['life']).astype(np.int64))
+        blits += self._sprite_blits('glow', size, self._color[:n], alpha, d['x'], d['y'])
+        surface.blits(blits, doreturn=False)
+
+    def get_rects(self) -> List[pygame.Rect]:
+        """粒子及拖尾覆盖的区域，按 DIRTY_TILE 网格汇总（供脏矩形提交）"""
+        n = self.count
+        if n == 0:
+            return []
+        _, tx, ty, _, _, _ = self._trails()
+        xs = np.concatenate([self._data['x'][:n], tx])
+        ys = np.concatenate([self._data['y'][:n], ty])
+        margin = 6 * 2 + 2
+        # 精灵四角所在的网格标记到布尔表中
+        left = ((xs - margin) // DIRTY_TILE).astype(np.int64)
+        top = ((ys - margin) // DIRTY_TILE).astype(np.int64)
+        right = ((xs + margin) // DIRTY_TILE).astype(np.int64)
+        bottom = ((ys + margin) // DIRTY_TILE).astype(np.int64)
+        x0, y0 = int(left.min()), int(top.min())
+        grid = np.zeros((int(right.max()) - x0 + 1, int(bottom.max()) - y0 + 1), dtype=bool)
+        for cx, cy in ((left, top), (left, bottom), (right, top), (right, bottom)):
+            grid[cx - x0, cy - y0] = True
+        return [
+            pygame.Rect((cx + x0) * DIRTY_TILE, (cy + y0) * DIRTY_TILE, DIRTY_TILE, DIRTY_TILE)
+            for cx, cy in zip(*(axis.tolist() for axis in np.nonzero(grid)))
+        ]
+
+    def clear(self) -> None:
+        """移除所有粒子"""
+        self.count = 0
+
+
+class ParticleList:
+    """粒子系统的无 NumPy 实现：逐个更新 Particle 对象，接口与 ParticleSystem 相同"""
+
+    def __init__(self, capacity: int = 1024, seed: int = None):
+        self.particles: List[Particle] = []
+        self.trail_length = TRAIL_LENGTH
+
+    def __len__(self) -> int:
+        return len(self.particles)
+
+    def emit(self, x: float, y: float, color: Color, lines_cleared: int = 1, count: int = 1) -> None:
+        """在 (x, y) 生成 count 个粒子"""
+        self.particles.extend(Particle(x, y, color, lines_cleared) for _ in range(count))
+
+    def update(self) -> None:
+        """更新粒子并移除死亡粒子"""
+        for particle in self.particles:
+            particle.update()
+            if len(particle.trail) > self.trail_length:
+                del particle.trail[:len(particle.trail) - self.trail_length]
+        self.particles = [particle for particle in self.particles if particle.life > 0]
+
+    def cull(self, limit: int) -> None:
+        """粒子超过 limit 时只保留生命值最高的 limit 个"""
+        if len(self.particles) > limit:
+            self.particles = sorted(self.particles, key=lambda particle: particle.life, reverse=True)[:max(0, limit)]
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """绘制粒子"""
+        for particle in self.particles:
+            particle.draw(surface)
+
+    def get_rects(self) -> List[pygame.Rect]:
+        """粒子及拖尾覆盖的区域"""
+        return [particle.get_rect() for particle in self.particles]
+
+    def clear(self) -> None:
+        """移除所有粒子"""
+        self.particles.clear()
+
+
+def create_particle_system(capacity: int = 1024) -> Union[ParticleSystem, ParticleList]:
+    """创建粒子系统（有 NumPy 时使用向量化实现）"""
+    if np is not None:
+        return ParticleSystem(capacity)
+    return ParticleList(capacity)
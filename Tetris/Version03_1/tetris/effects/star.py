@@ -38,8 +38,8 @@ class Star:
 
         self.brightness = 0.3 + 0.7 * (0.5 + 0.5 * math.sin(time * self.speed + self.phase)) * fade_factor
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """绘制星星"""
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        """绘制星星，返回绘制区域"""
         alpha = int(255 * self.brightness)
         color = (alpha, alpha, alpha)
-        pygame.draw.circle(surface, color, (int(self.x), int(self.y)), self.size)
\ No newline at end of file
+        return pygame.draw.circle(surface, color, (int(self.x), int(self.y)), self.size)
\ No newline at end of file
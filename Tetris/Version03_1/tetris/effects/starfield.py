@@ -0,0 +1,211 @@
+"""星空背景 - 以数组批量更新星星亮度，用预渲染的星点精灵批量绘制"""
+
+import math
+import random
+from typing import List, Tuple, Union
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为声明的依赖；未安装时（如精简打包）退回逐个对象的 Star 实现
+    np = None
+
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT
+from .particle import Particle
+from .star import Star
+
+# 星星密度：默认窗口 80 颗，窗口变大（升级加宽棋盘）时按面积增加
+STAR_DENSITY = 80 / (SCREEN_WIDTH * SCREEN_HEIGHT)
+# 亮度量化级数（亮度范围 0.3 ~ 1.0）
+BRIGHTNESS_LEVELS = 32
+MIN_BRIGHTNESS = 0.3
+MAX_SIZE = 3
+# 变化的星星超过该数量时，脏矩形改按 DIRTY_TILE 的网格汇总
+MAX_STAR_RECTS = 64
+DIRTY_TILE = 64
+
+
+def star_count(width: int, height: int, density: float = STAR_DENSITY) -> int:
+    """窗口面积对应的星星数量"""
+    return max(1, int(width * height * density + 0.5))
+
+
+class StarField:
+    """
+    向量化星空
+    位置、尺寸、闪烁相位、生命相位等按列存放在 NumPy 数组中，亮度一次向量运算算出；
+    亮度量化为 BRIGHTNESS_LEVELS 级，按 (尺寸, 亮度级) 取预渲染的星点精灵，用 Surface.blits 一次提交；
+    只有亮度级或位置变化的星星需要登记脏矩形
+    """
+
+    _sprites: List[pygame.Surface] = None
+
+    def __init__(self, width: int, height: int, density: float = STAR_DENSITY, seed: int = None):
+        self.width = width
+        self.height = height
+        self.density = density
+        self._rng = np.random.default_rng(seed)
+
+        count = star_count(width, height, density)
+        self.x = np.zeros(0, dtype=np.int32)
+        self.y = np.zeros(0, dtype=np.int32)
+        self.size = np.zeros(0, dtype=np.int32)
+        self.phase = np.zeros(0)
+        self.speed = np.zeros(0)
+        self.life_phase = np.zeros(0)
+        self.fade_speed = np.zeros(0)
+        self.fading_out = np.zeros(0, dtype=bool)
+        self.brightness = np.zeros(0)
+        self._spawn(count)
+
+        # 上一次绘制的 (精灵编号, 左, 上, 边长)，以及星星左上角坐标的列表（位置变化时重建）
+        self._drawn = None
+        self._positions: List[Tuple[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def _spawn(self, count: int) -> None:
+        """追加 count 颗随机星星"""
+        rng = self._rng
+        self.x = np.concatenate([self.x, rng.integers(0, self.width + 1, count, dtype=np.int32)])
+        self.y = np.concatenate([self.y, rng.integers(0, self.height + 1, count, dtype=np.int32)])
+        self.size = np.concatenate([self.size, rng.integers(1, MAX_SIZE + 1, count, dtype=np.int32)])
+        self.phase = np.concatenate([self.phase, rng.uniform(0, math.pi * 2, count)])
+        self.speed = np.concatenate([self.speed, rng.uniform(0.5, 2.0, count)])
+        self.life_phase = np.concatenate([self.life_phase, rng.uniform(0, math.pi * 2, count)])
+        self.fade_speed = np.concatenate([self.fade_speed, rng.uniform(0.002, 0.005, count)])
+        self.fading_out = np.concatenate([self.fading_out, np.zeros(count, dtype=bool)])
+        self.brightness = np.concatenate([self.brightness, rng.uniform(MIN_BRIGHTNESS, 1.0, count)])
+
+    def resize(self, width: int, height: int) -> None:
+        """窗口大小变化：按面积增减星星，窗口外的星星重新随机位置"""
+        self.width, self.height = width, height
+        count = star_count(width, height, self.density)
+        if count > len(self):
+            self._spawn(count - len(self))
+        elif count < len(self):
+            for name in ('x', 'y', 'size', 'phase', 'speed', 'life_phase', 'fade_speed', 'fading_out', 'brightness'):
+                setattr(self, name, getattr(self, name)[:count])
+
+        outside = (self.x > width) | (self.y > height)
+        if outside.any():
+            self.x[outside] = self._rng.integers(0, width + 1, int(outside.sum()), dtype=np.int32)
+            self.y[outside] = self._rng.integers(0, height + 1, int(outside.sum()), dtype=np.int32)
+        self._drawn = None
+        self._positions = None
+
+    def update(self, time: float) -> None:
+        """更新所有星星：生命相位推进、淡出后换位置重生、计算闪烁亮度"""
+        self.life_phase += self.fade_speed
+        fade = 0.5 + 0.5 * np.sin(self.life_phase)
+
+        self.fading_out |= fade < 0.2
+        respawn = (fade > 0.8) & self.fading_out
+        count = int(respawn.sum())
+        if count:
+            self.x[respawn] = self._rng.integers(0, self.width + 1, count, dtype=np.int32)
+            self.y[respawn] = self._rng.integers(0, self.height + 1, count, dtype=np.int32)
+            self.fading_out[respawn] = False
+            self.life_phase[respawn] = self._rng.uniform(0, math.pi * 2, count)
+            self._positions = None
+
+        self.brightness = MIN_BRIGHTNESS + (1 - MIN_BRIGHTNESS) * (0.5 + 0.5 * np.sin(time * self.speed + self.phase)) * fade
+
+    @staticmethod
+    def _create_sprite(size: int, level: int) -> pygame.Surface:
+        """创建星点精灵（与 pygame.draw.circle 逐像素一致，黑色为透明色）"""
+        brightness = MIN_BRIGHTNESS + (1 - MIN_BRIGHTNESS) * level / (BRIGHTNESS_LEVELS - 1)
+        value = int(255 * brightness)
+        surf = pygame.Surface((size * 2, size * 2))
+        surf.set_colorkey((0, 0, 0))
+        pygame.draw.circle(surf, (value, value, value), (size, size), size)
+        return surf
+
+    @classmethod
+    def sprites(cls) -> List[pygame.Surface]:
+        """全部星点精灵，按 (尺寸 - 1) * BRIGHTNESS_LEVELS + 亮度级 排列（在 SurfaceCache 中常驻）"""
+        if cls._sprites is None:
+            cache = Particle.surface_cache()
+            keys = [('star', size, level) for size in range(1, MAX_SIZE + 1) for level in range(BRIGHTNESS_LEVELS)]
+            cache.warm_up((key, lambda s=key[1], l=key[2]: cls._create_sprite(s, l)) for key in keys)
+            cls._sprites = [cache.get(key) for key in keys]
+        return cls._sprites
+
+    def _dirty_rects(self, left, top, side) -> List[pygame.Rect]:
+        """星星区域的脏矩形（数量过多时按 DIRTY_TILE 网格汇总，避免大量小矩形拖慢合并）"""
+        if len(left) <= MAX_STAR_RECTS:
+            return [
+                pygame.Rect(x, y, size, size)
+                for x, y, size in zip(left.tolist(), top.tolist(), side.tolist())
+            ]
+        cells = set()
+        for x in (left, left + side - 1):
+            for y in (top, top + side - 1):
+                cells.update(zip((x // DIRTY_TILE).tolist(), (y // DIRTY_TILE).tolist()))
+        return [pygame.Rect(x * DIRTY_TILE, y * DIRTY_TILE, DIRTY_TILE, DIRTY_TILE) for x, y in cells]
+
+    def draw(self, surface: pygame.Surface, background: pygame.Surface) -> List[pygame.Rect]:
+        """绘制背景和所有星星，返回与上一次绘制相比亮度级或位置发生变化的区域（新旧位置）"""
+        level = np.rint((self.brightness - MIN_BRIGHTNESS) * ((BRIGHTNESS_LEVELS - 1) / (1 - MIN_BRIGHTNESS)))
+        index = (self.size - 1) * BRIGHTNESS_LEVELS + np.clip(level, 0, BRIGHTNESS_LEVELS - 1).astype(np.int32)
+        left, top, side = self.x - self.size, self.y - self.size, self.size * 2
+        if self._positions is None:
+            self._positions = list(zip(left.tolist(), top.tolist()))
+
+        surface.blit(background, (0, 0))
+        surface.blits(zip(map(self.sprites().__getitem__, index.tolist()), self._positions), doreturn=False)
+
+        drawn, self._drawn = self._drawn, (index, left, top, side)
+        if drawn is None:
+            return self._dirty_rects(left, top, side)
+        changed = (drawn[0] != index) | (drawn[1] != left) | (drawn[2] != top)
+        moved = changed & ((drawn[1] != left) | (drawn[2] != top))
+        return self._dirty_rects(
+            np.concatenate([left[changed], drawn[1][moved]]),
+            np.concatenate([top[changed], drawn[2][moved]]),
+            np.concatenate([side[changed], drawn[3][moved]]),
+        )
+
+
+class StarList:
+    """星空的无 NumPy 实现：逐个更新 Star 对象，接口与 StarField 相同"""
+
+    def __init__(self, width: int, height: int, density: float = STAR_DENSITY, seed: int = None):
+        self.width = width
+        self.height = height
+        self.density = density
+        self.stars: List[Star] = []
+        self.resize(width, height)
+
+    def __len__(self) -> int:
+        return len(self.stars)
+
+    def resize(self, width: int, height: int) -> None:
+        """窗口大小变化：按面积增减星星，更新星星边界"""
+        self.width, self.height = width, height
+        count = star_count(width, height, self.density)
+        del self.stars[count:]
+        while len(self.stars) < count:
+            self.stars.append(Star(random.randint(0, width), random.randint(0, height), width, height))
+        for star in self.stars:
+            star.screen_width = width
+            star.screen_height = height
+
+    def update(self, time: float) -> None:
+        """更新所有星星"""
+        for star in self.stars:
+            star.update(time)
+
+    def draw(self, surface: pygame.Surface, background: pygame.Surface) -> List[pygame.Rect]:
+        """绘制背景和所有星星，返回星星的绘制区域"""
+        surface.blit(background, (0, 0))
+        return [star.draw(surface) for star in self.stars]
+
+
+def create_star_field(width: int, height: int, density: float = STAR_DENSITY) -> Union[StarField, StarList]:
+    """创建星空（有 NumPy 时使用向量化实现）"""
+    if np is not None:
+        return StarField(width, height, density)
+    return StarList(width, height, density)
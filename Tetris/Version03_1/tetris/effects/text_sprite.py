@@ -0,0 +1,177 @@
+"""浮动文字预渲染 - 光晕、主体、高光图层每个文字只合成一次，动画只改透明度和缩放"""
+
+import math
+from typing import Dict, List, Tuple
+
+import pygame
+
+Color = Tuple[int, int, int]
+
+# 彩虹光晕的色相量化帧数（按需合成，每个文字最多 HUE_FRAMES 张）
+HUE_FRAMES = 16
+# 淡入缩放的量化级数
+SCALE_STEPS = 8
+
+# 光晕半径：TETRIS 多层彩虹光晕 / 普通霓虹光晕
+TETRIS_GLOW = 8
+NEON_GLOW = 3
+
+GOLD = (255, 235, 75)   # 金色脉冲的平均色
+WHITE = (255, 255, 255)
+
+
+def rainbow(phase: float) -> Color:
+    """彩虹颜色"""
+    return (
+        int(127 + 127 * math.sin(phase)),
+        int(127 + 127 * math.sin(phase + 2.094)),
+        int(127 + 127 * math.sin(phase + 4.189)),
+    )
+
+
+def hue_frame(phase: float) -> int:
+    """彩虹相位的量化帧号"""
+    return int((phase % (math.pi * 2)) / (math.pi * 2) * HUE_FRAMES) % HUE_FRAMES
+
+
+def _tint(mask: pygame.Surface, color: Color, alpha: int) -> pygame.Surface:
+    """把白色蒙版染色并乘以透明度"""
+    surface = mask.copy()
+    surface.fill((*color, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+
+def _dilations(glyph: pygame.Surface, radius: int, pad: int) -> List[pygame.Surface]:
+    """
+    字形的逐级膨胀蒙版，返回 [半径 0, 1, ..., radius]
+    奇数步按十字、偶数步按 3x3 扩展，近似圆形膨胀
+    """
+    width, height = glyph.get_size()
+    mask = pygame.Surface((width + pad * 2, height + pad * 2), pygame.SRCALPHA)
+    mask.fill((0, 0, 0, 0))
+    mask.blit(glyph, (pad, pad), special_flags=pygame.BLEND_RGBA_MAX)
+
+    cross = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    square = cross + [(-1, -1), (1, -1), (-1, 1), (1, 1)]
+    masks = [mask]
+    for step in range(1, radius + 1):
+        grown = mask.copy()
+        grown.blits(
+            [(mask, offset, None, pygame.BLEND_RGBA_MAX) for offset in (cross if step % 2 else square)],
+            doreturn=False
+        )
+        masks.append(grown)
+        mask = grown
+    return masks
+
+
+def _glow(masks: List[pygame.Surface], layers: List[Tuple[int, Color, int]], mix: int = 255) -> pygame.Surface:
+    """
+    由外向内叠加光晕层 [(膨胀半径, 颜色, alpha)]：
+    颜色按 mix 比例逐层混合（内层在上），alpha 各层累加，最后相乘，避免半透明层在透明底上叠加变暗
+    """
+    size = masks[0].get_size()
+    colour = pygame.Surface(size, pygame.SRCALPHA)
+    colour.fill((0, 0, 0, 0))
+    alpha = pygame.Surface(size, pygame.SRCALPHA)
+    alpha.fill((255, 255, 255, 0))
+    for radius, color, g_alpha in layers:
+        colour.blit(_tint(masks[radius], color, mix), (0, 0))
+        alpha.blit(_tint(masks[radius], WHITE, g_alpha), (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    colour.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)
+    colour.blit(alpha, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return colour
+
+
+class TextSprite:
+    """
+    浮动文字的预渲染图层
+    字形只渲染一次（白色），光晕由逐级膨胀的蒙版染色叠加得到；
+    TETRIS 文字的彩虹光晕按色相量化帧按需合成，淡入缩放按级数缓存
+    """
+
+    def __init__(self, text: str, font: pygame.font.Font, color: Color, is_tetris: bool = False):
+        self.is_tetris = is_tetris
+        self.color = color
+        self.pad = (TETRIS_GLOW if is_tetris else NEON_GLOW) * 2
+
+        glyph = font.render(text, True, WHITE)
+        self.text_size = glyph.get_size()
+        self._masks = _dilations(glyph, TETRIS_GLOW if is_tetris else NEON_GLOW, self.pad)
+        core = self._masks[0]
+
+        if is_tetris:
+            self.core = core
+            self.highlight = _tint(core, GOLD, 255)
+            self._gold_ring = _tint(self._masks[2], GOLD, 230)
+            self._glows: Dict[int, pygame.Surface] = {}
+        else:
+            self.core = _tint(core, color, 255)
+            self.highlight = core
+            self._neon_glow = _glow(self._masks, [(3, color, 60), (2, color, 70), (1, color, 90)])
+
+        self._scaled: Dict[Tuple[str, int, int], pygame.Surface] = {}
+
+    def glow(self, phase: float) -> Tuple[pygame.Surface, int]:
+        """光晕图层及其缓存帧号（TETRIS 按彩虹相位取量化帧）"""
+        if not self.is_tetris:
+            return self._neon_glow, 0
+        frame = hue_frame(phase)
+        glow = self._glows.get(frame)
+        if glow is None:
+            base = frame * math.pi * 2 / HUE_FRAMES
+            glow = _glow(self._masks, [
+                (radius, rainbow(base + radius * 0.3), 16 * radius)
+                for radius in range(TETRIS_GLOW, 0, -1)
+            ], mix=64)
+            glow.blit(self._gold_ring, (0, 0))
+            self._glows[frame] = glow
+        return glow, frame
+
+    def scaled(self, name: str, surface: pygame.Surface, frame: int, scale: float) -> Tuple[pygame.Surface, int]:
+        """按量化缩放级别返回图层（原尺寸直接返回），以及缩放后的边距"""
+        step = min(SCALE_STEPS, max(1, int(scale * SCALE_STEPS + 0.5)))
+        if step >= SCALE_STEPS:
+            return surface, self.pad
+        key = (name, frame, step)
+        result = self._scaled.get(key)
+        if result is None:
+            factor = step / SCALE_STEPS
+            width, height = surface.get_size()
+            result = pygame.transform.smoothscale(
+                surface, (max(1, int(width * factor)), max(1, int(height * factor)))
+            )
+            self._scaled[key] = result
+        return result, int(self.pad * step / SCALE_STEPS)
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        x: int,
+        y: int,
+        alpha: int,
+        pulse: float,
+        phase: float = 0.0,
+        scale: float = 1.0
+    ) -> pygame.Rect:
+        """以文字左上角 (x, y) 绘制，只调整各图层透明度，返回绘制区域"""
+        glow, frame = self.glow(phase)
+        glow, pad = self.scaled('glow', glow, frame, scale)
+        core, _ = self.scaled('core', self.core, 0, scale)
+        highlight, _ = self.scaled('highlight', self.highlight, 0, scale)
+
+        if self.is_tetris:
+            # 多层光晕接近饱和，脉冲只带来轻微的明暗变化
+            glow_alpha, highlight_alpha = alpha * (0.75 + 0.25 * pulse), alpha * 0.6 * pulse
+        else:
+            glow_alpha, highlight_alpha = alpha * pulse, alpha * 0.3 * pulse
+
+        glow.set_alpha(int(glow_alpha))
+        core.set_alpha(alpha)
+        highlight.set_alpha(int(highlight_alpha))
+        rect = surface.blit(glow, (x - pad, y - pad))
+        surface.blits([
+            (core, (x - pad, y - pad)),
+            (highlight, (x - pad + 1, y - pad + 1)),
+        ], doreturn=False)
+        return rect
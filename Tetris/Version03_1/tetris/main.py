@@ -1,12 +1,12 @@
 """游戏主入口"""
 
 import pygame
-import random
-from typing import Optional, List
+from typing import Optional, Union
 
 # 使用绝对导入或直接导入模块
 import sys
 import os
+import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tetris.config import (
@@ -15,16 +15,19 @@ from tetris.config import (
 )
 from tetris.core import GameEngine, GameState, StateMachine
 from tetris.audio import SoundManager
-from tetris.effects import Star, EffectManager
+from tetris.effects import StarField, StarList, EffectManager, create_star_field
 from tetris.rendering import Renderer, FontManager
 from tetris.player import Player, PlayerManager
-from tetris.utils import get_data_path, load_json_data, save_json_data
+from tetris.utils import FrameProfiler, get_data_path, load_json_data, save_json_data
+
+# 切换帧时间分析叠加层的按键
+PROFILER_KEY = pygame.K_F3
 
 
 class GameRunner:
     """游戏运行器"""
 
-    def __init__(self, num_players: int = 1):
+    def __init__(self, num_players: int = 1, record_replays: bool = False, cpu: bool = False, profile: bool = False):
         # 初始化pygame
         pygame.init()
         pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
@@ -34,16 +37,7 @@ class GameRunner:
         self.config = GameConfig()
 
         # 创建窗口
-        flags = pygame.HWSURFACE | pygame.DOUBLEBUF
-        try:
-            self.screen = pygame.display.set_mode(
-                (self.config.screen_width, self.config.screen_height),
-                flags
-            )
-        except Exception:
-            self.screen = pygame.display.set_mode(
-                (self.config.screen_width, self.config.screen_height)
-            )
+        self.screen = self._set_mode()
 
         pygame.display.set_caption("Tetris - Neon Edition")
 
@@ -65,35 +59,69 @@ class GameRunner:
 
         # 玩家管理
         self.num_players = num_players
+        self.record_replays = record_replays
+        self.cpu = cpu
         self.player_manager = PlayerManager(self.config, self.sound_manager)
         self._setup_players()
 
         # 背景星星
-        self.stars: List[Star] = []
-        for _ in range(80):
-            self.stars.append(Star(
-                random.randint(0, self.config.screen_width),
-                random.randint(0, self.config.screen_height),
-                self.config.screen_width,
-                self.config.screen_height
-            ))
+        self.stars: Union[StarField, StarList] = create_star_field(
+            self.config.screen_width, self.config.screen_height
+        )
 
         # 时间
         self.time = 0
 
+        # 上一次提交画面时的状态（状态切换时整屏提交）
+        self._presented_state: Optional[GameState] = None
+
+        # 帧时间分析（F3 切换；停用时计时包装全部移除）
+        self.profiler = FrameProfiler(enabled=profile)
+        self._instrument()
+
     def _setup_players(self) -> None:
         """设置玩家"""
         if self.num_players == 1:
-            # 单人模式
-            player = self.player_manager.add_player("player1", (0, 0))
+            # 单人模式（cpu=True 时由电脑演示）
+            player = self.player_manager.add_player("player1", (0, 0), cpu=self.cpu)
+            self.renderer.attach_engine(player.engine)
             # 订阅升级事件以触发窗口调整
             player.engine.events.level_up.subscribe(self._on_level_up)
+            if self.record_replays:
+                player.enable_recording()
         else:
             # 多人模式（需要调整布局）
             # TODO: 实现多人布局
             player = self.player_manager.add_player("player1", (0, 0))
+            self.renderer.attach_engine(player.engine)
             player.engine.events.level_up.subscribe(self._on_level_up)
 
+    def _instrument(self) -> None:
+        """登记需要计时的子系统"""
+        profiler = self.profiler
+        profiler.instrument(self, {'handle_continuous_input': 'input'})
+        profiler.instrument(
+            self.renderer,
+            [name for name in dir(Renderer) if name.startswith('draw_') and name != 'draw_profiler'] + ['present']
+        )
+        for player in self.player_manager.get_all_players():
+            profiler.instrument(player.engine, {'update': 'engine.update'})
+            profiler.instrument(player, {'update_effects': 'effects.update'})
+            profiler.instrument(player.effects, ['draw_effects', 'draw_particles', 'draw_floating_texts', 'draw_level_up_effects'])
+
+    def _save_profile(self) -> None:
+        """把本局帧时间统计导出到 profiles 目录（CSV 和 JSON 各一份）"""
+        if not self.profiler.frames:
+            return
+        profile_dir = get_data_path("profiles")
+        try:
+            os.makedirs(profile_dir, exist_ok=True)
+            base = os.path.join(profile_dir, time.strftime('%Y%m%d_%H%M%S'))
+            self.profiler.export_csv(base + ".csv")
+            self.profiler.export_json(base + ".json")
+        except OSError:
+            pass
+
     def _on_level_up(self, level: int) -> None:
         """升级时调整窗口大小"""
         self._resize_window()
@@ -108,16 +136,36 @@ class GameRunner:
         filepath = get_data_path("highscore.json")
         save_json_data(filepath, {"high_score": self.high_score})
 
+    def _save_replay(self, player: Player) -> None:
+        """保存本局回放到 replays 目录"""
+        if not player.recorder or not player.recorder.replay:
+            return
+        replay_dir = get_data_path("replays")
+        try:
+            os.makedirs(replay_dir, exist_ok=True)
+            filename = f"{time.strftime('%Y%m%d_%H%M%S')}_{player.player_id}.trpl"
+            player.recorder.replay.save(os.path.join(replay_dir, filename))
+        except OSError:
+            pass
+
+    def _set_mode(self) -> pygame.Surface:
+        """按配置创建窗口（请求的垂直同步不可用时退回普通窗口）"""
+        size = (self.config.screen_width, self.config.screen_height)
+        flags = pygame.HWSURFACE | pygame.DOUBLEBUF
+        try:
+            return pygame.display.set_mode(size, flags, vsync=int(self.config.vsync))
+        except Exception:
+            return pygame.display.set_mode(size)
+
     def _resize_window(self) -> None:
         """调整窗口大小"""
-        self.screen = pygame.display.set_mode(
-            (self.config.screen_width, self.config.screen_height)
-        )
+        self.screen = self._set_mode()
         self.renderer.update_config(self.config)
-        # 更新星星边界
-        for star in self.stars:
-            star.max_x = self.config.screen_width
-            star.max_y = self.config.screen_height
+        # 重建升级边缘光晕
+        for player in self.player_manager.get_all_players():
+            player.effects.build_edge_glow()
+        # 按新窗口面积增减星星
+        self.stars.resize(self.config.screen_width, self.config.screen_height)
 
     def reset_game(self) -> None:
         """重置游戏"""
@@ -131,6 +179,12 @@ class GameRunner:
         state = self.state_machine.get_state()
         state_str = state.value
 
+        # 帧时间分析叠加层（任何状态下可切换）
+        if event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+            self.profiler.toggle()
+            self.renderer.dirty.force_full()
+            return
+
         # 状态转换
         if event.type == pygame.KEYDOWN:
             if state == GameState.START:
@@ -172,7 +226,7 @@ class GameRunner:
             for player in self.player_manager.get_all_players():
                 player.handle_input(event, state_str)
 
-    def handle_continuous_input(self, dt_ms: int) -> None:
+    def handle_continuous_input(self, dt_ms: float) -> None:
         """处理连续输入"""
         state = self.state_machine.get_state()
         if state == GameState.PLAYING:
@@ -180,10 +234,7 @@ class GameRunner:
                 player.handle_continuous_input(dt_ms, state.value)
 
     def update(self, dt: float) -> None:
-        """更新游戏状态"""
-        self.time += dt
-        self.renderer.update(dt)
-
+        """推进一个逻辑步长的游戏状态"""
         state = self.state_machine.get_state()
 
         if state == GameState.PLAYING:
@@ -200,14 +251,25 @@ class GameRunner:
                     self.sound_manager.stop_bgm()
                     self.sound_manager.play_sound('game_over')
 
+                    if self.record_replays:
+                        self._save_replay(player)
+
                     # 更新最高分
                     score = player.get_score()
                     if score > self.high_score:
                         self.high_score = score
                         self._save_high_score()
 
-    def render(self) -> None:
-        """渲染画面"""
+    def update_effects(self, dt: float) -> None:
+        """按实际帧时间更新动画和特效"""
+        self.time += dt
+        self.renderer.update(dt)
+        if self.state_machine.get_state() == GameState.PLAYING:
+            for player in self.player_manager.get_all_players():
+                player.update_effects(dt)
+
+    def render(self, extra_time: float = 0.0) -> None:
+        """渲染画面（extra_time 为上一次逻辑更新之后经过的时间，用于下落插值）"""
         state = self.state_machine.get_state()
 
         if state == GameState.START:
@@ -235,7 +297,7 @@ class GameRunner:
                 )
 
                 # 玩家渲染
-                player.render(self.renderer)
+                player.render(self.renderer, extra_time)
 
         elif state == GameState.PAUSED:
             player = self.player_manager.get_player("player1")
@@ -244,8 +306,11 @@ class GameRunner:
                 self.renderer.draw_grid(player.engine.board)
                 self.renderer.draw_board(player.engine.board)
                 if player.engine.current_piece:
-                    self.renderer.draw_piece(player.engine.current_piece)
-                self.renderer.draw_next_piece(player.engine.next_piece)
+                    self.renderer.draw_piece(
+                        player.engine.current_piece,
+                        fall_offset=player.engine.get_fall_progress()
+                    )
+                self.renderer.draw_next_piece(player.engine.next_piece, upcoming=player.engine.next_queue[1:])
                 self.renderer.draw_divider()
                 self.renderer.draw_panel(
                     self.high_score,
@@ -272,31 +337,57 @@ class GameRunner:
                     player.get_score() >= self.high_score
                 )
 
-        pygame.display.flip()
+        if self.profiler.enabled:
+            self.renderer.draw_profiler(self.profiler)
+
+        if state != self._presented_state:
+            self.renderer.dirty.force_full()
+            self._presented_state = state
+        self.renderer.present()
 
     def run(self) -> None:
-        """运行游戏主循环"""
+        """
+        运行游戏主循环
+        逻辑按 logic_rate 固定步长推进（慢帧时一帧内补推多步，最多 max_logic_steps 步，超出的时间丢弃），
+        特效按实际帧时间推进，渲染帧率不受逻辑限制（render_fps 为 0 时不限帧，可配合 vsync）
+        """
         running = True
-        last_time = pygame.time.get_ticks()
+        step = 1.0 / self.config.logic_rate
+        max_steps = self.config.max_logic_steps
+        accumulator = 0.0
+        last_time = time.perf_counter()
 
         while running:
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0
-            dt_ms = current_time - last_time
+            current_time = time.perf_counter()
+            frame_time = current_time - last_time
             last_time = current_time
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                else:
-                    self.handle_input(event)
-
-            self.handle_continuous_input(dt_ms)
-            self.update(dt)
-            self.render()
-
-            self.clock.tick(60)
-
+            self.profiler.begin_frame()
+
+            with self.profiler.scope('input'):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    else:
+                        self.handle_input(event)
+
+            accumulator += frame_time
+            steps = 0
+            while accumulator >= step and steps < max_steps:
+                self.handle_continuous_input(step * 1000)
+                self.update(step)
+                accumulator -= step
+                steps += 1
+            if accumulator >= step:
+                # 追赶预算用完：丢弃积压的时间（游戏暂时变慢，避免越积越多）
+                accumulator %= step
+
+            self.update_effects(min(frame_time, max_steps * step))
+            self.render(accumulator)
+            self.profiler.end_frame()
+
+            self.clock.tick(self.config.render_fps)
+
+        self._save_profile()
         pygame.quit()
 
 
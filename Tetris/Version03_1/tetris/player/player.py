@@ -6,11 +6,13 @@ import random
 import pygame
 
 from ..config import GameConfig
-from ..core import GameEngine, GameState
+from ..core import Action, GameEngine, GameState
 from ..audio import SoundManager
 from ..effects import EffectManager
 from ..input import InputHandler, KeyBindings
 from ..rendering import Renderer
+from ..replay import ReplayRecorder
+from ..ai import AIController, HeuristicWeights, DEFAULT_APM
 
 
 class Player:
@@ -39,6 +41,12 @@ class Player:
         # 分数记录
         self.high_score = 0
 
+        # 回放录制（按需开启）
+        self.recorder: Optional[ReplayRecorder] = None
+
+        # 电脑控制（按需开启，开启后忽略键盘操作）
+        self.ai: Optional[AIController] = None
+
         # 设置输入回调
         self._setup_input_callbacks()
 
@@ -61,6 +69,36 @@ class Player:
         self.engine.events.level_up.subscribe(self._on_level_up)
         self.engine.events.combo_changed.subscribe(self._on_combo)
 
+    def enable_recording(self) -> ReplayRecorder:
+        """开启回放录制（记录输入与重力，配合种子可完整重演）"""
+        if self.recorder is None:
+            self.recorder = ReplayRecorder(self.engine, self.input_handler)
+            self.recorder.start()
+        return self.recorder
+
+    def enable_ai(
+        self,
+        weights: Optional[HeuristicWeights] = None,
+        apm: Optional[float] = DEFAULT_APM
+    ) -> AIController:
+        """交由电脑控制（操作经过输入回调执行，回放录制照常工作）"""
+        if self.ai is None:
+            self.ai = AIController(self.engine, weights, apm, apply=self._apply_ai_action)
+            self.engine.events.game_reset.subscribe(lambda seed: self.ai.reset())
+        return self.ai
+
+    def _apply_ai_action(self, action: Action) -> bool:
+        """通过输入回调执行电脑的操作"""
+        ih = self.input_handler
+        callback = {
+            Action.LEFT: ih.on_move_left,
+            Action.RIGHT: ih.on_move_right,
+            Action.DOWN: ih.on_move_down,
+            Action.ROTATE: ih.on_rotate,
+            Action.HARD_DROP: ih.on_hard_drop,
+        }.get(action)
+        return bool(callback()) if callback else False
+
     def _on_lines_cleared(self, lines_count: int, line_indices: list) -> None:
         """消行事件处理"""
         # 使用消除行的位置计算Y坐标，并保存供Level Up和Combo使用
@@ -120,35 +158,46 @@ class Player:
             self.sound_manager.play_bgm()
 
     def update(self, dt: float) -> None:
-        """更新玩家状态"""
+        """推进玩家的游戏逻辑（电脑操作、下落和引擎计时器）"""
         # 应用慢动作
         if self.effects.slow_motion_timer > 0:
             actual_dt = dt * self.effects.slow_motion_factor
         else:
             actual_dt = dt
 
-        # 更新引擎
+        # 电脑操作（按真实时间计算 APM）
+        if self.ai:
+            self.ai.update(dt)
+
+        # 更新引擎（引擎计时器按本次经过的逻辑帧推进）
+        frame = self.engine.frame
         self.engine.update(actual_dt)
-        self.engine.update_effects()
+        self.engine.update_effects(self.engine.frame - frame)
 
+    def update_effects(self, dt: float) -> None:
+        """按实际帧时间更新特效（与逻辑步长无关）"""
         # 同步特效状态
         self.effects.block_flash = self.engine.shake_offset[0] / 10 if self.engine.level_up_effect > 0 else 0
 
         # 更新特效
-        self.effects.update(dt)
-        self.effects.update_particles()
+        frames = self.effects.update(dt)
+        self.effects.update_particles(frames)
         self.effects.update_floating_texts(dt)
 
     def handle_input(self, event: pygame.event.Event, state: str) -> Optional[str]:
         """处理输入事件"""
+        if self.ai:
+            return None
         return self.input_handler.handle_event(event, state)
 
     def handle_continuous_input(self, dt_ms: int, state: str) -> None:
         """处理连续输入"""
+        if self.ai:
+            return
         self.input_handler.handle_continuous_input(dt_ms, state)
 
-    def render(self, renderer: Renderer) -> None:
-        """渲染玩家画面"""
+    def render(self, renderer: Renderer, extra_time: float = 0.0) -> None:
+        """渲染玩家画面（extra_time 为上一次逻辑更新之后经过的时间，用于当前方块的下落插值）"""
         offset = self.board_position
         shake = tuple(self.effects.shake_offset)
 
@@ -165,11 +214,12 @@ class Player:
                 self.engine.current_piece, shake,
                 draw_ghost=True,
                 ghost_positions=ghost_positions,
-                board=self.engine.board
+                board=self.engine.board,
+                fall_offset=self.engine.get_fall_progress(extra_time * self.effects.slow_motion_factor)
             )
 
         # 绘制预览方块
-        renderer.draw_next_piece(self.engine.next_piece, offset)
+        renderer.draw_next_piece(self.engine.next_piece, offset, self.engine.next_queue[1:])
 
         # 绘制特效
         self.effects.draw_effects(renderer.screen, shake)
@@ -178,6 +228,12 @@ class Player:
         self.effects.draw_floating_texts(renderer.screen, renderer.fonts.medium, renderer.fonts.font_name)
         self.effects.draw_level_up_effects(renderer.screen)
 
+        # 脏矩形：全屏特效期间整屏提交，否则登记特效区域
+        if self.effects.is_fullscreen():
+            renderer.dirty.force_full()
+        else:
+            renderer.dirty.add_all(self.effects.get_dirty_rects(shake))
+
     def is_game_over(self) -> bool:
         """是否游戏结束"""
         return self.engine.is_game_over()
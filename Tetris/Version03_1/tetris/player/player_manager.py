@@ -7,6 +7,7 @@ from .player import Player
 from ..config import GameConfig
 from ..audio import SoundManager
 from ..input import KeyBindings
+from ..ai import HeuristicWeights, DEFAULT_APM
 
 
 class PlayerManager:
@@ -25,9 +26,12 @@ class PlayerManager:
         self,
         player_id: str,
         board_position: tuple = (0, 0),
-        key_bindings: Optional[KeyBindings] = None
+        key_bindings: Optional[KeyBindings] = None,
+        cpu: bool = False,
+        ai_weights: Optional[HeuristicWeights] = None,
+        apm: Optional[float] = DEFAULT_APM
     ) -> Player:
-        """添加玩家"""
+        """添加玩家（cpu=True 时为电脑对手）"""
         player = Player(
             player_id,
             self.config,
@@ -35,6 +39,8 @@ class PlayerManager:
             key_bindings,
             self.sound_manager
         )
+        if cpu:
+            player.enable_ai(ai_weights, apm)
         self.players.append(player)
         return player
 
@@ -54,9 +60,10 @@ class PlayerManager:
         return self.players
 
     def update_all(self, dt: float) -> None:
-        """更新所有玩家"""
+        """更新所有玩家（逻辑和特效）"""
         for player in self.players:
             player.update(dt)
+            player.update_effects(dt)
 
     def handle_input_all(self, event: pygame.event.Event, state: str) -> Optional[str]:
         """处理所有玩家输入"""
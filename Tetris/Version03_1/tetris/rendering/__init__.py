@@ -1,8 +1,11 @@
 """渲染模块"""
 
 from .surface_cache import SurfaceCache
+from .block_atlas import BlockAtlas
 from .block_renderer import BlockRenderer
+from .board_layer import BoardLayer
 from .fonts import FontManager
+from .profiler_overlay import ProfilerOverlay
 from .renderer import Renderer
 
-__all__ = ['SurfaceCache', 'BlockRenderer', 'FontManager', 'Renderer']
\ No newline at end of file
+__all__ = ['SurfaceCache', 'BlockAtlas', 'BlockRenderer', 'BoardLayer', 'FontManager', 'ProfilerOverlay', 'Renderer']
\ No newline at end of file
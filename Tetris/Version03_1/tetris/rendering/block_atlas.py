@@ -0,0 +1,206 @@
+"""方块精灵图集 - 预绘制各颜色、亮度级别和尺寸的方块，绘制时按子矩形 blit"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+# 亮度量化级别数（呼吸和闪光各自独立量化）
+BREATH_LEVELS = 16
+FLASH_LEVELS = 16
+GHOST_LEVELS = 16
+
+# 霓虹方块光晕外扩像素
+NEON_GLOW = 8
+
+# 呼吸亮度范围（与动画公式一致）
+NEON_BREATH_RANGE = (0.84, 1.0)   # 0.92 ± 0.08
+GHOST_BREATH_RANGE = (0.4, 1.0)   # 0.7 ± 0.3
+
+Color = Tuple[int, int, int]
+
+
+def quantize(value: float, low: float, high: float, levels: int) -> int:
+    """把 [low, high] 内的值量化为 0..levels-1"""
+    t = (value - low) / (high - low)
+    return min(levels - 1, max(0, int(t * (levels - 1) + 0.5)))
+
+
+def level_value(level: int, low: float, high: float, levels: int) -> float:
+    """量化级别对应的值"""
+    return low + (high - low) * level / (levels - 1)
+
+
+def neon_color(color: Color, level: int) -> Color:
+    """霓虹方块在指定级别下的颜色（前 BREATH_LEVELS 级为呼吸，其后为闪光）"""
+    r, g, b = color
+    if level >= BREATH_LEVELS:
+        intensity = (level - BREATH_LEVELS + 1) / FLASH_LEVELS
+        return (
+            min(255, int(r + (255 - r) * intensity * 0.8)),
+            min(255, int(g + (255 - g) * intensity * 0.7)),
+            min(255, int(b + (255 - b) * intensity * 0.5)),
+        )
+    breath = level_value(level, *NEON_BREATH_RANGE, BREATH_LEVELS)
+    return min(255, int(r * breath)), min(255, int(g * breath)), min(255, int(b * breath))
+
+
+def paint_neon_block(target: pygame.Surface, color: Color, level: int, size: int) -> None:
+    """在 (size + 2 * NEON_GLOW) 见方的透明区域上绘制带光晕的霓虹方块"""
+    r, g, b = neon_color(color, level)
+
+    # 光晕层
+    for i in range(NEON_GLOW, 0, -2):
+        alpha = int(25 * (1 - i / NEON_GLOW))
+        pygame.draw.rect(target, (r, g, b, alpha), (NEON_GLOW - i, NEON_GLOW - i, size + i * 2, size + i * 2), border_radius=5)
+
+    # 方块主体（单独绘制后叠加到光晕上）
+    block_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+
+    pygame.draw.rect(block_surf, (r // 4, g // 4, b // 4, 200), (0, 0, size, size), border_radius=4)
+
+    inner_margin = 3
+    inner_size = size - inner_margin * 2
+    pygame.draw.rect(block_surf, (r, g, b, 60), (inner_margin, inner_margin, inner_size, inner_size), border_radius=3)
+
+    # 玻璃高光效果
+    for i in range(inner_size // 3):
+        alpha = int(80 * (1 - i / (inner_size // 3)))
+        pygame.draw.line(
+            block_surf, (255, 255, 255, alpha),
+            (inner_margin + 2, inner_margin + 2 + i),
+            (inner_size + inner_margin - 2, inner_margin + 2 + i)
+        )
+
+    pygame.draw.rect(block_surf, (255, 255, 255, 40), (inner_margin + 2, inner_margin + 2, 3, inner_size - 4), border_radius=2)
+    pygame.draw.rect(block_surf, (0, 0, 0, 60), (size - inner_margin - 5, inner_margin + 2, 3, inner_size - 4), border_radius=2)
+    pygame.draw.rect(block_surf, (0, 0, 0, 40), (inner_margin + 2, size - inner_margin - 4, inner_size - 4, 3), border_radius=2)
+    pygame.draw.rect(block_surf, (r, g, b, 200), (0, 0, size, size), 2, border_radius=4)
+    pygame.draw.rect(
+        block_surf,
+        (min(255, r + 50), min(255, g + 50), min(255, b + 50), 150),
+        (1, 1, size - 2, size - 2), 1, border_radius=3
+    )
+
+    target.blit(block_surf, (NEON_GLOW, NEON_GLOW))
+
+
+def paint_ghost_block(target: pygame.Surface, color: Color, level: int, size: int) -> None:
+    """在 size 见方的透明区域上绘制幽灵方块"""
+    breath = level_value(level, *GHOST_BREATH_RANGE, GHOST_LEVELS)
+
+    # 光晕（超出方块的部分被裁掉）
+    glow_surf = pygame.Surface((size + 8, size + 8), pygame.SRCALPHA)
+    for i in range(4, 0, -1):
+        alpha = int(30 * breath * (1 - i / 4))
+        pygame.draw.rect(glow_surf, (*color, alpha), (4 - i, 4 - i, size + i * 2, size + i * 2), border_radius=4)
+    target.blit(glow_surf, (-4, -4))
+
+    # 主体
+    pygame.draw.rect(target, (*color, int(30 * breath)), (0, 0, size, size), border_radius=3)
+    pygame.draw.rect(target, (*color, int(120 * breath)), (0, 0, size, size), 2, border_radius=3)
+
+    # 高光
+    highlight_color = (min(255, color[0] + 100), min(255, color[1] + 100), min(255, color[2] + 100))
+    pygame.draw.rect(target, (*highlight_color, int(80 * breath)), (1, 1, size - 2, size - 2), 1, border_radius=2)
+
+
+Painter = Callable[[pygame.Surface, Color, int, int], None]
+
+
+class AtlasPage:
+    """
+    图集页 - 一种方块样式和尺寸对应一张 Surface：
+    每种颜色占一行，每个亮度级别占一列，格子在首次使用时绘制
+    """
+
+    def __init__(self, painter: Painter, size: int, cell: int, levels: int):
+        self.painter = painter
+        self.size = size
+        self.cell = cell
+        self.levels = levels
+        self.rows: Dict[Color, int] = {}
+        self.rects: List[List[pygame.Rect]] = []
+        self.baked: List[bytearray] = []
+        self.surface = self._new_surface(0)
+        self._premultiplied: Optional[pygame.Surface] = None
+
+    def _new_surface(self, rows: int) -> pygame.Surface:
+        """创建指定行数的图集 Surface（有显示模式时转换为显示格式以加速 blit）"""
+        surface = pygame.Surface((self.cell * self.levels, self.cell * max(1, rows)), pygame.SRCALPHA)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        return surface
+
+    def _add_row(self, color: Color) -> int:
+        """为新颜色追加一行（图集变高，保留已绘制的内容）"""
+        row = len(self.rects)
+        if row > 0:
+            surface = self._new_surface(row + 1)
+            surface.blit(self.surface, (0, 0))
+            self.surface = surface
+            self._premultiplied = None
+        self.rows[color] = row
+        self.rects.append([
+            pygame.Rect(level * self.cell, row * self.cell, self.cell, self.cell)
+            for level in range(self.levels)
+        ])
+        self.baked.append(bytearray(self.levels))
+        return row
+
+    def area(self, color: Color, level: int) -> pygame.Rect:
+        """返回 (颜色, 级别) 在图集中的子矩形，必要时先绘制"""
+        row = self.rows.get(color)
+        if row is None:
+            row = self._add_row(color)
+        rect = self.rects[row][level]
+        if not self.baked[row][level]:
+            self.painter(self.surface.subsurface(rect), color, level, self.size)
+            self.baked[row][level] = 1
+            self._premultiplied = None
+        return rect
+
+    def premultiplied(self) -> pygame.Surface:
+        """预乘 alpha 版本的图集（供 BLEND_PREMULTIPLIED 合成到中间层，绘制新格子后重新生成）"""
+        if self._premultiplied is None:
+            self._premultiplied = self.surface.premul_alpha()
+        return self._premultiplied
+
+    def bake(self, colors: List[Color]) -> None:
+        """预先绘制给定颜色的所有级别"""
+        for color in colors:
+            for level in range(self.levels):
+                self.area(color, level)
+
+
+class BlockAtlas:
+    """方块精灵图集 - 按 (样式, 尺寸) 管理图集页"""
+
+    def __init__(self):
+        self.pages: Dict[Tuple[str, int], AtlasPage] = {}
+
+    def neon_page(self, size: int) -> AtlasPage:
+        """霓虹方块图集页（格子包含光晕，方块位于 (NEON_GLOW, NEON_GLOW)）"""
+        page = self.pages.get(('neon', size))
+        if page is None:
+            page = AtlasPage(paint_neon_block, size, size + NEON_GLOW * 2, BREATH_LEVELS + FLASH_LEVELS)
+            self.pages[('neon', size)] = page
+        return page
+
+    def ghost_page(self, size: int) -> AtlasPage:
+        """幽灵方块图集页"""
+        page = self.pages.get(('ghost', size))
+        if page is None:
+            page = AtlasPage(paint_ghost_block, size, size, GHOST_LEVELS)
+            self.pages[('ghost', size)] = page
+        return page
+
+    def warm_up(self, colors: List[Color], sizes: Tuple[int, ...]) -> None:
+        """预先绘制常用颜色和尺寸（启动时调用，避免游戏中首次出现时卡顿）"""
+        for size in sizes:
+            self.neon_page(size).bake(colors)
+            self.ghost_page(size).bake(colors)
+
+    def clear(self) -> None:
+        """清除所有图集页"""
+        self.pages.clear()
@@ -0,0 +1,167 @@
+"""棋盘层缓存 - 已锁定的方块按呼吸级别预先绘制到 Surface，只重绘脏行"""
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+import pygame
+
+from ..config import GRID_SIZE, NEON_COLORS, GameConfig
+from .block_atlas import BREATH_LEVELS, NEON_GLOW
+from .block_renderer import BlockRenderer
+
+if TYPE_CHECKING:
+    from ..core import Board, GameEngine, Tetromino
+
+# 最亮的呼吸级别（未绘制过时显示该级别）
+TOP_LEVEL = BREATH_LEVELS - 1
+
+
+class BoardLayer:
+    """
+    棋盘层 - 缓存一个引擎棋盘上已锁定的方块
+    通过 GameEngineEvents 标记脏行（锁定、消行、重置）；每个呼吸级别一张层，用该级别的图集精灵绘制，
+    各层记录自己待重绘的行，切换到某个级别时只重绘该层的脏行，稳定状态下每帧只需一次 blit。
+    棋盘层以预乘 alpha 合成，叠加到屏幕的结果与逐块绘制一致（只差光晕重叠处的取整误差）
+    """
+
+    def __init__(self, engine: 'GameEngine', block_renderer: BlockRenderer, config: GameConfig):
+        self.engine = engine
+        self.block_renderer = block_renderer
+        self.config = config
+
+        self._board: Optional['Board'] = None
+        self._size = (0, 0)
+        self._dirty: Set[int] = set()
+        self._full = True
+
+        # 各呼吸级别的层及其待重绘的行
+        self._layers: Dict[int, pygame.Surface] = {}
+        self._pending: Dict[int, Set[int]] = {}
+
+        # 内容版本和最近一次绘制的呼吸级别（供脏矩形判断棋盘区域是否变化）
+        self.revision = 0
+        self.shown_level = TOP_LEVEL
+
+        events = engine.events
+        events.piece_locked.subscribe(self._on_piece_locked)
+        events.lines_cleared.subscribe(self._on_lines_cleared)
+        events.game_reset.subscribe(self._on_game_reset)
+
+    def detach(self) -> None:
+        """取消事件订阅"""
+        events = self.engine.events
+        events.piece_locked.unsubscribe(self._on_piece_locked)
+        events.lines_cleared.unsubscribe(self._on_lines_cleared)
+        events.game_reset.unsubscribe(self._on_game_reset)
+
+    def invalidate(self) -> None:
+        """下次绘制时整层重绘（配置变化或棋盘被外部直接修改时调用）"""
+        self._full = True
+
+    # ==================== 事件 ====================
+
+    def _on_piece_locked(self, piece: 'Tetromino') -> None:
+        """方块锁定：其所在行变脏"""
+        self._dirty.update(y for _, y in piece.get_blocks())
+
+    def _on_lines_cleared(self, count: int, line_indices: List[int]) -> None:
+        """消行：最低消除行及其上方的行全部下移"""
+        if line_indices:
+            self._dirty.update(range(max(line_indices) + 1))
+
+    def _on_game_reset(self, seed: int) -> None:
+        """新一局：整层重绘"""
+        self._full = True
+
+    # ==================== 绘制 ====================
+
+    def _new_surface(self, width: int, height: int) -> pygame.Surface:
+        """创建透明 Surface（有显示模式时转换为显示格式）"""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        return surface
+
+    def sync(self, board: 'Board') -> bool:
+        """收集脏行并记入各级别层的待重绘行，返回内容是否变化"""
+        grid_size = self.config.grid_size
+        size = (board.width * grid_size + NEON_GLOW * 2, self.config.grid_height * grid_size + NEON_GLOW * 2)
+
+        # 棋盘被替换（读档）或变宽（升级扩展）时丢弃所有层
+        if board is not self._board or size != self._size:
+            self._board = board
+            self._size = size
+            self._layers.clear()
+            self._pending.clear()
+            self._full = True
+
+        first, last = 2, self.config.grid_height + 1
+        if self._full:
+            rows = set(range(first, last + 1))
+        else:
+            rows = {y for y in self._dirty if first <= y <= last}
+        self._full = False
+        self._dirty.clear()
+        if not rows:
+            return False
+
+        for pending in self._pending.values():
+            pending.update(rows)
+        self.revision += 1
+        return True
+
+    def _layer(self, board: 'Board', level: int) -> pygame.Surface:
+        """取指定呼吸级别的层，重绘其待重绘的行（首次使用时整层绘制）"""
+        surface = self._layers.get(level)
+        if surface is None:
+            surface = self._layers[level] = self._new_surface(*self._size)
+            self._pending[level] = set(range(2, self.config.grid_height + 2))
+
+        rows = sorted(self._pending[level])
+        self._pending[level].clear()
+        if rows:
+            # 连续的脏行合并为一个区段重绘
+            start = prev = rows[0]
+            for y in rows[1:]:
+                if y != prev + 1:
+                    self._redraw_rows(surface, board, level, start, prev)
+                    start = y
+                prev = y
+            self._redraw_rows(surface, board, level, start, prev)
+        return surface
+
+    def _redraw_rows(self, surface: pygame.Surface, board: 'Board', level: int, low: int, high: int) -> None:
+        """
+        重绘 low..high 行：这些行的光晕会伸入相邻行，所以清除区域上下各扩展一个光晕宽度，
+        并把相邻行的方块也裁剪绘制一遍
+        """
+        grid_size = self.config.grid_size
+        first, last = 2, self.config.grid_height + 1
+
+        top = (low - first) * grid_size
+        bottom = (high - first + 1) * grid_size + NEON_GLOW * 2
+        surface.set_clip(pygame.Rect(0, top, surface.get_width(), bottom - top))
+        surface.fill((0, 0, 0, 0))
+
+        page = self.block_renderer.atlas.neon_page(GRID_SIZE)
+        areas = []
+        for y in range(max(first, low - 1), min(last, high + 1) + 1):
+            for x in range(board.width):
+                cell = board.get_cell(x, y)
+                if cell is not None:
+                    color = NEON_COLORS.get(cell, (255, 255, 255))
+                    areas.append(((x * grid_size, (y - first) * grid_size), page.area(color, level)))
+        if areas:
+            sprites = page.premultiplied()
+            surface.blits(
+                [(sprites, pos, area, pygame.BLEND_PREMULTIPLIED) for pos, area in areas],
+                doreturn=False
+            )
+        surface.set_clip(None)
+
+    def draw(self, screen: pygame.Surface, board: 'Board', x: int, y: int) -> pygame.Rect:
+        """把棋盘层绘制到 (x, y)（棋盘左上角），返回绘制区域"""
+        self.sync(board)
+        self.shown_level = min(self.block_renderer.neon_level(), TOP_LEVEL)
+        layer = self._layer(board, self.shown_level)
+        return screen.blit(layer, (x - NEON_GLOW, y - NEON_GLOW), special_flags=pygame.BLEND_PREMULTIPLIED)
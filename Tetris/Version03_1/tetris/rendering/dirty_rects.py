@@ -0,0 +1,116 @@
+"""脏矩形跟踪 - 只把本帧变化的区域提交到窗口"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import pygame
+
+RectLike = Any  # pygame.Rect 或 (x, y, w, h)
+
+
+class DirtyRects:
+    """
+    脏矩形跟踪器
+    每帧仍在屏幕缓冲区上完整合成，但只用 pygame.display.update(rects) 提交变化的区域：
+    - add()：每帧都会变化的内容（方块、粒子、星星闪烁等），上一帧的矩形也一并提交以擦除旧位置
+    - mark()：按状态缓存的区域（面板数字、预览等），状态或位置变化时才提交
+    - force_full()：震动、升级等全屏特效期间整屏 flip
+    """
+
+    def __init__(self, enabled: bool = True, full_ratio: float = 0.8, max_rects: int = 192):
+        self.enabled = enabled
+        self.full_ratio = full_ratio  # 脏区域面积超过屏幕的该比例时直接整屏 flip
+        self.max_rects = max_rects    # 合并后矩形过多时改为提交包围盒
+        self._rects: List[pygame.Rect] = []
+        self._previous: List[pygame.Rect] = []
+        self._regions: Dict[Hashable, Tuple[Tuple[int, int, int, int], Any]] = {}
+        self._full = True
+
+        # 统计（最近一次提交）
+        self.last_rects = 0
+        self.last_area = 0
+        self.last_full = True
+
+    def add(self, rect: RectLike) -> None:
+        """登记本帧绘制的区域（下一帧会自动再提交一次以擦除）"""
+        if self.enabled:
+            self._rects.append(pygame.Rect(rect))
+
+    def add_all(self, rects: Iterable[RectLike]) -> None:
+        """批量登记"""
+        if self.enabled:
+            self._rects.extend(pygame.Rect(rect) for rect in rects)
+
+    def mark(self, key: Hashable, rect: RectLike, state: Any = None) -> None:
+        """登记按状态缓存的区域：与上一帧的 (位置, 状态) 不同时提交新旧两个位置"""
+        if not self.enabled:
+            return
+        rect = pygame.Rect(rect)
+        entry = (tuple(rect), state)
+        old = self._regions.get(key)
+        if old != entry:
+            self._rects.append(rect)
+            if old is not None:
+                self._rects.append(pygame.Rect(old[0]))
+            self._regions[key] = entry
+
+    def force_full(self) -> None:
+        """本帧整屏提交"""
+        self._full = True
+
+    def reset(self) -> None:
+        """清除所有记录（窗口大小变化、切换屏幕时调用），下一帧整屏提交"""
+        self._rects = []
+        self._previous = []
+        self._regions.clear()
+        self._full = True
+
+    @staticmethod
+    def merge(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """
+        去重并合并矩形：丢弃被包含的矩形，相交矩形只在合并后面积不超过两者之和时合并
+        （避免大区域与零散的小矩形连锁合并成整屏）
+        """
+        unique = set(tuple(r) for r in rects if r.width > 0 and r.height > 0)
+        merged: List[pygame.Rect] = []
+        for rect in sorted(unique, key=lambda r: r[2] * r[3], reverse=True):
+            rect = pygame.Rect(rect)
+            for i in rect.collidelistall(merged):
+                kept = merged[i]
+                if kept.contains(rect):
+                    break
+                union = kept.union(rect)
+                if union.width * union.height <= kept.width * kept.height + rect.width * rect.height:
+                    merged[i] = union
+                    break
+            else:
+                merged.append(rect)
+        return merged
+
+    def collect(self, screen_rect: pygame.Rect) -> Optional[List[pygame.Rect]]:
+        """结束本帧，返回需要提交的矩形（None 表示整屏）"""
+        current, self._rects = self._rects, []
+        rects = current + self._previous
+        self._previous = current
+
+        if not self.enabled or self._full:
+            self._full = False
+            return None
+
+        rects = [rect.clip(screen_rect) for rect in self.merge(rects)]
+        if len(rects) > self.max_rects:
+            rects = [rects[0].unionall(rects[1:])]
+        area = sum(rect.width * rect.height for rect in rects)
+        if area > screen_rect.width * screen_rect.height * self.full_ratio:
+            return None
+        return rects
+
+    def present(self, screen: pygame.Surface) -> None:
+        """提交本帧：有脏矩形时 display.update(rects)，否则整屏 flip"""
+        rects = self.collect(screen.get_rect())
+        if rects is None:
+            self.last_rects, self.last_area, self.last_full = 0, screen.get_width() * screen.get_height(), True
+            pygame.display.flip()
+        else:
+            self.last_rects, self.last_area, self.last_full = len(rects), sum(r.width * r.height for r in rects), False
+            if rects:
+                pygame.display.update(rects)
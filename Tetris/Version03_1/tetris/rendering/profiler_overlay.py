@@ -0,0 +1,78 @@
+"""帧时间分析叠加层 - 显示各项耗时的滚动百分位数"""
+
+from typing import List, Optional, Tuple
+
+import pygame
+
+from ..utils.profiler import FrameProfiler
+
+# 叠加层每隔该时间（秒）重新排版一次，其余帧直接复用（文字渲染本身较慢）
+REFRESH_INTERVAL = 0.25
+MAX_ROWS = 16
+
+BACKGROUND = (0, 0, 0, 180)
+HEADER_COLOR = (0, 255, 255)
+TEXT_COLOR = (220, 220, 220)
+SLOW_COLOR = (255, 120, 80)  # p95 超过帧预算时的颜色
+
+
+class ProfilerOverlay:
+    """帧时间分析叠加层：左列为统计名，右侧三列为 p50/p95/p99（毫秒）"""
+
+    PADDING = 6
+    COLUMN_WIDTH = 52
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self.surface: Optional[pygame.Surface] = None
+        self.version = 0  # 每次重新排版加一（用于脏矩形）
+        self._built_at: Optional[float] = None
+
+    def _rows(self, profiler: FrameProfiler) -> List[Tuple[str, Tuple[float, float, float]]]:
+        summary = profiler.summary()
+        return [
+            (name, (stats['p50_ms'], stats['p95_ms'], stats['p99_ms']))
+            for name, stats in list(summary.items())[:MAX_ROWS]
+        ]
+
+    def build(self, profiler: FrameProfiler, frame_budget_ms: float) -> pygame.Surface:
+        """按当前统计重新排版"""
+        font = self.font
+        rows = self._rows(profiler)
+        header = font.render(f"{profiler.frames} frames   p50 / p95 / p99 ms", True, HEADER_COLOR)
+        labels = [font.render(name, True, TEXT_COLOR) for name, _ in rows]
+        label_width = max([header.get_width() - 3 * self.COLUMN_WIDTH] + [label.get_width() for label in labels])
+        line_height = font.get_linesize()
+
+        width = self.PADDING * 2 + label_width + 3 * self.COLUMN_WIDTH
+        height = self.PADDING * 2 + line_height * (len(rows) + 1)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill(BACKGROUND)
+        surface.blit(header, (self.PADDING, self.PADDING))
+
+        for i, ((name, values), label) in enumerate(zip(rows, labels)):
+            y = self.PADDING + line_height * (i + 1)
+            surface.blit(label, (self.PADDING, y))
+            color = SLOW_COLOR if values[1] > frame_budget_ms else TEXT_COLOR
+            for column, value in enumerate(values):
+                text = font.render(f"{value:.2f}", True, color)
+                right = self.PADDING + label_width + self.COLUMN_WIDTH * (column + 1)
+                surface.blit(text, (right - text.get_width(), y))
+
+        self.surface = surface
+        self.version += 1
+        return surface
+
+    def draw(
+        self,
+        target: pygame.Surface,
+        profiler: FrameProfiler,
+        now: float,
+        frame_budget_ms: float,
+        pos: Tuple[int, int] = (8, 8)
+    ) -> pygame.Rect:
+        """绘制叠加层（到期时重新排版），返回绘制区域"""
+        if self.surface is None or self._built_at is None or now - self._built_at >= REFRESH_INTERVAL:
+            self.build(profiler, frame_budget_ms)
+            self._built_at = now
+        return target.blit(self.surface, pos)
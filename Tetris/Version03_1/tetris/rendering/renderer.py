@@ -3,7 +3,7 @@
 import math
 import random
 import pygame
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple, Union
 
 from ..config import (
     GRID_SIZE, GRID_WIDTH, GRID_HEIGHT,
@@ -12,10 +12,21 @@ from ..config import (
     NEON_COLORS, GameConfig
 )
 from ..core import Board, Tetromino, GameEngine, GameState
-from ..effects import Particle, FloatingText, Star
+from ..effects import Particle, FloatingText, StarField, StarList
+from ..utils.profiler import FrameProfiler
 from .surface_cache import SurfaceCache
+from .block_atlas import NEON_GLOW
 from .block_renderer import BlockRenderer
+from .board_layer import BoardLayer
+from .dirty_rects import DirtyRects
+from .text_effects import (
+    GLOW_PAD, PULSE_LEVELS, compose_neon_text, pulse_level, pulse_strength, rainbow_color, rainbow_frame
+)
 from .fonts import FontManager
+from .profiler_overlay import ProfilerOverlay
+
+# 拖影透明度量化步长（精灵缓存按颜色 x 透明度级别复用）
+TRAIL_ALPHA_STEP = 8
 
 
 class Renderer:
@@ -29,9 +40,24 @@ class Renderer:
         self.fonts = FontManager.get_instance()
         self.time = 0
 
+        # 各引擎的棋盘层缓存（attach_engine 后生效）
+        self.board_layers: List[BoardLayer] = []
+
+        # 脏矩形提交（静态界面只在整屏提交时更新）
+        self.dirty = DirtyRects(self.config.dirty_rects)
+
+        # 帧时间分析叠加层（首次显示时创建）
+        self._profiler_overlay: Optional[ProfilerOverlay] = None
+
         # 预创建Surface
         self._init_surfaces()
 
+        # 预绘制方块图集（游戏板和预览两种尺寸）
+        self.block_renderer.atlas.warm_up(list(NEON_COLORS.values()), (GRID_SIZE, 20))
+
+        # 预热常驻的粒子光晕
+        Particle.warm_up()
+
     def _init_surfaces(self) -> None:
         """预创建常用Surface"""
         # 背景缓存（与窗口大小一致）
@@ -47,6 +73,60 @@ class Renderer:
                 (0, y), (self.config.panel_width, y)
             )
 
+        # 面板静态层：背景线条、标签光晕和帮助提示（只在窗口大小变化时重建）
+        self.panel_chrome = self._build_panel_chrome()
+
+        # 网格线缓存（棋盘宽度变化时重建）
+        self._grid_surface: Optional[pygame.Surface] = None
+        self._grid_key: Optional[Tuple[int, int, int]] = None
+
+        # 面板数值文字缓存 {名称: (值, Surface)}，数值变化时才重新渲染
+        self._value_surfaces: Dict[str, Tuple[int, pygame.Surface]] = {}
+
+    def _build_panel_chrome(self) -> pygame.Surface:
+        """预渲染面板中不随游戏变化的部分（坐标相对面板左上角，预乘 alpha）"""
+        chrome = self.panel_bg_surface.premul_alpha()
+
+        labels = [
+            ("下一个", 120),
+            ("最高分", 240),
+            ("得分", 330),
+            ("消行", 400),
+            ("关卡", 470),
+        ]
+        for label, y in labels:
+            self.draw_neon_text(label, self.fonts.tiny, 20, y, (150, 150, 180), target=chrome)
+
+        help_text = self.fonts.tiny.render("H - 帮助", True, (100, 100, 120)).copy().premul_alpha()
+        chrome.blit(help_text, (20, self.config.board_height - 30), special_flags=pygame.BLEND_PREMULTIPLIED)
+        return chrome
+
+    def _grid_lines(self, width: int) -> pygame.Surface:
+        """返回指定棋盘宽度的网格线 Surface（黑色为透明色键）"""
+        key = (width, self.config.grid_height, self.config.grid_size)
+        if key != self._grid_key:
+            grid_size = self.config.grid_size
+            grid_width = width * grid_size
+            grid_height = self.config.grid_height * grid_size
+            surface = pygame.Surface((grid_width + 1, grid_height + 1))
+            surface.fill((0, 0, 0))
+            for gx in range(width + 1):
+                pygame.draw.line(surface, (40, 40, 60), (gx * grid_size, 0), (gx * grid_size, grid_height))
+            for gy in range(self.config.grid_height + 1):
+                pygame.draw.line(surface, (40, 40, 60), (0, gy * grid_size), (grid_width, gy * grid_size))
+            surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            self._grid_surface = surface
+            self._grid_key = key
+        return self._grid_surface
+
+    def _value_surface(self, name: str, value: int, font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+        """面板数值文字（同一数值复用上次渲染的 Surface）"""
+        cached = self._value_surfaces.get(name)
+        if cached is None or cached[0] != value:
+            cached = (value, font.render(str(value), True, color))
+            self._value_surfaces[name] = cached
+        return cached[1]
+
     def update(self, dt: float) -> None:
         """更新渲染状态"""
         self.time += dt
@@ -56,50 +136,85 @@ class Renderer:
         """更新配置（窗口大小变化时）"""
         self.config = config
         self._init_surfaces()
+        for layer in self.board_layers:
+            layer.config = config
+            layer.invalidate()
+        self.dirty.reset()
 
     def set_block_flash(self, flash: float) -> None:
         """设置方块闪光"""
         self.block_renderer.set_block_flash(flash)
 
-    # ==================== 背景渲染 ====================
+    def present(self) -> None:
+        """把本帧提交到窗口（脏矩形模式下只提交变化的区域）"""
+        self.dirty.present(self.screen)
 
-    def draw_background(self, stars: Optional[List[Star]] = None) -> None:
-        """绘制背景"""
-        self.screen.blit(self.bg_surface, (0, 0))
+    # ==================== 背景渲染 ====================
 
-        if stars:
-            for star in stars:
-                star.update(self.time)
-                star.draw(self.screen)
+    def draw_background(self, stars: Optional[Union[StarField, StarList]] = None) -> None:
+        """绘制背景（星星只登记亮度或位置变化的区域）"""
+        if not stars:
+            self.screen.blit(self.bg_surface, (0, 0))
+            return
+        stars.update(self.time)
+        self.dirty.add_all(stars.draw(self.screen, self.bg_surface))
 
     def draw_grid(self, board: Board, offset: Tuple[int, int] = (0, 0)) -> None:
-        """绘制网格"""
-        x = self.config.board_x + offset[0]
-        y = self.config.board_y + offset[1]
-
-        # 动态绘制网格线（使用实际 board 宽度）
-        grid_width = board.width * self.config.grid_size
-        grid_height = self.config.grid_height * self.config.grid_size
-
-        for gx in range(board.width + 1):
-            line_x = x + gx * self.config.grid_size
-            pygame.draw.line(
-                self.screen, (40, 40, 60, 100),
-                (line_x, y),
-                (line_x, y + grid_height)
-            )
-        for gy in range(self.config.grid_height + 1):
-            line_y = y + gy * self.config.grid_size
-            pygame.draw.line(
-                self.screen, (40, 40, 60, 100),
-                (x, line_y),
-                (x + grid_width, line_y)
-            )
+        """绘制网格（使用实际 board 宽度的预渲染网格线）"""
+        self.screen.blit(
+            self._grid_lines(board.width),
+            (self.config.board_x + offset[0], self.config.board_y + offset[1])
+        )
 
     # ==================== 方块渲染 ====================
 
+    def attach_engine(self, engine: GameEngine) -> BoardLayer:
+        """为引擎创建棋盘层缓存（订阅其事件，重复调用返回同一个）"""
+        for layer in self.board_layers:
+            if layer.engine is engine:
+                return layer
+        layer = BoardLayer(engine, self.block_renderer, self.config)
+        self.board_layers.append(layer)
+        return layer
+
+    def detach_engine(self, engine: GameEngine) -> None:
+        """移除引擎的棋盘层缓存"""
+        for layer in self.board_layers:
+            if layer.engine is engine:
+                layer.detach()
+        self.board_layers = [layer for layer in self.board_layers if layer.engine is not engine]
+
     def draw_board(self, board: Board, offset: Tuple[int, int] = (0, 0)) -> None:
-        """绘制游戏板"""
+        """绘制游戏板（已附加引擎的棋盘使用棋盘层缓存，闪光期间逐块绘制）"""
+        if self.block_renderer.block_flash <= 0:
+            for layer in self.board_layers:
+                if layer.engine.board is board:
+                    rect = layer.draw(
+                        self.screen, board,
+                        self.config.board_x + offset[0],
+                        self.config.board_y + offset[1]
+                    )
+                    self.dirty.mark(('board', id(layer)), rect, (layer.revision, layer.shown_level))
+                    return
+        self._draw_board_blocks(board, offset)
+        self.dirty.add(self._block_bounds(
+            self.config.board_x + offset[0], self.config.board_y + offset[1],
+            board.width * self.config.grid_size, self.config.grid_height * self.config.grid_size
+        ))
+
+    def _block_bounds(self, x: int, y: int, width: int, height: int) -> pygame.Rect:
+        """方块区域连同光晕的包围矩形"""
+        return pygame.Rect(x - NEON_GLOW, y - NEON_GLOW, width + NEON_GLOW * 2, height + NEON_GLOW * 2)
+
+    def _cells_bounds(self, cells: List[Tuple[int, int]], size: int) -> pygame.Rect:
+        """一组方块左上角坐标连同光晕的包围矩形"""
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        return self._block_bounds(min(xs), min(ys), max(xs) - min(xs) + size, max(ys) - min(ys) + size)
+
+    def _draw_board_blocks(self, board: Board, offset: Tuple[int, int] = (0, 0)) -> None:
+        """逐块绘制游戏板（所有方块从图集批量 blit）"""
+        blocks = []
         for y in range(2, self.config.grid_height + 2):
             for x in range(board.width):
                 cell = board.get_cell(x, y)
@@ -107,7 +222,9 @@ class Renderer:
                     color = NEON_COLORS.get(cell, (255, 255, 255))
                     draw_x = self.config.board_x + x * self.config.grid_size + offset[0]
                     draw_y = self.config.board_y + (y - 2) * self.config.grid_size + offset[1]
-                    self.block_renderer.draw_neon_block(self.screen, draw_x, draw_y, color)
+                    blocks.append((draw_x, draw_y, color))
+        if blocks:
+            self.block_renderer.draw_neon_blocks(self.screen, blocks)
 
     def draw_piece(
         self,
@@ -115,9 +232,10 @@ class Renderer:
         offset: Tuple[int, int] = (0, 0),
         draw_ghost: bool = True,
         ghost_positions: Optional[List[Tuple[int, int]]] = None,
-        board: Optional['Board'] = None
+        board: Optional['Board'] = None,
+        fall_offset: float = 0.0
     ) -> None:
-        """绘制当前方块"""
+        """绘制当前方块（fall_offset 为下落插值，以格为单位，只作用于当前方块）"""
         if not piece:
             return
 
@@ -127,44 +245,47 @@ class Renderer:
             if ghost_positions:
                 ghost_blocks = ghost_positions
             else:
-                # 计算幽灵位置（简单版本，不考虑碰撞）
-                ghost_y = piece.y
+                # 计算幽灵位置
                 if board:
-                    # 使用Board进行碰撞检测
-                    while True:
-                        valid = True
-                        for x, y in piece.get_blocks():
-                            ny = y + (ghost_y - piece.y + 1)
-                            if ny >= self.config.grid_height + 2:
-                                valid = False
-                                break
-                            if ny >= 0 and board.get_cell(x, ny) is not None:
-                                valid = False
-                                break
-                        if not valid:
-                            break
-                        ghost_y += 1
+                    # 使用Board的列表面缓存求下落距离
+                    ghost_y = piece.y + board.drop_distance(piece)
                 else:
                     ghost_y = piece.y + 10  # 默认下落10格
 
-                shape = piece.shapes[piece.rotation % len(piece.shapes)]
-                ghost_blocks = [(piece.x + dx, ghost_y + dy) for dx, dy in shape]
+                shape = piece.get_shape()
+                ghost_blocks = [(piece.x + dx, ghost_y + dy) for dx, dy in shape.cells]
 
+            ghost_cells = []
             for gx, gy in ghost_blocks:
                 if gy >= 2:
                     draw_x = self.config.board_x + gx * self.config.grid_size + offset[0]
                     draw_y = self.config.board_y + (gy - 2) * self.config.grid_size + offset[1]
                     self.block_renderer.draw_ghost_block(self.screen, draw_x, draw_y, piece.color)
+                    ghost_cells.append((draw_x, draw_y))
+            if ghost_cells:
+                self.dirty.add(self._cells_bounds(ghost_cells, GRID_SIZE))
 
         # 绘制当前方块
-        for x, y in piece.get_blocks():
-            if y >= 0:
-                draw_x = self.config.board_x + x * self.config.grid_size + offset[0]
-                draw_y = self.config.board_y + (y - 2) * self.config.grid_size + offset[1]
-                self.block_renderer.draw_neon_block(self.screen, draw_x, draw_y, piece.color)
-
-    def draw_next_piece(self, piece: Tetromino, offset: Tuple[int, int] = (0, 0)) -> None:
-        """绘制预览方块"""
+        fall_y = int(fall_offset * self.config.grid_size)
+        blocks = [
+            (
+                self.config.board_x + x * self.config.grid_size + offset[0],
+                self.config.board_y + (y - 2) * self.config.grid_size + offset[1] + fall_y,
+                piece.color
+            )
+            for x, y in piece.get_blocks() if y >= 0
+        ]
+        self.block_renderer.draw_neon_blocks(self.screen, blocks)
+        if blocks:
+            self.dirty.add(self._cells_bounds([(x, y) for x, y, _ in blocks], GRID_SIZE))
+
+    def draw_next_piece(
+        self,
+        piece: Tetromino,
+        offset: Tuple[int, int] = (0, 0),
+        upcoming: Optional[List[Tetromino]] = None
+    ) -> None:
+        """绘制预览方块（upcoming 为其后的预览队列，以小方块显示在右侧）"""
         if not piece:
             return
 
@@ -175,11 +296,34 @@ class Renderer:
         preview_x = self.config.panel_x + (self.config.panel_width - width) // 2 - min_x * 22
         preview_y = self.config.board_y + 130 + (88 - height) // 2 - min_y * 22
 
-        shape = piece.shapes[0]
-        for dx, dy in shape:
-            x = preview_x + dx * 22
-            y = preview_y + dy * 22
-            self.block_renderer.draw_neon_block(self.screen, x, y, piece.color, 20)
+        blocks = [(preview_x + dx * 22, preview_y + dy * 22, piece.color) for dx, dy in piece.table[0].cells]
+        self.block_renderer.draw_neon_blocks(self.screen, blocks, 20)
+
+        if upcoming:
+            self._draw_upcoming_pieces(upcoming)
+
+        # 预览区域：方块、后续队列或呼吸级别变化时提交
+        self.dirty.mark(
+            'next_piece',
+            (self.config.panel_x, self.config.board_y + 120, self.config.panel_width, 110),
+            (piece.type, tuple(p.type for p in upcoming or ()), self.block_renderer.neon_level())
+        )
+
+    def _draw_upcoming_pieces(self, pieces: List[Tetromino]) -> None:
+        """绘制预览队列中的后续方块（右侧小图）"""
+        cell = 8
+        x = self.config.panel_x + self.config.panel_width - 4 * cell - 8
+        y = self.config.board_y + 130
+        bottom = self.config.board_y + 218
+        for piece in pieces:
+            min_x, max_x, min_y, max_y = piece.get_bounds()
+            height = (max_y - min_y + 1) * cell
+            if y + height > bottom:
+                break
+            for dx, dy in piece.table[0].cells:
+                rect = (x + (dx - min_x) * cell, y + (dy - min_y) * cell, cell - 1, cell - 1)
+                pygame.draw.rect(self.screen, piece.color, rect, border_radius=2)
+            y += height + 6
 
     # ==================== 面板渲染 ====================
 
@@ -191,50 +335,41 @@ class Renderer:
         level: int,
         level_up_effect: int = 0
     ) -> None:
-        """绘制右侧面板"""
-        self.screen.blit(self.panel_bg_surface, (self.config.panel_x, self.config.board_y))
+        """绘制右侧面板（静态部分来自预渲染层，只重绘标题动画和数值）"""
+        self.screen.blit(
+            self.panel_chrome, (self.config.panel_x, self.config.board_y),
+            special_flags=pygame.BLEND_PREMULTIPLIED
+        )
 
         # 标题
         title_text = "TETRIS"
         title_x = self.config.panel_x + (self.config.panel_width - self.fonts.title_medium.size(title_text)[0]) // 2
         self.draw_rainbow_title(title_text, self.fonts.title_medium, title_x, self.config.board_y + 40)
 
-        # 标签
-        labels = [
-            ("下一个", self.config.board_y + 120),
-            ("最高分", self.config.board_y + 240),
-            ("得分", self.config.board_y + 330),
-            ("消行", self.config.board_y + 400),
-            ("关卡", self.config.board_y + 470),
-        ]
-
-        for label, y in labels:
-            self.draw_neon_text(label, self.fonts.tiny, self.config.panel_x + 20, y, (150, 150, 180))
+        # 数值（数值变化时才重新渲染和提交）
+        best_text = self._value_surface('high_score', high_score, self.fonts.medium, (255, 200, 0))
+        rect = self.screen.blit(best_text, (self.config.panel_x + 20, self.config.board_y + 260))
+        self.dirty.mark('high_score', rect, high_score)
 
-        # 数值
-        best_text = self.fonts.medium.render(str(high_score), True, (255, 200, 0))
-        self.screen.blit(best_text, (self.config.panel_x + 20, self.config.board_y + 260))
+        score_text = self._value_surface('score', score, self.fonts.small, (255, 255, 255))
+        rect = self.screen.blit(score_text, (self.config.panel_x + 20, self.config.board_y + 350))
+        self.dirty.mark('score', rect, score)
 
-        score_text = self.fonts.small.render(str(score), True, (255, 255, 255))
-        self.screen.blit(score_text, (self.config.panel_x + 20, self.config.board_y + 350))
+        lines_text = self._value_surface('lines', lines, self.fonts.small, (255, 255, 255))
+        rect = self.screen.blit(lines_text, (self.config.panel_x + 20, self.config.board_y + 420))
+        self.dirty.mark('lines', rect, lines)
 
-        lines_text = self.fonts.small.render(str(lines), True, (255, 255, 255))
-        self.screen.blit(lines_text, (self.config.panel_x + 20, self.config.board_y + 420))
-
-        level_text = self.fonts.small.render(str(level), True, (255, 255, 255))
+        level_text = self._value_surface('level', level, self.fonts.small, (255, 255, 255))
         if level_up_effect > 0:
             scale = 1.0 + 0.3 * math.sin(self.time * 20)
             scaled = pygame.transform.scale(
                 level_text,
                 (int(level_text.get_width() * scale), int(level_text.get_height() * scale))
             )
-            self.screen.blit(scaled, (self.config.panel_x + 20, self.config.board_y + 490))
+            self.dirty.add(self.screen.blit(scaled, (self.config.panel_x + 20, self.config.board_y + 490)))
         else:
-            self.screen.blit(level_text, (self.config.panel_x + 20, self.config.board_y + 490))
-
-        # 帮助提示
-        help_text = self.fonts.tiny.render("H - 帮助", True, (100, 100, 120))
-        self.screen.blit(help_text, (self.config.panel_x + 20, self.config.board_y + self.config.board_height - 30))
+            rect = self.screen.blit(level_text, (self.config.panel_x + 20, self.config.board_y + 490))
+            self.dirty.mark('level', rect, level)
 
     def draw_divider(self) -> None:
         """绘制分隔线"""
@@ -245,11 +380,11 @@ class Renderer:
         g = int(128 + 127 * math.sin(math.radians(hue + 120)))
         b = int(128 + 127 * math.sin(math.radians(hue + 240)))
 
-        pygame.draw.line(
+        self.dirty.add(pygame.draw.line(
             self.screen, (r, g, b),
             (divider_x, self.config.board_y),
             (divider_x, self.config.board_y + self.config.board_height), 1
-        )
+        ))
 
     # ==================== 特效渲染 ====================
 
@@ -258,6 +393,7 @@ class Renderer:
         for particle in particles[:]:
             particle.update()
             particle.draw(self.screen)
+            self.dirty.add(particle.get_rect())
             if particle.life <= 0:
                 particles.remove(particle)
 
@@ -270,13 +406,21 @@ class Renderer:
         for text in texts[:]:
             text.update(dt)
             text.draw(self.screen, self.fonts.medium, self.fonts.font_name)
+            if text.rect:
+                self.dirty.add(text.rect)
             if text.alpha <= 0:
                 texts.remove(text)
 
-    def draw_trails(self, trails: List[Tuple[float, float, Tuple[int, int, int], float]]) -> None:
-        """绘制拖影"""
-        new_trails = []
+    def draw_trails(self, trails: Iterable[Tuple[float, float, Tuple[int, int, int], float]]) -> None:
+        """
+        绘制拖影（只读，老化由引擎负责）
+        越新的拖影越亮；透明度量化为 TRAIL_ALPHA_STEP 的整数倍，精灵缓存复用，一次 blits 提交
+        """
+        trails = list(trails)
         total_trails = len(trails)
+        grid_size = self.config.grid_size
+        half = grid_size // 2
+        blits = []
         for idx, (x, y, color, life) in enumerate(trails):
             if life > 0:
                 if total_trails > 1:
@@ -284,16 +428,22 @@ class Renderer:
                 else:
                     gradient_factor = 0.5
                 alpha = int(255 * gradient_factor * life)
+                alpha = min(255, (alpha + TRAIL_ALPHA_STEP // 2) // TRAIL_ALPHA_STEP * TRAIL_ALPHA_STEP)
+                if alpha > 0:
+                    blits.append((self._trail_sprite(color, alpha), (int(x - half), int(y - half))))
+        if blits:
+            self.dirty.add_all(self.screen.blits(blits))
 
-                trail_surf = pygame.Surface((self.config.grid_size, self.config.grid_size), pygame.SRCALPHA)
-                pygame.draw.rect(
-                    trail_surf, (*color, alpha),
-                    (0, 0, self.config.grid_size, self.config.grid_size),
-                    border_radius=3
-                )
-                self.screen.blit(trail_surf, (int(x - self.config.grid_size // 2), int(y - self.config.grid_size // 2)))
-                new_trails.append((x, y, color, life - 0.05))
-        return new_trails
+    def _trail_sprite(self, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """拖影精灵（圆角方块）"""
+        grid_size = self.config.grid_size
+
+        def create() -> pygame.Surface:
+            surface = pygame.Surface((grid_size, grid_size), pygame.SRCALPHA)
+            pygame.draw.rect(surface, (*color, alpha), (0, 0, grid_size, grid_size), border_radius=3)
+            return surface
+
+        return self.cache.get_or_create(('trail', grid_size, color, alpha), create)
 
     # ==================== 文字渲染 ====================
 
@@ -305,57 +455,37 @@ class Renderer:
         y: int,
         color: Tuple[int, int, int],
         glow_size: int = 2,
-        pulse: bool = False
+        pulse: bool = False,
+        target: Optional[pygame.Surface] = None
     ) -> None:
-        """绘制霓虹文字"""
-        pulse_val = 0.7 + 0.3 * math.sin(self.time * 3) if pulse else 1.0
-
-        for radius, base_a in [(4, 25), (2, 50)]:
-            gs = font.render(text, True, color)
-            gs.set_alpha(int(base_a * pulse_val))
-            for dx in range(-radius, radius + 1, max(1, radius // 2)):
-                for dy in range(-radius, radius + 1, max(1, radius // 2)):
-                    if dx != 0 or dy != 0:
-                        self.screen.blit(gs, (x + dx, y + dy))
-
-        ec = tuple(min(255, c + 100) for c in color)
-        es = font.render(text, True, ec)
-        es.set_alpha(int(180 * pulse_val))
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            self.screen.blit(es, (x + dx, y + dy))
-
-        s = font.render(text, True, color)
-        self.screen.blit(s, (x, y))
+        """绘制霓虹文字（合成结果按脉冲级别缓存；target 为预乘 alpha 的离屏层，默认绘制到屏幕）"""
+        level = pulse_level(self.time) if pulse else PULSE_LEVELS - 1
+        surface = self._neon_text_surface(text, font, color, level)
+        rect = (self.screen if target is None else target).blit(
+            surface, (x - GLOW_PAD, y - GLOW_PAD), special_flags=pygame.BLEND_PREMULTIPLIED
+        )
+        if pulse and target is None:
+            self.dirty.mark(('neon_text', text, x, y), rect, level)
 
     def draw_rainbow_title(self, text: str, font: pygame.font.Font, x: int, y: int) -> None:
-        """绘制彩虹标题"""
-        t = self.time
-
-        def rainbow_color(offset=0):
-            return (
-                int(127 + 127 * math.sin(t * 0.8 + offset)),
-                int(127 + 127 * math.sin(t * 0.8 + offset + 2.094)),
-                int(127 + 127 * math.sin(t * 0.8 + offset + 4.189)),
-            )
+        """绘制彩虹标题（色相量化为 RAINBOW_FRAMES 帧，每帧的合成结果缓存复用）"""
+        frame = rainbow_frame(self.time)
+        surface = self._neon_text_surface(text, font, rainbow_color(frame), PULSE_LEVELS - 1)
+        rect = self.screen.blit(surface, (x - GLOW_PAD, y - GLOW_PAD), special_flags=pygame.BLEND_PREMULTIPLIED)
+        self.dirty.mark(('rainbow_title', text, x, y), rect, frame)
 
-        color = rainbow_color()
-
-        for radius, base_a in [(4, 25), (2, 50)]:
-            gs = font.render(text, True, color)
-            gs.set_alpha(base_a)
-            for dx in range(-radius, radius + 1, max(1, radius // 2)):
-                for dy in range(-radius, radius + 1, max(1, radius // 2)):
-                    if dx != 0 or dy != 0:
-                        self.screen.blit(gs, (x + dx, y + dy))
-
-        ec = tuple(min(255, c + 100) for c in color)
-        es = font.render(text, True, ec)
-        es.set_alpha(180)
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            self.screen.blit(es, (x + dx, y + dy))
-
-        s = font.render(text, True, color)
-        self.screen.blit(s, (x, y))
+    def _neon_text_surface(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        color: Tuple[int, int, int],
+        level: int
+    ) -> pygame.Surface:
+        """获取（必要时合成）霓虹文字 Surface"""
+        return self.cache.get_or_create(
+            ('neon_text', text, font, color, level),
+            lambda: compose_neon_text(text, font, color, pulse_strength(level))
+        )
 
     # ==================== 屏幕渲染 ====================
 
@@ -473,4 +603,13 @@ class Renderer:
             self.screen.blit(best_text, ((self.config.screen_width - best_text.get_width()) // 2, self.config.screen_height * 2 // 3 + 35))
 
         text = self.fonts.tiny.render("按 R 重新开始", True, (150, 150, 180))
-        self.screen.blit(text, ((self.config.screen_width - text.get_width()) // 2, self.config.screen_height - 50))
\ No newline at end of file
+        self.screen.blit(text, ((self.config.screen_width - text.get_width()) // 2, self.config.screen_height - 50))
+
+    # ==================== 调试叠加层 ====================
+
+    def draw_profiler(self, profiler: FrameProfiler) -> None:
+        """绘制帧时间分析叠加层"""
+        if self._profiler_overlay is None:
+            self._profiler_overlay = ProfilerOverlay(self.fonts.tiny)
+        rect = self._profiler_overlay.draw(self.screen, profiler, self.time, self.config.frame_budget_ms)
+        self.dirty.mark(('profiler',), rect, self._profiler_overlay.version)
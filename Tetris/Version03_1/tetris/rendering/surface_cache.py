@@ -1,17 +1,41 @@
 """Surface缓存管理"""
 
 import pygame
-from typing import Tuple, Dict, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+Factory = Callable[[], pygame.Surface]
+
+# 各命名空间的默认容量（条目数），键为缓存键元组的第一个元素
+DEFAULT_BUDGETS: Dict[str, int] = {
+    'block': 200,
+    'glow': 200,
+    'text_glow': 100,
+    'neon_text': 512,
+    'trail': 256,
+    'particle_glow': 1024,
+    'particle_trail': 1024,
+}
 
 
 class SurfaceCache:
-    """Surface缓存管理器 - 优化渲染性能"""
+    """
+    Surface缓存管理器 - 优化渲染性能
+    按命名空间分别做 LRU 淘汰（每次只淘汰最久未用的一项），预热的条目固定常驻，不参与淘汰
+    """
 
     _instance: Optional['SurfaceCache'] = None
 
-    def __init__(self):
-        self._cache: Dict[Tuple, pygame.Surface] = {}
-        self._max_cache_size = 500
+    def __init__(self, budgets: Optional[Dict[str, int]] = None, default_budget: int = 500):
+        self._spaces: Dict[str, 'OrderedDict[Hashable, pygame.Surface]'] = {}
+        self._pinned: Dict[Hashable, pygame.Surface] = {}
+        self._budgets: Dict[str, int] = dict(DEFAULT_BUDGETS)
+        if budgets:
+            self._budgets.update(budgets)
+        self._default_budget = default_budget
+
+        # 统计 {命名空间: [命中, 未命中, 淘汰]}
+        self._counters: Dict[str, list] = {}
 
     @classmethod
     def get_instance(cls) -> 'SurfaceCache':
@@ -20,6 +44,70 @@ class SurfaceCache:
             cls._instance = cls()
         return cls._instance
 
+    @staticmethod
+    def namespace(key: Hashable) -> str:
+        """缓存键所属的命名空间"""
+        if isinstance(key, tuple) and key and isinstance(key[0], str):
+            return key[0]
+        return 'default'
+
+    def set_budget(self, namespace: str, max_entries: int) -> None:
+        """设置命名空间容量（超出的条目立即淘汰）"""
+        self._budgets[namespace] = max(1, max_entries)
+        space = self._spaces.get(namespace)
+        if space is not None:
+            self._evict(namespace, space)
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """查找缓存（命中时刷新为最近使用）"""
+        namespace = self.namespace(key)
+        counters = self._counters.setdefault(namespace, [0, 0, 0])
+        surf = self._pinned.get(key)
+        if surf is None:
+            space = self._spaces.get(namespace)
+            surf = space.get(key) if space is not None else None
+            if surf is not None:
+                space.move_to_end(key)
+        counters[0 if surf is not None else 1] += 1
+        return surf
+
+    def put(self, key: Hashable, surf: pygame.Surface) -> None:
+        """写入缓存，超出命名空间容量时淘汰最久未用的条目"""
+        if key in self._pinned:
+            self._pinned[key] = surf
+            return
+        namespace = self.namespace(key)
+        space = self._spaces.setdefault(namespace, OrderedDict())
+        space[key] = surf
+        space.move_to_end(key)
+        self._evict(namespace, space)
+
+    def get_or_create(self, key: Hashable, factory: Factory) -> pygame.Surface:
+        """获取缓存的 Surface，不存在时调用 factory 创建"""
+        surf = self.get(key)
+        if surf is None:
+            surf = factory()
+            self.put(key, surf)
+        return surf
+
+    def warm_up(self, entries: Iterable[Tuple[Hashable, Factory]], pin: bool = True) -> None:
+        """
+        预先创建常用条目（如标准尺寸的方块、粒子光晕）
+        pin=True 时条目常驻，不占命名空间容量也不会被淘汰
+        """
+        for key, factory in entries:
+            if key in self._pinned:
+                continue
+            namespace = self.namespace(key)
+            space = self._spaces.get(namespace)
+            surf = space.pop(key, None) if space is not None else None
+            if surf is None:
+                surf = factory()
+            if pin:
+                self._pinned[key] = surf
+            else:
+                self.put(key, surf)
+
     def get_block_surface(
         self,
         size: int,
@@ -28,12 +116,10 @@ class SurfaceCache:
         glow_size: int = 8
     ) -> pygame.Surface:
         """获取方块Surface（带光晕）"""
-        cache_key = ('block', size, color, alpha, glow_size)
-        if cache_key not in self._cache:
-            surf = self._create_block_surface(size, color, alpha, glow_size)
-            self._cache[cache_key] = surf
-            self._check_cache_size()
-        return self._cache[cache_key]
+        return self.get_or_create(
+            ('block', size, color, alpha, glow_size),
+            lambda: self._create_block_surface(size, color, alpha, glow_size)
+        )
 
     def get_glow_surface(
         self,
@@ -42,12 +128,10 @@ class SurfaceCache:
         alpha: int
     ) -> pygame.Surface:
         """获取光晕Surface"""
-        cache_key = ('glow', size, color, alpha)
-        if cache_key not in self._cache:
-            surf = self._create_glow_surface(size, color, alpha)
-            self._cache[cache_key] = surf
-            self._check_cache_size()
-        return self._cache[cache_key]
+        return self.get_or_create(
+            ('glow', size, color, alpha),
+            lambda: self._create_glow_surface(size, color, alpha)
+        )
 
     def get_text_glow_surface(
         self,
@@ -57,12 +141,10 @@ class SurfaceCache:
         glow_size: int
     ) -> pygame.Surface:
         """获取文字光晕Surface"""
-        cache_key = ('text_glow', text, id(font), color, glow_size)
-        if cache_key not in self._cache:
-            surf = self._create_text_glow_surface(text, font, color, glow_size)
-            self._cache[cache_key] = surf
-            self._check_cache_size()
-        return self._cache[cache_key]
+        return self.get_or_create(
+            ('text_glow', text, id(font), color, glow_size),
+            lambda: self._create_text_glow_surface(text, font, color, glow_size)
+        )
 
     def _create_block_surface(
         self,
@@ -137,36 +219,65 @@ class SurfaceCache:
         color: Tuple[int, int, int],
         glow_size: int
     ) -> pygame.Surface:
-        """创建文字光晕Surface"""
+        """创建文字光晕Surface（字形只渲染一次，按圆形偏移叠加）"""
         text_surf = font.render(text, True, color)
+        text_surf.set_alpha(30)
         total_width = text_surf.get_width() + glow_size * 4
         total_height = text_surf.get_height() + glow_size * 4
         surf = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
 
-        for dx in range(-glow_size, glow_size + 1):
-            for dy in range(-glow_size, glow_size + 1):
-                if dx * dx + dy * dy <= glow_size * glow_size:
-                    temp_surf = font.render(text, True, color)
-                    temp_surf.set_alpha(30)
-                    surf.blit(temp_surf, (glow_size * 2 + dx, glow_size * 2 + dy))
-
+        surf.blits([
+            (text_surf, (glow_size * 2 + dx, glow_size * 2 + dy))
+            for dx in range(-glow_size, glow_size + 1)
+            for dy in range(-glow_size, glow_size + 1)
+            if dx * dx + dy * dy <= glow_size * glow_size
+        ], doreturn=False)
         return surf
 
-    def _check_cache_size(self) -> None:
-        """检查缓存大小并清理"""
-        if len(self._cache) > self._max_cache_size:
-            # 删除一半的缓存
-            keys = list(self._cache.keys())[:self._max_cache_size // 2]
-            for key in keys:
-                del self._cache[key]
+    def _evict(self, namespace: str, space: 'OrderedDict[Hashable, pygame.Surface]') -> None:
+        """淘汰超出容量的最久未用条目"""
+        budget = self._budgets.get(namespace, self._default_budget)
+        counters = self._counters.setdefault(namespace, [0, 0, 0])
+        while len(space) > budget:
+            space.popitem(last=False)
+            counters[2] += 1
 
-    def clear(self) -> None:
-        """清除所有缓存"""
-        self._cache.clear()
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """清除缓存（指定命名空间时只清除该命名空间，包括预热的条目）"""
+        if namespace is None:
+            self._spaces.clear()
+            self._pinned.clear()
+            return
+        self._spaces.pop(namespace, None)
+        for key in [k for k in self._pinned if self.namespace(k) == namespace]:
+            del self._pinned[key]
 
     def get_stats(self) -> dict:
-        """获取缓存统计"""
+        """获取缓存统计（总体及各命名空间的条目数、字节数、命中/未命中/淘汰次数）"""
+        spaces = {}
+        for namespace in set(self._spaces) | set(self._counters) | {self.namespace(k) for k in self._pinned}:
+            entries = list(self._spaces.get(namespace, {}).values())
+            pinned = [surf for key, surf in self._pinned.items() if self.namespace(key) == namespace]
+            hits, misses, evictions = self._counters.get(namespace, [0, 0, 0])
+            spaces[namespace] = {
+                'size': len(entries),
+                'pinned': len(pinned),
+                'budget': self._budgets.get(namespace, self._default_budget),
+                'bytes': sum(_surface_bytes(surf) for surf in entries + pinned),
+                'hits': hits,
+                'misses': misses,
+                'evictions': evictions,
+            }
         return {
-            'cache_size': len(self._cache),
-            'max_size': self._max_cache_size,
-        }
\ No newline at end of file
+            'cache_size': sum(info['size'] + info['pinned'] for info in spaces.values()),
+            'bytes': sum(info['bytes'] for info in spaces.values()),
+            'hits': sum(info['hits'] for info in spaces.values()),
+            'misses': sum(info['misses'] for info in spaces.values()),
+            'evictions': sum(info['evictions'] for info in spaces.values()),
+            'namespaces': spaces,
+        }
+
+
+def _surface_bytes(surf: pygame.Surface) -> int:
+    """Surface 像素数据占用的字节数"""
+    return surf.get_pitch() * surf.get_height()
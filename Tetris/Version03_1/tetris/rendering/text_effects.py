@@ -0,0 +1,85 @@
+"""文字特效 - 霓虹光晕文字的合成与动画量化"""
+
+import math
+from typing import Tuple
+
+import pygame
+
+# 光晕外扩像素（最外圈偏移 4 像素）
+GLOW_PAD = 4
+
+# 脉冲亮度与彩虹色相的量化级数
+PULSE_LEVELS = 16
+PULSE_RANGE = (0.4, 1.0)   # 0.7 ± 0.3
+RAINBOW_FRAMES = 64
+
+Color = Tuple[int, int, int]
+
+
+def pulse_level(time: float) -> int:
+    """霓虹文字脉冲 0.7 + 0.3 * sin(3t) 的量化级别"""
+    value = 0.7 + 0.3 * math.sin(time * 3)
+    low, high = PULSE_RANGE
+    return min(PULSE_LEVELS - 1, max(0, int((value - low) / (high - low) * (PULSE_LEVELS - 1) + 0.5)))
+
+
+def pulse_strength(level: int) -> float:
+    """脉冲级别对应的亮度"""
+    low, high = PULSE_RANGE
+    return low + (high - low) * level / (PULSE_LEVELS - 1)
+
+
+def rainbow_frame(time: float) -> int:
+    """彩虹标题色相（周期 2π / 0.8 秒）的量化帧号"""
+    phase = (time * 0.8) % (math.pi * 2)
+    return int(phase / (math.pi * 2) * RAINBOW_FRAMES) % RAINBOW_FRAMES
+
+
+def rainbow_color(frame: int) -> Color:
+    """量化帧号对应的彩虹色"""
+    phase = frame * math.pi * 2 / RAINBOW_FRAMES
+    return (
+        int(127 + 127 * math.sin(phase)),
+        int(127 + 127 * math.sin(phase + 2.094)),
+        int(127 + 127 * math.sin(phase + 4.189)),
+    )
+
+
+def _tinted(glyph: pygame.Surface, color: Color, alpha: int) -> pygame.Surface:
+    """把白色字形染色并转为预乘 alpha，再乘以整体透明度"""
+    surface = glyph.copy()
+    surface.fill((*color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    surface = surface.premul_alpha()
+    if alpha < 255:
+        surface.fill((alpha, alpha, alpha, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return surface
+
+
+def compose_neon_text(text: str, font: pygame.font.Font, color: Color, strength: float = 1.0) -> pygame.Surface:
+    """
+    合成霓虹文字（两圈光晕 + 四向高光描边 + 主体），返回预乘 alpha 的 Surface，
+    文字位于 (GLOW_PAD, GLOW_PAD)，需以 BLEND_PREMULTIPLIED 绘制。
+    字形只渲染一次，光晕由同一字形按偏移叠加（膨胀）得到
+    """
+    # 字体 Surface 的行带填充，premul_alpha 会错位，先复制成紧凑格式
+    glyph = font.render(text, True, (255, 255, 255)).copy()
+    width, height = glyph.get_size()
+    surface = pygame.Surface((width + GLOW_PAD * 2, height + GLOW_PAD * 2), pygame.SRCALPHA)
+    surface.fill((0, 0, 0, 0))
+
+    blits = []
+    for radius, base_a in [(4, 25), (2, 50)]:
+        layer = _tinted(glyph, color, int(base_a * strength))
+        step = max(1, radius // 2)
+        for dx in range(-radius, radius + 1, step):
+            for dy in range(-radius, radius + 1, step):
+                if dx != 0 or dy != 0:
+                    blits.append((layer, (GLOW_PAD + dx, GLOW_PAD + dy), None, pygame.BLEND_PREMULTIPLIED))
+
+    edge = _tinted(glyph, tuple(min(255, c + 100) for c in color), int(180 * strength))
+    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        blits.append((edge, (GLOW_PAD + dx, GLOW_PAD + dy), None, pygame.BLEND_PREMULTIPLIED))
+
+    blits.append((_tinted(glyph, color, 255), (GLOW_PAD, GLOW_PAD), None, pygame.BLEND_PREMULTIPLIED))
+    surface.blits(blits, doreturn=False)
+    return surface
@@ -0,0 +1,7 @@
+"""回放模块 - 输入日志录制与重演"""
+
+from .replay_format import Replay
+from .recorder import ReplayRecorder
+from .replay_player import ReplayPlayer
+
+__all__ = ['Replay', 'ReplayRecorder', 'ReplayPlayer']
@@ -0,0 +1,103 @@
+"""回放录制器"""
+
+from typing import Callable, List, Optional, Tuple
+
+from ..core import Action, GameEngine
+from .replay_format import Replay
+
+# 输入回调名 -> 操作
+_INPUT_ACTIONS: List[Tuple[str, Action]] = [
+    ('on_move_left', Action.LEFT),
+    ('on_move_right', Action.RIGHT),
+    ('on_move_down', Action.DOWN),
+    ('on_rotate', Action.ROTATE),
+    ('on_hard_drop', Action.HARD_DROP),
+]
+
+
+class ReplayRecorder:
+    """回放录制器 - 挂接 InputHandler 回调与引擎重力事件，记录 (帧, 操作)"""
+
+    def __init__(self, engine: GameEngine, input_handler=None):
+        self.engine = engine
+        self.input_handler = input_handler
+        self.replay: Optional[Replay] = None
+        self.finished: List[Replay] = []  # 已结束的回放（每次重开一局产生一个）
+        self._original_callbacks = {}
+        self.recording = False
+
+    def start(self) -> None:
+        """开始录制（挂接回调，从当前局开始）"""
+        if self.recording:
+            return
+        self.recording = True
+        self._begin_replay()
+        self.engine.events.gravity_applied.subscribe(self._on_gravity)
+        self.engine.events.game_reset.subscribe(self._on_game_reset)
+        self.engine.events.score_changed.subscribe(self._on_score_changed)
+        if self.input_handler:
+            for name, action in _INPUT_ACTIONS:
+                callback = getattr(self.input_handler, name)
+                self._original_callbacks[name] = callback
+                setattr(self.input_handler, name, self._wrap(callback, action))
+
+    def stop(self) -> Optional[Replay]:
+        """停止录制，返回当前局的回放"""
+        if not self.recording:
+            return self.replay
+        self.recording = False
+        self.engine.events.gravity_applied.unsubscribe(self._on_gravity)
+        self.engine.events.game_reset.unsubscribe(self._on_game_reset)
+        self.engine.events.score_changed.unsubscribe(self._on_score_changed)
+        if self.input_handler:
+            for name, callback in self._original_callbacks.items():
+                setattr(self.input_handler, name, callback)
+            self._original_callbacks.clear()
+        self._finalize()
+        return self.replay
+
+    def record(self, action: Action) -> None:
+        """记录一个操作（帧号取自引擎）"""
+        if self.replay is not None:
+            self.replay.events.append((self.engine.frame, action))
+
+    def _begin_replay(self) -> None:
+        """以引擎当前种子开始新回放"""
+        config = self.engine.config
+        self.replay = Replay(
+            seed=self.engine.seed,
+            randomizer=config.randomizer,
+            width=self.engine.board.width,
+            height=self.engine.board.height,
+            frame_rate=config.frame_rate,
+        )
+
+    def _finalize(self) -> None:
+        """写入最终成绩"""
+        if self.replay is not None:
+            self.replay.final_score = self.engine.scoring.score
+            self.replay.final_lines = self.engine.scoring.lines
+
+    def _wrap(self, callback: Optional[Callable], action: Action) -> Callable:
+        """包装输入回调：先记录再执行"""
+        def wrapped(*args, **kwargs):
+            self.record(action)
+            if callback:
+                return callback(*args, **kwargs)
+            return None
+        return wrapped
+
+    def _on_gravity(self) -> None:
+        self.record(Action.GRAVITY)
+
+    def _on_score_changed(self, score: int, lines: int) -> None:
+        """同步最终成绩（重开时引擎计分已清零，需提前记录）"""
+        if self.replay is not None:
+            self.replay.final_score = score
+            self.replay.final_lines = lines
+
+    def _on_game_reset(self, seed: int) -> None:
+        """重开一局：上一局归档，新局重新开始录制"""
+        if self.replay is not None and self.replay.events:
+            self.finished.append(self.replay)
+        self._begin_replay()
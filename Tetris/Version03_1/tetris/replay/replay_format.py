@@ -0,0 +1,154 @@
+"""回放文件格式 - 紧凑的二进制输入日志
+
+布局（小端）:
+    头部: 魔数 b'TRPL' | 版本 | 标志 | 种子（64 位）| 随机器编码 | 初始宽度 | 高度 | 帧率
+          | 事件数 | 最终消行 | 最终得分（变长整数，分数按等级指数增长，可超出 64 位）
+    事件: 每个事件一个变长整数 (帧增量 << 3) | 操作码，同帧连续操作只占1字节
+标志位 0 表示事件区经过 zlib 压缩。
+"""
+
+from typing import List, Optional, Tuple
+import struct
+import zlib
+
+from ..core import Action, normalize_seed
+
+MAGIC = b'TRPL'
+VERSION = 3
+FLAG_ZLIB = 0x01
+
+# 随机器编码（顺序固定，只能在末尾追加）
+RANDOMIZER_CODES = ['random', 'bag7', 'bag14', 'history']
+
+# 版本 3 起最终得分移出定长头部改为变长整数；版本 2 起种子为 64 位（与 normalize_seed 的范围一致），版本 1 为 32 位
+_HEADER = struct.Struct('<4sBBQBBBBII')
+_HEADER_V2 = struct.Struct('<4sBBQBBBBIQI')
+_HEADER_V1 = struct.Struct('<4sBBIBBBBIQI')
+_ACTION_BITS = 3
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """写入无符号变长整数（LEB128）"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """读取无符号变长整数，返回 (值, 新位置)"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """一局游戏的回放数据（种子 + 按帧排列的操作）"""
+
+    def __init__(
+        self,
+        seed: int,
+        randomizer: str = 'random',
+        width: int = 10,
+        height: int = 20,
+        frame_rate: int = 60,
+        events: Optional[List[Tuple[int, Action]]] = None,
+        final_score: int = 0,
+        final_lines: int = 0
+    ):
+        self.seed = seed
+        self.randomizer = randomizer
+        self.width = width
+        self.height = height
+        self.frame_rate = frame_rate
+        self.events: List[Tuple[int, Action]] = events if events is not None else []
+        self.final_score = final_score
+        self.final_lines = final_lines
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def get_duration_frames(self) -> int:
+        """回放总帧数"""
+        return self.events[-1][0] if self.events else 0
+
+    def to_bytes(self, compress: bool = True) -> bytes:
+        """编码为二进制"""
+        body = bytearray()
+        last_frame = 0
+        for frame, action in self.events:
+            _write_varint(body, ((frame - last_frame) << _ACTION_BITS) | int(action))
+            last_frame = frame
+
+        flags = 0
+        payload = bytes(body)
+        if compress:
+            compressed = zlib.compress(payload, 9)
+            if len(compressed) < len(payload):
+                payload = compressed
+                flags |= FLAG_ZLIB
+
+        header = bytearray(_HEADER.pack(
+            MAGIC, VERSION, flags, normalize_seed(self.seed),
+            RANDOMIZER_CODES.index(self.randomizer) if self.randomizer in RANDOMIZER_CODES else 0,
+            self.width, self.height, self.frame_rate,
+            len(self.events), self.final_lines,
+        ))
+        _write_varint(header, self.final_score)
+        return bytes(header) + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        """从二进制解码"""
+        if data[:4] != MAGIC:
+            raise ValueError("不是有效的回放文件")
+        version = data[4]
+        if version > VERSION:
+            raise ValueError(f"不支持的回放版本: {version}")
+
+        if version >= 3:
+            (
+                _, _, flags, seed, randomizer_code, width, height,
+                frame_rate, event_count, final_lines
+            ) = _HEADER.unpack_from(data, 0)
+            final_score, pos = _read_varint(data, _HEADER.size)
+        else:
+            header = _HEADER_V1 if version == 1 else _HEADER_V2
+            (
+                _, _, flags, seed, randomizer_code, width, height,
+                frame_rate, event_count, final_score, final_lines
+            ) = header.unpack_from(data, 0)
+            pos = header.size
+
+        payload = data[pos:]
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+
+        events: List[Tuple[int, Action]] = []
+        mask = (1 << _ACTION_BITS) - 1
+        frame = 0
+        pos = 0
+        for _ in range(event_count):
+            value, pos = _read_varint(payload, pos)
+            frame += value >> _ACTION_BITS
+            events.append((frame, Action(value & mask)))
+
+        randomizer = RANDOMIZER_CODES[randomizer_code] if randomizer_code < len(RANDOMIZER_CODES) else 'random'
+        return cls(seed, randomizer, width, height, frame_rate, events, final_score, final_lines)
+
+    def save(self, filepath: str, compress: bool = True) -> None:
+        """保存到文件"""
+        with open(filepath, 'wb') as f:
+            f.write(self.to_bytes(compress))
+
+    @classmethod
+    def load(cls, filepath: str) -> 'Replay':
+        """从文件加载"""
+        with open(filepath, 'rb') as f:
+            return cls.from_bytes(f.read())
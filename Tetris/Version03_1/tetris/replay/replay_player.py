@@ -0,0 +1,113 @@
+"""回放播放器"""
+
+from ..config import GameConfig
+from ..core import GameEngine
+from .replay_format import Replay
+
+
+class ReplayPlayer:
+    """回放播放器 - 默认无头全速重演，可选通过 Renderer 按倍速渲染"""
+
+    def __init__(self, replay: Replay, board_engine: str = 'bitboard'):
+        self.replay = replay
+        self.board_engine = board_engine
+
+    def _create_engine(self, headless: bool) -> GameEngine:
+        """按回放参数创建引擎（棋盘尺寸取自录制时的初始宽度和高度）"""
+        config = GameConfig(
+            grid_width=self.replay.width,
+            grid_height=self.replay.height,
+            board_engine=self.board_engine,
+            frame_rate=self.replay.frame_rate,
+            randomizer=self.replay.randomizer,
+            seed=self.replay.seed,
+        )
+        # 重置时棋盘恢复到 initial_width，需与录制时一致
+        config.initial_width = self.replay.width
+        return GameEngine(config, headless=headless)
+
+    def run(self) -> GameEngine:
+        """无头全速重演，返回结束时的引擎"""
+        engine = self._create_engine(headless=True)
+        for frame, action in self.replay.events:
+            engine.frame = frame
+            engine.apply_action(action)
+        return engine
+
+    def verify(self) -> bool:
+        """重演并校验最终成绩"""
+        engine = self.run()
+        return (
+            engine.scoring.score == self.replay.final_score
+            and engine.scoring.lines == self.replay.final_lines
+        )
+
+    def play(self, speed: float = 1.0) -> GameEngine:
+        """
+        打开窗口按倍速渲染回放（1×/2×/8×）
+        关闭窗口或按 ESC 结束，返回结束时的引擎
+        """
+        import pygame
+        from ..rendering import Renderer
+
+        pygame.init()
+        engine = self._create_engine(headless=False)
+        config = engine.config
+        screen = pygame.display.set_mode((config.screen_width, config.screen_height))
+        pygame.display.set_caption(f"Tetris - Replay {speed:g}x")
+        renderer = Renderer(screen, config)
+        renderer.attach_engine(engine)
+        clock = pygame.time.Clock()
+
+        events = self.replay.events
+        index = 0
+        replay_frame = 0.0
+        screen_width = config.screen_width
+        running = True
+
+        while running and index < len(events):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    running = False
+
+            # 推进回放帧并执行到期的操作
+            replay_frame += speed
+            while index < len(events) and events[index][0] <= replay_frame:
+                engine.apply_action(events[index][1])
+                index += 1
+            engine.frame = int(replay_frame)
+            engine.update_effects()
+
+            # 升级扩宽后调整窗口
+            if config.screen_width != screen_width:
+                screen_width = config.screen_width
+                screen = pygame.display.set_mode((config.screen_width, config.screen_height))
+                renderer.screen = screen
+                renderer.update_config(config)
+
+            dt = 1.0 / self.replay.frame_rate
+            renderer.update(dt)
+            renderer.draw_background()
+            renderer.draw_grid(engine.board)
+            renderer.draw_board(engine.board)
+            if engine.current_piece:
+                renderer.draw_piece(
+                    engine.current_piece,
+                    ghost_positions=engine.get_ghost_position(),
+                    board=engine.board
+                )
+            renderer.draw_next_piece(engine.next_piece, upcoming=engine.next_queue[1:])
+            renderer.draw_trails(engine.trail_positions)
+            renderer.draw_divider()
+            renderer.draw_panel(
+                self.replay.final_score,
+                engine.scoring.score,
+                engine.scoring.lines,
+                engine.scoring.level,
+                engine.level_up_effect
+            )
+            renderer.present()
+            clock.tick(self.replay.frame_rate)
+
+        pygame.quit()
+        return engine
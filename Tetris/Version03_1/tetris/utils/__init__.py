@@ -6,10 +6,12 @@ from .resource_path import (
     load_json_data,
     save_json_data,
 )
+from .profiler import FrameProfiler
 
 __all__ = [
     'get_resource_path',
     'get_data_path',
     'load_json_data',
     'save_json_data',
+    'FrameProfiler',
 ]
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""帧时间分析器 - 按名称统计各子系统每帧耗时，滚动计算百分位数，可导出 CSV/JSON"""
+
+import csv
+import json
+import math
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+# 停用时 scope() 返回的空上下文（可重复使用）
+_NULL_SCOPE = nullcontext()
+
+FRAME = 'frame'  # 整帧耗时的统计名
+
+
+class _Scope:
+    """计时上下文：退出时把耗时累加到本帧"""
+
+    __slots__ = ('_profiler', '_name', '_start')
+
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self._profiler.add(self._name, time.perf_counter() - self._start)
+
+
+class FrameProfiler:
+    """
+    帧时间分析器
+    同一帧内同名计时累加，end_frame() 时记入最近 window 帧的滚动窗口（百分位数）和整局统计（次数、总计、最大）；
+    instrument() 登记的方法只在启用期间以实例属性替换为计时包装，停用时移除，停用状态下没有额外开销
+    """
+
+    def __init__(self, window: int = 600, enabled: bool = False):
+        self.window = window
+        self.enabled = False
+        self.frames = 0
+        self.started = time.time()
+
+        self._samples: Dict[str, Deque[float]] = {}
+        self._session: Dict[str, List[float]] = {}  # {名称: [次数, 总计, 最大]}（毫秒）
+        self._current: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        self._targets: List[Tuple[Any, Dict[str, str]]] = []
+
+        self.set_enabled(enabled)
+
+    # ==================== 开关 ====================
+
+    def set_enabled(self, enabled: bool) -> None:
+        """启用/停用（同时安装或移除方法计时包装）"""
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        self._current.clear()
+        self._frame_start = None
+        for obj, names in self._targets:
+            if enabled:
+                self._wrap(obj, names)
+            else:
+                self._unwrap(obj, names)
+
+    def toggle(self) -> bool:
+        """切换启用状态，返回切换后的状态"""
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def instrument(self, obj: Any, names: Union[Iterable[str], Mapping[str, str]], prefix: str = '') -> None:
+        """
+        登记要计时的方法：names 为方法名列表（统计名为 prefix + 方法名）或 {方法名: 统计名}
+        计时包含方法内部调用的其他已计时方法
+        """
+        if isinstance(names, Mapping):
+            mapping = dict(names)
+        else:
+            mapping = {name: prefix + name for name in names}
+        self._targets.append((obj, mapping))
+        if self.enabled:
+            self._wrap(obj, mapping)
+
+    def _wrap(self, obj: Any, names: Dict[str, str]) -> None:
+        for attr, name in names.items():
+            setattr(obj, attr, self._timed(name, getattr(obj, attr)))
+
+    @staticmethod
+    def _unwrap(obj: Any, names: Dict[str, str]) -> None:
+        for attr in names:
+            obj.__dict__.pop(attr, None)
+
+    def _timed(self, name: str, method: Callable) -> Callable:
+        add = self.add
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                add(name, clock() - start)
+        return timed
+
+    # ==================== 计时 ====================
+
+    def scope(self, name: str):
+        """计时上下文：with profiler.scope('input'): ...（停用时为空操作）"""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def add(self, name: str, seconds: float) -> None:
+        """把一次耗时（秒）累加到本帧"""
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def begin_frame(self) -> None:
+        """开始一帧"""
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """结束一帧：本帧各项耗时记入统计"""
+        if not self.enabled:
+            return
+        if self._frame_start is not None:
+            self._current[FRAME] = time.perf_counter() - self._frame_start
+            self._frame_start = None
+        for name, seconds in self._current.items():
+            ms = seconds * 1000
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+                self._session[name] = [0, 0.0, 0.0]
+            samples.append(ms)
+            session = self._session[name]
+            session[0] += 1
+            session[1] += ms
+            if ms > session[2]:
+                session[2] = ms
+        self._current.clear()
+        self.frames += 1
+
+    def reset(self) -> None:
+        """清空所有统计（开始新的一局）"""
+        self._samples.clear()
+        self._session.clear()
+        self._current.clear()
+        self._frame_start = None
+        self.frames = 0
+        self.started = time.time()
+
+    # ==================== 统计与导出 ====================
+
+    @staticmethod
+    def _percentile(ordered: List[float], q: float) -> float:
+        """最近秩法百分位数"""
+        if not ordered:
+            return 0.0
+        rank = math.ceil(q / 100 * len(ordered))
+        return ordered[min(len(ordered), max(1, rank)) - 1]
+
+    def percentiles(self, name: str, qs: Tuple[float, ...] = (50, 95, 99)) -> Tuple[float, ...]:
+        """最近 window 帧中该项的百分位数（毫秒）"""
+        ordered = sorted(self._samples.get(name, ()))
+        return tuple(self._percentile(ordered, q) for q in qs)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """各项统计（毫秒），按滚动窗口 p95 从大到小排列"""
+        result = {}
+        for name, samples in self._samples.items():
+            count, total, peak = self._session[name]
+            p50, p95, p99 = self.percentiles(name)
+            result[name] = {
+                'frames': count,
+                'total_ms': total,
+                'mean_ms': total / count if count else 0.0,
+                'max_ms': peak,
+                'p50_ms': p50,
+                'p95_ms': p95,
+                'p99_ms': p99,
+            }
+        return dict(sorted(result.items(), key=lambda item: item[1]['p95_ms'], reverse=True))
+
+    def export_json(self, path: str) -> None:
+        """导出本局统计为 JSON"""
+        data = {
+            'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+            'duration_s': time.time() - self.started,
+            'frames': self.frames,
+            'window': self.window,
+            'scopes': self.summary(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def export_csv(self, path: str) -> None:
+        """导出本局统计为 CSV（每项一行）"""
+        fields = ['frames', 'total_ms', 'mean_ms', 'max_ms', 'p50_ms', 'p95_ms', 'p99_ms']
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['scope'] + fields)
+            for name, stats in self.summary().items():
+                writer.writerow([name] + [round(stats[field], 4) for field in fields])